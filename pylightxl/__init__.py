@@ -1 +1 @@
-from .pylightxl import readxl, readcsv, writexl, writecsv, Database
+from .pylightxl import readxl, reloadxl, readxl_rowindex, readxl_rows, readcsv, writexl, writecsv, Database, ByteSource, FileByteSource
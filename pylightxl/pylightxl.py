@@ -66,47 +66,143 @@ import os
 import sys
 import shutil
 import warnings
+import zlib
+import struct
+import json
+import bisect
+import collections
+import operator
+import threading
 from xml.etree import cElementTree as ET
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date, time as datetime_time
+from array import array
 
 EXCEL_STARTDATE = datetime(1899,12,30)
+# cellXfs index of the date/time cell styles in xl/styles.xml written by writexl, see writexl_new_styles_text
+WRITEXL_DATETIME_STYLES = {'datetime': 1, 'date': 2, 'time': 3}
 MAX_XL_ROWS = 1048576
 MAX_XL_COLS = 16384
+# excel column letters by column number (index 0 is unused) and column numbers by letters, see utility_num2columnletters
+XL_COLUMN_LETTERS = [''] + [chr(65 + i) for i in range(26)]
+XL_COLUMN_LETTERS += [a + b for a in XL_COLUMN_LETTERS[1:27] for b in XL_COLUMN_LETTERS[1:27]]
+XL_COLUMN_LETTERS += [a + b + c for a in XL_COLUMN_LETTERS[1:27] for b in XL_COLUMN_LETTERS[1:27]
+                      for c in XL_COLUMN_LETTERS[1:27]][:MAX_XL_COLS - 702]
+XL_COLUMN_NUMBERS = dict((letters, num) for num, letters in enumerate(XL_COLUMN_LETTERS) if num)
+# excel address (ex: A1), see utility_address2index
+XL_ADDRESS = re.compile(r'([A-Za-z]{1,3})([1-9][0-9]{0,6})$')
+# largest int a float holds exactly, see TypedColumn
+MAX_FLOAT_INT = 2 ** 53
+# comparisons of Worksheet.where, see Query
+QUERY_OPS = {'==': operator.eq, '!=': operator.ne, '>': operator.gt, '>=': operator.ge, '<': operator.lt,
+             '<=': operator.le, 'in': lambda val, values: val in values}
+# deflated zip parts of at least this compressed size are inflated in a background thread, see PipelinedReader
+PIPELINE_MIN_SIZE = 1048576
+# <row>, <sheetData> and </sheetData> tags (with any namespace prefix) of a worksheet xml, see readxl_rowindex
+XML_ROW_TAG = re.compile(b'<(/?)((?:[A-Za-z_][\\w.-]*:)?(?:row|sheetData))\\b([^>]*)>')
+XML_ROW_R = re.compile(b'(?:^|\\s)r="(\\d+)"')
+# BIFF12 (xlsb) record types
+XLSB_ROWHDR = 0
+XLSB_CELLRK = 2
+XLSB_CELLBOOL = 4
+XLSB_CELLREAL = 5
+XLSB_CELLISST = 7
+XLSB_SSTITEM = 19
+XLSB_NAME = 39
+XLSB_FONT = 43
+XLSB_FMT = 44
+XLSB_FILL = 45
+XLSB_BORDER = 46
+XLSB_XF = 47
+XLSB_STYLE = 48
+XLSB_BEGINSHEET = 129
+XLSB_ENDSHEET = 130
+XLSB_BEGINBOOK = 131
+XLSB_ENDBOOK = 132
+XLSB_BEGINBUNDLESHS = 143
+XLSB_ENDBUNDLESHS = 144
+XLSB_BEGINSHEETDATA = 145
+XLSB_ENDSHEETDATA = 146
+XLSB_WSDIM = 148
+XLSB_WBPROP = 153
+XLSB_BUNDLESH = 156
+XLSB_BEGINSST = 159
+XLSB_ENDSST = 160
+XLSB_BEGINSTYLESHEET = 278
+XLSB_ENDSTYLESHEET = 279
+XLSB_BEGINEXTERNALS = 353
+XLSB_ENDEXTERNALS = 354
+XLSB_SUPSELF = 357
+XLSB_EXTERNSHEET = 362
+XLSB_BEGINFILLS = 603
+XLSB_ENDFILLS = 604
+XLSB_BEGINFONTS = 611
+XLSB_ENDFONTS = 612
+XLSB_BEGINBORDERS = 613
+XLSB_ENDBORDERS = 614
+XLSB_BEGINCELLXFS = 617
+XLSB_ENDCELLXFS = 618
+XLSB_BEGINSTYLES = 619
+XLSB_ENDSTYLES = 620
+XLSB_BEGINCELLSTYLEXFS = 626
+XLSB_ENDCELLSTYLEXFS = 627
+XLSB_BEGINCOMMENT = 635
+XLSB_COMMENTTEXT = 637
+# BIFF12 cell record types: (value type, short cell record without column)
+XLSB_CELLS = {1: ('blank', False), 2: ('rk', False), 3: ('error', False), 4: ('bool', False),
+              5: ('real', False), 6: ('str', False), 7: ('isst', False), 8: ('str', False), 9: ('real', False),
+              10: ('bool', False), 11: ('error', False), 12: ('blank', True), 13: ('rk', True),
+              14: ('error', True), 15: ('bool', True), 16: ('real', True), 17: ('str', True), 18: ('isst', True),
+              62: ('rstr', False)}
+XLSB_ERRORS = {0x00: '#NULL!', 0x07: '#DIV/0!', 0x0F: '#VALUE!', 0x17: '#REF!', 0x1D: '#NAME?', 0x24: '#NUM!',
+               0x2A: '#N/A', 0x2B: '#GETTING_DATA'}
 
 ########################################################################################################
 # SEC-02: PYTHON2 COMPATIBILITY
 ########################################################################################################
 
 
-# unicode is a python27 object that was merged into str in 3+, for compatibility it is redefined here
+# unicode/long are python27 objects that were merged into str/int in 3+, for compatibility they are redefined here
 if sys.version_info[0] < 3:
     FileNotFoundError = IOError
     PermissionError = Exception
     WindowsError = Exception
     FileExistsError = Exception
     import cgi as html
+    import Queue as queue
+    # array typecode of the widest int, python 2 has no 'q' and 'l' is only 32 bit on windows
+    ARRAY_INT = 'l'
     PYVER = 2
 else:
     unicode = str
+    long = int
     WindowsError = Exception
-    import html, pathlib, io
-    from typing import Union, List, Dict, Iterable
+    import html, pathlib, io, queue
+    from typing import Union, List, Dict, Iterable, Callable, Tuple, Any
+    ARRAY_INT = 'q'
     PYVER = 3
+# largest int an ARRAY_INT array holds
+ARRAY_INT_MAX = 2 ** (8 * array(ARRAY_INT).itemsize - 1) - 1
 
 ########################################################################################################
 # SEC-03: READXL FUNCTIONS
 ########################################################################################################
 
-def readxl(fn, ws=None):
-    # type: (Union[str, pathlib.Path], Union[str,List[str]]) -> Database
-    """Reads an xlsx or xlsm file and returns a pylightxl database
+def readxl(fn, ws=None, datetimes='str', columnar=False):
+    # type: (Union[str, pathlib.Path], Union[str,List[str]], str, bool) -> Database
+    """Reads an xlsx, xlsm or xlsb file and returns a pylightxl database
 
-    :param fn: Excel file path, also supports Pathlib.Path object, as well as file-like object from with/open
-    :type fn: Union[str, pathlib.Path]
+    :param fn: Excel file path, also supports Pathlib.Path object, file-like object from with/open,
+               as well as a ByteSource to only fetch the parts of the file that are read
+    :type fn: Union[str, pathlib.Path, ByteSource]
     :param ws: sheetnames to read into the database, if not specified - all sheets are read
                 entry support single ws name (ex: ws='sh1') or multi (ex: ws=['sh1', 'sh2']), defaults to None
     :type ws: Union[str,List[str]], optional
+    :param datetimes: "str" returns date/time cells as strings (ex: "2021/04/10"), "native" returns
+                      datetime.date, datetime.time and datetime.datetime objects, defaults to 'str'
+    :type datetimes: str, optional
+    :param columnar: store worksheets in typed columns (see ColumnarWorksheet), defaults to False
+    :type columnar: bool, optional
     :return: pylightxl Database 
     :rtype: Database
     """
@@ -114,27 +210,79 @@ def readxl(fn, ws=None):
     if type(ws) is str:
         ws = (ws,)
 
-    # declare a db
-    db = Database()
+    if datetimes not in ['str', 'native']:
+        raise UserWarning('pylightxl - incorrect readxl(datetimes={}) argument. '
+                          'Valid options = "str", "native"'.format(datetimes))
+
+    fn = readxl_check_excelfile(fn)
+
+    db = readxl_scrape_workbook(fn, ws, datetimes, columnar=columnar)
+
+    if type(fn) is str and 'pylightxlIOtemp_wb' in fn:
+        os.remove(fn)
+
+    return db
+
+
+def reloadxl(fn, db):
+    # type: (Union[str, pathlib.Path], Database) -> Database
+    """Re-reads an xlsx, xlsm or xlsb file that was previously read into a pylightxl database. Only the worksheets
+    whose parts (sheet#.xml, its rels and comments) or sharedStrings/styles dependencies changed are scraped
+    again, unchanged Worksheet objects are reused from the previous database as-is.
+    Changes are detected with the CRC32 that the zip file stores for each part.
+
+    :param fn: Excel file path, also supports Pathlib.Path object, as well as file-like object from with/open
+    :type fn: Union[str, pathlib.Path]
+    :param db: database previously returned by readxl/reloadxl for this file
+    :type db: Database
+    :return: new pylightxl Database
+    :rtype: Database
+    """
+
+    if not db._source:
+        raise UserWarning('pylightxl - reloadxl requires a database that was read in by readxl.')
 
     fn = readxl_check_excelfile(fn)
 
+    new_db = readxl_scrape_workbook(fn, db._source['ws'], db._source['datetimes'], previous=db,
+                                    columnar=db._source['columnar'])
+
+    if type(fn) is str and 'pylightxlIOtemp_wb' in fn:
+        os.remove(fn)
+
+    return new_db
+
+
+def readxl_scrape_workbook(fn, ws=None, datetimes='str', previous=None, columnar=False):
+    # type: (str, tuple, str, Database, bool) -> Database
+    """Takes a checked excel file-path and scrapes its worksheets into a new pylightxl database. If a previous
+    database of the same file is passed, its worksheets are reused where none of their parts changed
+
+    :param fn: Excel file name
+    :type fn: str
+    :param ws: sheetnames to read into the database, if not specified - all sheets are read, defaults to None
+    :type ws: tuple, optional
+    :param datetimes: "str" or "native" date/time cell values, defaults to 'str'
+    :type datetimes: str, optional
+    :param previous: previously read database of fn, defaults to None
+    :type previous: Database, optional
+    :param columnar: store worksheets in typed columns (see ColumnarWorksheet), defaults to False
+    :type columnar: bool, optional
+    :return: pylightxl Database
+    :rtype: Database
+    """
+
+    # declare a db
+    db = Database()
+
     # {'ws': ws1: {'ws': str, 'rId': str, 'order': str, 'fn_ws': str}, ...
     #  'nr': {nr1: {'nr': str, 'ws': str, 'address': str}, ...}
     wb_rels = readxl_get_workbook(fn)
 
-    for nr_dict in wb_rels['nr'].values():
-        name = nr_dict['nr']
-        worksheet = nr_dict['ws']
-        address = nr_dict['address']
-        # note that nr adds the ws if they are not already in the wb, thus it needs to be filtered here if the user didnt want those sheets then the nr are also not loaded
-        if ws is None or worksheet in ws:
-            db.add_nr(name=name, ws=worksheet, address=address)
-
-    # get common string cell value table
-    sharedString = readxl_get_sharedStrings(fn)
     # get styles for datetime parsing
     styles = readxl_get_styles(fn)
+    # date/time decoders are built once per workbook so their serial value caches are shared between sheets
+    decoders = readxl_get_datetime_decoders(styles, datetimes)
 
     # put the ws in order
     ordered_ws = {}
@@ -142,47 +290,179 @@ def readxl(fn, ws=None):
         order = wb_rels['ws'][worksheet]['order']
         ordered_ws[order] = worksheet
 
-    # scrape each sheet#.xml file
-    if ws is None:
-        # get all worksheets
-        for order in sorted(ordered_ws.keys()):
-            worksheet = ordered_ws[order]
-            fn_ws = wb_rels['ws'][worksheet]['fn_ws']
-            comments = readxl_get_ws_rels(fn, fn_ws)
-            data = readxl_scrape(fn, fn_ws, sharedString, styles, comments)
-            db.add_ws(ws=worksheet, data=data)
-    else:
+    if ws is not None:
         # get only user specified worksheets
         # run through inputs and see if they are within the db read in
         for worksheet in ws:
             if worksheet not in wb_rels['ws'].keys():
                 raise UserWarning('pylightxl - Sheetname ({}) is not in the workbook.'.format(worksheet))
-        for order in sorted(ordered_ws.keys()):
-            worksheet = ordered_ws[order]
-            if worksheet in ws:
-                fn_ws = wb_rels['ws'][worksheet]['fn_ws']
-                comments = readxl_get_ws_rels(fn, fn_ws)
-                data = readxl_scrape(fn, fn_ws, sharedString, styles, comments)
-                db.add_ws(ws=worksheet, data=data)
-
-    if 'pylightxlIOtemp_wb' in fn:
-        os.remove(fn)
+    worksheets = [ordered_ws[order] for order in sorted(ordered_ws.keys())
+                  if ws is None or ordered_ws[order] in ws]
+
+    # zip part CRC32s to detect changes on reloadxl
+    crcs = readxl_get_crcs(fn)
+    db._source = {'ws': ws, 'datetimes': datetimes, 'columnar': columnar,
+                  'styles': crcs.get('xl/styles.xml', crcs.get('xl/styles.bin')),
+                  'sharedStrings': crcs.get('xl/sharedStrings.xml', crcs.get('xl/sharedStrings.bin')),
+                  'sst_crcs': None, 'sheets': {}}
+    fingerprints = {}
+    for worksheet in worksheets:
+        fingerprints[worksheet] = readxl_get_ws_fingerprint(fn, wb_rels['ws'][worksheet]['fn_ws'], crcs)
+
+    sharedString = None
+    reuse = []
+    if previous is not None and previous._source['styles'] == db._source['styles']:
+        reuse = [worksheet for worksheet in worksheets
+                 if worksheet in previous._source['sheets'] and worksheet in previous._ws and
+                 previous._source['sheets'][worksheet]['fingerprint'] == fingerprints[worksheet]]
+
+        if previous._source['sharedStrings'] == db._source['sharedStrings']:
+            db._source['sst_crcs'] = previous._source['sst_crcs']
+        elif reuse:
+            # sharedStrings changed, a worksheet can still be reused if all sharedStrings it references
+            #  (index <= its max_sst) are unchanged. Excel orders sharedStrings by first appearance,
+            #  therefore edits to later worksheets typically only change later indices
+            old_crcs = previous._source['sst_crcs']
+            first_change = sys.maxsize
+            if old_crcs is None:
+                # the previous read referenced no sharedStrings, none can be compared
+                first_change = 0
+            elif ws is None:
+                db._source['sst_crcs'] = array('L')
+                sharedString = readxl_get_sharedStrings(fn, crcs=db._source['sst_crcs'])
+            else:
+                # selected worksheets only decode the compared indices, see readxl_get_sharedStrings
+                last_sst = max([previous._source['sheets'][worksheet]['max_sst'] for worksheet in reuse])
+                indices = [i for i in (old_crcs if type(old_crcs) is dict else range(len(old_crcs)))
+                           if i <= last_sst]
+                db._source['sst_crcs'] = {}
+                readxl_get_sharedStrings(fn, indices, crcs=db._source['sst_crcs'])
+            if old_crcs is not None:
+                new_crcs = db._source['sst_crcs']
+                pairs = sorted(old_crcs.items()) if type(old_crcs) is dict else enumerate(old_crcs)
+                for i, crc in pairs:
+                    if (i not in new_crcs if type(new_crcs) is dict else i >= len(new_crcs)) or new_crcs[i] != crc:
+                        first_change = i
+                        break
+            reuse = [worksheet for worksheet in reuse
+                     if previous._source['sheets'][worksheet]['max_sst'] < first_change]
+
+    # scrape each sheet#.xml file
+    #   sharedStrings are resolved after scraping, when only selected worksheets are read only the
+    #   strings they reference are decoded since the sharedStrings.xml of a workbook is often shared with
+    #   much larger sibling sheets
+    sheets = []
+    for worksheet in worksheets:
+        if worksheet in reuse:
+            sheets.append([worksheet, previous.ws(worksheet), []])
+            db._source['sheets'][worksheet] = previous._source['sheets'][worksheet]
+            continue
+
+        if sharedString is None and ws is None:
+            # get common string cell value table
+            if db._source['sst_crcs'] is None:
+                db._source['sst_crcs'] = array('L')
+                sharedString = readxl_get_sharedStrings(fn, crcs=db._source['sst_crcs'])
+            else:
+                sharedString = readxl_get_sharedStrings(fn)
+
+        fn_ws = wb_rels['ws'][worksheet]['fn_ws']
+        comments = readxl_get_ws_rels(fn, fn_ws)
+        sst_refs = []
+        data = readxl_scrape(fn, fn_ws, None, styles, comments, decoders, sst_refs)
+        max_sst = max([data[address]['v'] for address in sst_refs]) if sst_refs else -1
+        db._source['sheets'][worksheet] = {'fingerprint': fingerprints[worksheet], 'max_sst': max_sst}
+        if sharedString is not None:
+            for address in sst_refs:
+                data[address]['v'] = sharedString[data[address]['v']]
+            sst_refs = []
+        sheets.append([worksheet, data, sst_refs])
+
+    indices = set(data[address]['v'] for _, data, sst_refs in sheets for address in sst_refs)
+    if indices:
+        sst_crcs = {}
+        sharedString = readxl_get_sharedStrings(fn, indices, crcs=sst_crcs)
+        if type(db._source['sst_crcs']) is dict:
+            # keep the crcs of strings referenced by reused worksheets
+            sst_crcs.update(db._source['sst_crcs'])
+        if type(db._source['sst_crcs']) is not array:
+            db._source['sst_crcs'] = sst_crcs
+
+    for worksheet, data, sst_refs in sheets:
+        if isinstance(data, Worksheet):
+            db.add_ws(ws=worksheet, data={})
+            db._ws[worksheet] = data
+            continue
+        for address in sst_refs:
+            data[address]['v'] = sharedString[data[address]['v']]
+        db.add_ws(ws=worksheet, data=data, columnar=columnar)
+
+    # named ranges are added after the worksheets so that the worksheet order follows the workbook
+    for nr_dict in wb_rels['nr'].values():
+        name = nr_dict['nr']
+        worksheet = nr_dict['ws']
+        address = nr_dict['address']
+        # note that nr adds the ws if they are not already in the wb, thus it needs to be filtered here if the user didnt want those sheets then the nr are also not loaded
+        if ws is None or worksheet in ws:
+            db.add_nr(name=name, ws=worksheet, address=address)
 
     return db
 
 
+def readxl_get_crcs(fn):
+    # type: (str) -> Dict[str, int]
+    """Takes an excel file-path and returns the CRC32 of each of its zip parts, the CRC32s are read from the zip
+    directory without decompressing any part
+
+    :param fn: Excel file name
+    :type fn: str
+    :return: {part name: crc32} (ex: {'xl/workbook.xml': 1234, ...})
+    :rtype: Dict[str, int]
+    """
+
+    with zipfile.ZipFile(fn, 'r') as f_zip:
+        return dict((info.filename, info.CRC) for info in f_zip.infolist())
+
+
+def readxl_get_ws_fingerprint(fn, fn_ws, crcs):
+    # type: (str, str, Dict[str, int]) -> tuple
+    """Takes a file-path for xl/worksheets/sheet#.xml and returns the CRC32s of the parts that make up the
+    worksheet data (sheet#.xml, its rels and comments) for change detection
+
+    :param fn: Excel file name
+    :type fn: str
+    :param fn_ws: file path for worksheet (ex: xl/worksheets/sheet1.xml)
+    :type fn_ws: str
+    :param crcs: zip part CRC32s from readxl_get_crcs
+    :type crcs: Dict[str, int]
+    :return: (fn_ws, sheet crc, rels crc, comments file name, comments crc)
+    :rtype: tuple
+    """
+
+    fn_ws_parts = fn_ws.split('/')
+    fn_wsrels = '/'.join(fn_ws_parts[:-1]) + '/_rels/' + fn_ws_parts[-1] + '.rels'
+    comment_fn = readxl_get_ws_comments_fn(fn, fn_ws)
+
+    return (fn_ws, crcs.get('xl/' + fn_ws), crcs.get('xl/' + fn_wsrels),
+            comment_fn, crcs.get('xl/' + comment_fn) if comment_fn else None)
+
+
 def readxl_check_excelfile(fn):
-    # type: (Union[str, pathlib.Path]) -> str
+    # type: (Union[str, pathlib.Path, ByteSource]) -> Union[str, ByteSourceFile]
     """Takes a file-path and raises error if the file is not found/unsupported.
 
-    :param fn: Excel file path, also supports Pathlib.Path object, as well as file-like object from with/open
-    :type fn: Union[str, pathlib.Path]
-    :return: filename
-    :rtype: str
+    :param fn: Excel file path, also supports Pathlib.Path object, file-like object from with/open,
+               as well as a ByteSource
+    :type fn: Union[str, pathlib.Path, ByteSource]
+    :return: filename, or a file-like object of the ByteSource
+    :rtype: Union[str, ByteSourceFile]
     """
 
+    # test for random access byte source, zipfile then only fetches the central directory and the parts it opens
+    if isinstance(fn, ByteSource):
+        return ByteSourceFile(fn)
     # test for pathlib
-    if 'pathlib' in str(type(fn)):
+    elif 'pathlib' in str(type(fn)):
         fn = str(fn)
     # test for django already downloaded file
     elif 'path' in dir(fn):
@@ -201,13 +481,278 @@ def readxl_check_excelfile(fn):
 
     extension = fn.split('.')[-1]
 
-    if extension.lower() not in ['xlsx', 'xlsm']:
+    if extension.lower() not in ['xlsx', 'xlsm', 'xlsb']:
         raise UserWarning('pylightxl - Incorrect Excel file extension ({}). '
-                         'File extension supported: .xlsx .xlsm'.format(extension))
+                         'File extension supported: .xlsx .xlsm .xlsb'.format(extension))
 
     return fn
 
 
+class ByteSource:
+
+    def __init__(self):
+        """Random access byte source of an excel file for readxl (ex: a file on a networked filesystem or in a blob
+        store). Subclasses implement size and read_at, see FileByteSource
+        """
+
+        pass
+
+    def __repr__(self):
+        return 'pylightxl.ByteSource'
+
+    def size(self):
+        # type: () -> int
+        """Returns the size of the file in bytes
+
+        :return: file size
+        :rtype: int
+        """
+
+        raise NotImplementedError('pylightxl - ByteSource.size is not implemented.')
+
+    def read_at(self, offset, length):
+        # type: (int, int) -> bytes
+        """Returns length bytes of the file starting at offset
+
+        :param offset: byte offset
+        :type offset: int
+        :param length: number of bytes
+        :type length: int
+        :return: bytes
+        :rtype: bytes
+        """
+
+        raise NotImplementedError('pylightxl - ByteSource.read_at is not implemented.')
+
+
+class FileByteSource(ByteSource):
+
+    def __init__(self, fn):
+        # type: (Union[str, pathlib.Path]) -> None
+        """ByteSource of a local file, every read_at opens the file so no file handle is held between reads
+
+        :param fn: file path
+        :type fn: Union[str, pathlib.Path]
+        """
+
+        ByteSource.__init__(self)
+        self.fn = str(fn)
+
+        if not os.path.isfile(self.fn):
+            raise UserWarning('pylightxl - File ({}) does not exist.'.format(self.fn))
+
+    def __repr__(self):
+        return 'pylightxl.FileByteSource'
+
+    def size(self):
+        # type: () -> int
+        return os.path.getsize(self.fn)
+
+    def read_at(self, offset, length):
+        # type: (int, int) -> bytes
+        with open(self.fn, 'rb') as f:
+            f.seek(offset)
+            return f.read(length)
+
+
+class ByteSourceFile:
+
+    def __init__(self, source, block_size=65536, cache_blocks=64):
+        # type: (ByteSource, int, int) -> None
+        """Read-only seekable file-like object of a ByteSource for zipfile. Reads are fetched in blocks, the most
+        recently used blocks are cached since zipfile re-reads the central directory every time it is opened
+
+        :param source: byte source
+        :type source: ByteSource
+        :param block_size: bytes per block, defaults to 65536
+        :type block_size: int, optional
+        :param cache_blocks: number of blocks cached, defaults to 64
+        :type cache_blocks: int, optional
+        """
+
+        self.source = source
+        self.block_size = block_size
+        self.cache_blocks = cache_blocks
+        self._size = source.size()
+        self._pos = 0
+        # {block index: bytes} in least to most recently used order
+        self._cache = collections.OrderedDict()
+
+    def __repr__(self):
+        return 'pylightxl.ByteSourceFile'
+
+    def seekable(self):
+        # type: () -> bool
+        return True
+
+    def tell(self):
+        # type: () -> int
+        return self._pos
+
+    def seek(self, offset, whence=0):
+        # type: (int, int) -> int
+        if whence == 1:
+            offset += self._pos
+        elif whence == 2:
+            offset += self._size
+        if offset < 0:
+            raise ValueError('pylightxl - negative seek position ({})'.format(offset))
+        self._pos = offset
+        return self._pos
+
+    def read(self, n=-1):
+        # type: (int) -> bytes
+        end = self._size if n is None or n < 0 else min(self._pos + n, self._size)
+        if end <= self._pos:
+            return b''
+
+        first = self._pos // self.block_size
+        last = (end - 1) // self.block_size
+
+        # fetch consecutive missing blocks with a single read_at
+        missing = [i for i in range(first, last + 1) if i not in self._cache]
+        while missing:
+            run = 1
+            while run < len(missing) and missing[run] == missing[0] + run:
+                run += 1
+            data = self.source.read_at(missing[0] * self.block_size, run * self.block_size)
+            for j in range(run):
+                self._cache[missing[j]] = data[j * self.block_size:(j + 1) * self.block_size]
+            missing = missing[run:]
+
+        blocks = []
+        for i in range(first, last + 1):
+            block = self._cache.pop(i)
+            # re-insert as most recently used
+            self._cache[i] = block
+            blocks.append(block)
+        while len(self._cache) > max(self.cache_blocks, last - first + 1):
+            self._cache.popitem(last=False)
+
+        start = self._pos - first * self.block_size
+        rv = b''.join(blocks)[start:start + end - self._pos]
+        self._pos = end
+        return rv
+
+    def close(self):
+        # type: () -> None
+        pass
+
+
+def readxl_open_part(f_zip, fn_part):
+    # type: (zipfile.ZipFile, str) -> Union[zipfile.ZipExtFile, PipelinedReader]
+    """Opens a zip part for reading. Large deflated parts are inflated in a background thread (zlib releases
+    the GIL) while the caller parses, see PipelinedReader
+
+    :param f_zip: opened excel zip file
+    :type f_zip: zipfile.ZipFile
+    :param fn_part: part file path (ex: xl/worksheets/sheet1.xml)
+    :type fn_part: str
+    :return: file-like object of the part
+    :rtype: Union[zipfile.ZipExtFile, PipelinedReader]
+    """
+
+    info = f_zip.getinfo(fn_part)
+    file = f_zip.open(fn_part, 'r')
+
+    if info.compress_type == zipfile.ZIP_DEFLATED and info.compress_size >= PIPELINE_MIN_SIZE:
+        return PipelinedReader(file)
+
+    return file
+
+
+class PipelinedReader:
+
+    def __init__(self, file, chunk_size=1048576, max_chunks=4):
+        # type: (zipfile.ZipExtFile, int, int) -> None
+        """Read-only file-like object of a zip part that is inflated by a background thread into a bounded queue
+        of chunks, so that inflating the next chunk overlaps with parsing the current one. The part is closed
+        with the reader
+
+        :param file: opened zip part
+        :type file: zipfile.ZipExtFile
+        :param chunk_size: bytes inflated per chunk, defaults to 1048576
+        :type chunk_size: int, optional
+        :param max_chunks: number of inflated chunks buffered ahead of the reader, defaults to 4
+        :type max_chunks: int, optional
+        """
+
+        self._file = file
+        self._queue = queue.Queue(max_chunks)
+        self._stop = threading.Event()
+        # current chunk and read position in it
+        self._chunk = b''
+        self._pos = 0
+        self._eof = False
+        self._thread = threading.Thread(target=self._inflate, args=(chunk_size,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def __repr__(self):
+        return 'pylightxl.PipelinedReader'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _inflate(self, chunk_size):
+        # type: (int) -> None
+        try:
+            while True:
+                chunk = self._file.read(chunk_size)
+                if not self._put(chunk) or not chunk:
+                    return
+        except Exception as e:
+            # errors (ex: bad CRC) are raised to the reader
+            self._put(e)
+
+    def _put(self, item):
+        # type: (Union[bytes, Exception]) -> bool
+        # waits while the queue is full, gives up once the reader is closed
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def read(self, n=-1):
+        # type: (int) -> bytes
+        parts = []
+        remaining = -1 if n is None or n < 0 else n
+        while remaining != 0:
+            if self._pos == len(self._chunk):
+                if self._eof:
+                    break
+                item = self._queue.get()
+                if isinstance(item, Exception):
+                    self._eof = True
+                    raise item
+                if not item:
+                    self._eof = True
+                    break
+                self._chunk = item
+                self._pos = 0
+            if remaining < 0:
+                part = self._chunk[self._pos:]
+            else:
+                part = self._chunk[self._pos:self._pos + remaining]
+                remaining -= len(part)
+            self._pos += len(part)
+            parts.append(part)
+
+        return b''.join(parts)
+
+    def close(self):
+        # type: () -> None
+        self._stop.set()
+        self._thread.join()
+        self._file.close()
+
+
 def readxl_get_workbook(fn):
     # type: (str) -> Dict[str, dict]
     """Takes a file-path for xl/workbook.xml and returns a list of sheetnames
@@ -226,6 +771,9 @@ def readxl_get_workbook(fn):
     # zip up the excel file to expose the xml files
     with zipfile.ZipFile(fn, 'r') as f_zip:
 
+        if 'xl/workbook.bin' in f_zip.NameToInfo.keys():
+            return readxl_xlsb_get_workbook(fn)
+
         with f_zip.open('xl/workbook.xml', 'r') as file:
             ns = utility_xml_namespace(file)
             for prefix, uri in ns.items():
@@ -266,12 +814,14 @@ def readxl_get_workbook(fn):
     return rv
 
 
-def readxl_get_workbookxmlrels(fn):
-    # type: (str) -> Dict[str, dict]
+def readxl_get_workbookxmlrels(fn, fn_rels='xl/_rels/workbook.xml.rels'):
+    # type: (str, str) -> Dict[str, dict]
     """Takes a file-path for xl/_rels/workbook.xml.rels file and gets the sheet#.xml to rId relations
 
     :param fn: Excel file name
     :type fn: str
+    :param fn_rels: workbook rels file path, defaults to 'xl/_rels/workbook.xml.rels' (xlsb: 'xl/_rels/workbook.bin.rels')
+    :type fn_rels: str, optional
     :return: {rId: fn_ws,...}
     :rtype: Dict[str, dict]
     """
@@ -282,12 +832,12 @@ def readxl_get_workbookxmlrels(fn):
     # zip up the excel file to expose the xml files
     with zipfile.ZipFile(fn, 'r') as f_zip:
 
-        with f_zip.open('xl/_rels/workbook.xml.rels', 'r') as file:
+        with f_zip.open(fn_rels, 'r') as file:
             ns = utility_xml_namespace(file)
             for prefix, uri in ns.items():
                 ET.register_namespace(prefix, uri)
 
-        with f_zip.open('xl/_rels/workbook.xml.rels', 'r') as file:
+        with f_zip.open(fn_rels, 'r') as file:
             tree = ET.parse(file)
             root = tree.getroot()
 
@@ -302,42 +852,161 @@ def readxl_get_workbookxmlrels(fn):
     return rv
 
 
-def readxl_get_sharedStrings(fn):
-    # type: (str) -> Dict[str, dict]
-    """Takes a file-path for xl/sharedStrings.xml and returns a dictionary of commonly used strings
+class SharedStrings:
+
+    # number of strings folded into each buffer segment
+    SEGMENT = 4096
+
+    def __init__(self):
+        """Compact read-only table of commonly used strings (xl/sharedStrings.xml). Strings are stored back to
+        back in segment buffers with an array('L') offset index rather than as individual str objects, and
+        are only materialised when they are indexed
+        """
+
+        # joined text of every SEGMENT strings
+        self._segments = []
+        # absolute start offset of each segment
+        self._segment_starts = array('L')
+        # absolute start offset of each string, plus the end offset of the last string
+        self._offsets = array('L', [0])
+        # strings not yet folded into a segment
+        self._pending = []
+
+    def __repr__(self):
+        return 'pylightxl.SharedStrings'
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        # type: (int) -> str
+        if index < 0 or index >= len(self):
+            raise IndexError('pylightxl - sharedString index ({}) out of range'.format(index))
+
+        segment = index // self.SEGMENT
+        if segment == len(self._segments):
+            return self._pending[index - segment * self.SEGMENT]
+
+        start = self._segment_starts[segment]
+        return self._segments[segment][self._offsets[index] - start:self._offsets[index + 1] - start]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, text):
+        # type: (str) -> None
+        """Adds a string to the end of the table
+
+        :param text: string
+        :type text: str
+        """
+
+        self._pending.append(text)
+        self._offsets.append(self._offsets[-1] + len(text))
+
+        if len(self._pending) == self.SEGMENT:
+            self._segment_starts.append(self._offsets[-1 - self.SEGMENT])
+            self._segments.append(''.join(self._pending))
+            self._pending = []
+
+
+def readxl_get_sharedStrings(fn, indices=None, crcs=None):
+    # type: (str, Iterable[int], Union[array, dict]) -> Union[SharedStrings, Dict[int, str]]
+    """Takes a file-path for xl/sharedStrings.xml and returns a table of commonly used strings.
+    The xml is parsed as a stream, only one <si> tag is held in memory at a time
 
     :param fn: Excel file name
     :type fn: str
-    :return: dict of commonly used strings
-    :rtype: Dict[str, dict]
+    :param indices: only decode these sharedString indices, the stream is stopped after the largest index,
+                    defaults to None (decode all)
+    :type indices: Iterable[int], optional
+    :param crcs: if an array (or dict when indices are given) is passed, it is filled with the CRC32 of each
+                 decoded string for change detection, defaults to None
+    :type crcs: Union[array, dict], optional
+    :return: table of commonly used strings indexed by their sharedString index,
+             or dict {index: str} of the requested indices
+    :rtype: Union[SharedStrings, Dict[int, str]]
     """
 
-    sharedStrings = {}
+    if indices is None:
+        sharedStrings = SharedStrings()
+    else:
+        sharedStrings = {}
+        indices = set(indices)
+        if not indices:
+            return sharedStrings
+        last_index = max(indices)
 
     # zip up the excel file to expose the xml files
     with zipfile.ZipFile(fn, 'r') as f_zip:
 
-        if 'xl/sharedStrings.xml' not in f_zip.NameToInfo.keys():
+        if 'xl/sharedStrings.bin' in f_zip.NameToInfo.keys():
+            fn_sst = 'xl/sharedStrings.bin'
+            iter_sharedStrings = readxl_xlsb_iter_sharedStrings
+        elif 'xl/sharedStrings.xml' in f_zip.NameToInfo.keys():
+            fn_sst = 'xl/sharedStrings.xml'
+            iter_sharedStrings = readxl_iter_sharedStrings
+        else:
             return sharedStrings
 
-        with f_zip.open('xl/sharedStrings.xml', 'r') as file:
-            ns = utility_xml_namespace(file)
-            for prefix, uri in ns.items():
-                ET.register_namespace(prefix, uri)
+        with readxl_open_part(f_zip, fn_sst) as file:
+            for i, text in enumerate(iter_sharedStrings(file, indices)):
+                if text is not None:
+                    if indices is None:
+                        sharedStrings.append(text)
+                    else:
+                        sharedStrings[i] = text
+                    if crcs is not None:
+                        crc = zlib.crc32(text.encode('utf-8')) & 0xffffffff
+                        if indices is None:
+                            crcs.append(crc)
+                        else:
+                            crcs[i] = crc
+                if indices is not None and i == last_index:
+                    break
 
-        with f_zip.open('xl/sharedStrings.xml', 'r') as file:
-            tree = ET.parse(file)
-            root = tree.getroot()
+    return sharedStrings
 
-    for i, tag_si in enumerate(root.findall('./default:si', ns)):
-        tag_t = tag_si.findall('./default:r//default:t', ns)
-        if tag_t:
-            text = ''.join([tag.text for tag in tag_t if tag.text])
-        else:
-            text = tag_si.findall('./default:t', ns)[0].text
-        sharedStrings.update({i: text})
 
-    return sharedStrings
+def readxl_iter_sharedStrings(file, indices=None):
+    # type: (io.BufferedReader, set) -> Iterable[str]
+    """Takes an opened xl/sharedStrings.xml and yields its strings in order. The xml is parsed as a stream,
+    only one <si> tag is held in memory at a time
+
+    :param file: xl/sharedStrings.xml file
+    :type file: io.BufferedReader
+    :param indices: only decode these sharedString indices, None is yielded for the others, defaults to None (all)
+    :type indices: set, optional
+    :return: yields each string
+    :rtype: Iterable[str]
+    """
+
+    ns = {}
+    root = None
+    i = 0
+    for event, elem in ET.iterparse(file, ('start-ns', 'start', 'end')):
+        if event == 'start-ns':
+            ns['default' if elem[0] == '' else elem[0]] = elem[1]
+        elif event == 'start':
+            if root is None:
+                root = elem
+                if 'default' not in ns.keys():
+                    ns['default'] = ns['x']
+                tag_name_si = '{' + ns['default'] + '}si'
+        elif elem.tag == tag_name_si:
+            text = None
+            if indices is None or i in indices:
+                tag_t = elem.findall('./default:r//default:t', ns)
+                if tag_t:
+                    text = ''.join([tag.text for tag in tag_t if tag.text])
+                else:
+                    tag_t = elem.find('./default:t', ns)
+                    text = tag_t.text or '' if tag_t is not None else ''
+            # drop the parsed <si> tags to keep memory flat
+            root.clear()
+            yield text
+            i += 1
 
 
 def readxl_get_styles(fn):
@@ -355,6 +1024,9 @@ def readxl_get_styles(fn):
     # zip up the excel file to expose the xml files
     with zipfile.ZipFile(fn, 'r') as f_zip:
 
+        if 'xl/styles.bin' in f_zip.NameToInfo.keys():
+            return readxl_xlsb_get_styles(fn)
+
         if 'xl/styles.xml' not in f_zip.NameToInfo.keys():
             return styles
 
@@ -372,25 +1044,10 @@ def readxl_get_styles(fn):
         tag_numFmts = root.findall('./default:numFmts', ns)[0]
     except IndexError:
         tag_numFmts = []
-    num_chars = '0#?'
-    date_chars = 'yd'  # 'm' is ambiguos
-    time_chars = 'hs'
     for tag in tag_numFmts:
-        fc = tag.get('formatCode').lower().split(';')[0]
-        if fc == 'general':
-            continue
-        nnu = sum(fc.count(c) for c in num_chars)
-        ndc = sum(fc.count(c) for c in date_chars)
-        ntc = sum(fc.count(c) for c in time_chars)
-        if nnu > ndc + ntc:
-            pass
-        elif ndc and ntc:
-            custom_styles[tag.get('numFmtId')] = '22'
-        elif ndc:
-            custom_styles[tag.get('numFmtId')] = '14'
-        elif ntc:
-            custom_styles[tag.get('numFmtId')] = '18'
-
+        numFmtId = readxl_get_numFmt_datetime(tag.get('formatCode'))
+        if numFmtId is not None:
+            custom_styles[tag.get('numFmtId')] = numFmtId
 
     for i, tag_cellXfs in enumerate(root.findall('./default:cellXfs', ns)[0]):
         numFmtId = tag_cellXfs.get('numFmtId')
@@ -399,19 +1056,51 @@ def readxl_get_styles(fn):
     return styles
 
 
-def readxl_get_ws_rels(fn, fn_ws):
-    # type: (str, str) -> Dict[str, str]
-    """Takes a file-path for xl/worksheets/sheet#.xml and returns a dict of cell data (comments)
+def readxl_get_numFmt_datetime(formatCode):
+    # type: (str) -> str
+    """Takes a custom number format code and returns the builtin date/time numFmtId it behaves like
+
+    :param formatCode: number format code (ex: 'yyyy-mm-dd')
+    :type formatCode: str
+    :return: '14' for dates, '18' for times, '22' for datetimes, None for any other format
+    :rtype: str
+    """
+
+    num_chars = '0#?'
+    date_chars = 'yd'  # 'm' is ambiguos
+    time_chars = 'hs'
+
+    fc = formatCode.lower().split(';')[0]
+    if fc == 'general':
+        return None
+    nnu = sum(fc.count(c) for c in num_chars)
+    ndc = sum(fc.count(c) for c in date_chars)
+    ntc = sum(fc.count(c) for c in time_chars)
+    if nnu > ndc + ntc:
+        return None
+    elif ndc and ntc:
+        return '22'
+    elif ndc:
+        return '14'
+    elif ntc:
+        return '18'
+    return None
+
+
+def readxl_get_ws_comments_fn(fn, fn_ws):
+    # type: (str, str) -> str
+    """Takes a file-path for xl/worksheets/sheet#.xml and returns the file name of its comments xml
+    from xl/worksheets/_rels/sheet#.xml.rels
 
     :param fn: Excel file name
     :type fn: str
     :param fn_ws: file path for worksheet (ex: xl/worksheets/sheet1.xml)
     :type fn_ws: str
-    :return: dict of cell data (comments)
-    :rtype: Dict[str, str]
+    :return: comments file name (ex: comments1.xml), empty string if the worksheet does not have comments
+    :rtype: str
     """
 
-    rv = {}
+    comment_fn = ''
 
     fn_ws_parts = fn_ws.split('/')
     fn_wsrels = '/'.join(fn_ws_parts[:-1]) + '/_rels/' + fn_ws_parts[-1] + '.rels'
@@ -420,7 +1109,7 @@ def readxl_get_ws_rels(fn, fn_ws):
     with zipfile.ZipFile(fn, 'r') as f_zip:
 
         if 'xl/' + fn_wsrels not in f_zip.NameToInfo.keys():
-            return rv
+            return comment_fn
 
         with f_zip.open('xl/' + fn_wsrels, 'r') as file:
             ns = utility_xml_namespace(file)
@@ -431,12 +1120,33 @@ def readxl_get_ws_rels(fn, fn_ws):
             tree = ET.parse(file)
             root = tree.getroot()
 
-    comment_fn = ''
     for tag_rel in root.findall('./default:Relationship', ns):
         target = tag_rel.get('Target')
         if 'comments' in target:
             comment_fn = target.split('/')[-1]
 
+    return comment_fn
+
+
+def readxl_get_ws_rels(fn, fn_ws):
+    # type: (str, str) -> Dict[str, str]
+    """Takes a file-path for xl/worksheets/sheet#.xml and returns a dict of cell data (comments)
+
+    :param fn: Excel file name
+    :type fn: str
+    :param fn_ws: file path for worksheet (ex: xl/worksheets/sheet1.xml)
+    :type fn_ws: str
+    :return: dict of cell data (comments)
+    :rtype: Dict[str, str]
+    """
+
+    rv = {}
+
+    comment_fn = readxl_get_ws_comments_fn(fn, fn_ws)
+
+    if comment_fn.endswith('.bin'):
+        return readxl_xlsb_get_comments(fn, comment_fn)
+
     if comment_fn:
         # zip up the excel file to expose the xml files
         with zipfile.ZipFile(fn, 'r') as f_zip:
@@ -463,46 +1173,108 @@ def readxl_get_ws_rels(fn, fn_ws):
     return rv
 
 
-def readxl_scrape(fn, fn_ws, sharedString, styles, comments):
-    # type: (str, str, dict, dict, dict) -> Dict[str, dict]
+def readxl_get_datetime_decoders(styles, datetimes='str'):
+    # type: (Dict[int, str], str) -> Dict[int, Callable]
+    """Takes the styles dict from readxl_get_styles and returns a decoder table for date/time styled cells.
+    Styles that share a date/time format share the same decoder (and its serial value cache)
+
+    :param styles: styles dict of cell formatting keys from readxl_get_styles
+    :type styles: Dict[int, str]
+    :param datetimes: "str" decodes to strings, "native" decodes to datetime objects, defaults to 'str'
+    :type datetimes: str, optional
+    :return: {style_index: decoder} where decoder takes the cell's serial value text (ex: '44296.5')
+    :rtype: Dict[int, Callable]
+    """
+
+    kinds = {'14': 'date', '15': 'date', '16': 'date', '17': 'date',
+             '18': 'time', '19': 'time', '20': 'time', '21': 'time',
+             '22': 'datetime'}
+
+    decoders = {}
+    kind_decoders = {}
+    for style_index, numFmtId in styles.items():
+        kind = kinds.get(numFmtId)
+        if kind is None:
+            continue
+        if kind not in kind_decoders:
+            kind_decoders[kind] = utility_serial_decoder(kind, native=datetimes == 'native')
+        decoders[style_index] = kind_decoders[kind]
+
+    return decoders
+
+
+def readxl_scrape(fn, fn_ws, sharedString, styles, comments, decoders=None, sst_refs=None):
+    # type: (str, str, SharedStrings, dict, dict, dict, list) -> Dict[str, dict]
     """Takes a file-path for xl/worksheets/sheet#.xml and returns a dict of cell data
 
     :param fn: Excel file name
     :type fn: str
     :param fn_ws: file path for worksheet (ex: xl/worksheets/sheet1.xml)
     :type fn_ws: str
-    :param sharedString: shared string dict lookup table from xl/sharedStrings.xml for string only cell values
-    :type sharedString: dict
+    :param sharedString: shared string lookup table from xl/sharedStrings.xml for string only cell values
+    :type sharedString: SharedStrings
     :param styles: styles dict for date parsing
     :type styles: dict
     :param comments: comments dict
     :type comments: dict
+    :param decoders: date/time decoder table from readxl_get_datetime_decoders, defaults to string decoders of styles
+    :type decoders: dict, optional
+    :param sst_refs: if a list is passed, sharedString cells are not resolved - their value is left as the
+                     int sharedString index and their address is appended to sst_refs, defaults to None
+    :type sst_refs: list, optional
     :return: dict of cell data {address: {'v': cell_val, 'f': cell_formula, 's': '', 'c': cell_comment}}
     :rtype: Dict[str, dict]
     """
 
-    # {address: {'v': cell_val, 'f': cell_formula, 's': '', 'c': cell_comment}}
-    data = {}
+    if decoders is None:
+        decoders = readxl_get_datetime_decoders(styles)
+
+    if fn_ws.endswith('.bin'):
+        return readxl_xlsb_scrape(fn, fn_ws, sharedString, comments, decoders, sst_refs)
 
     # zip up the excel file to expose the xml files
     with zipfile.ZipFile(fn, 'r') as f_zip:
 
-        with f_zip.open('xl/' + fn_ws, 'r') as file:
-            ns = utility_xml_namespace(file)
-            for prefix, uri in ns.items():
-                ET.register_namespace(prefix, uri)
-
-        with f_zip.open('xl/' + fn_ws, 'r') as file:
+        with readxl_open_part(f_zip, 'xl/' + fn_ws) as file:
             tree = ET.parse(file)
             root = tree.getroot()
 
-    for tag_cell in root.findall('./default:sheetData/default:row/default:c', ns):
-        cell_address = tag_cell.get('r')
-        # t="e" is for error cells "#N/A"
-        # t="s" is for common strings
-        # t="str" is for equation strings (ex: =A1 & "this")
-        # t="b" is for bool, bool is not logged as a commonString in xml, 0 == FALSE, 1 == TRUE
-        cell_type = tag_cell.get('t')
+    # the sheet is parsed once, its namespace is taken from the root tag (ex: {namespace}worksheet)
+    ns = {'default': root.tag[1:].split('}')[0]}
+
+    return readxl_scrape_cells(root, ns, sharedString, comments, decoders, sst_refs)
+
+
+def readxl_scrape_cells(root, ns, sharedString, comments, decoders, sst_refs=None):
+    # type: (ET.Element, Dict[str, str], SharedStrings, dict, dict, list) -> Dict[str, dict]
+    """Takes a parsed worksheet xml root and returns a dict of cell data, see readxl_scrape
+
+    :param root: worksheet xml root
+    :type root: ET.Element
+    :param ns: xml namespace dict
+    :type ns: Dict[str, str]
+    :param sharedString: shared string lookup table from xl/sharedStrings.xml for string only cell values
+    :type sharedString: SharedStrings
+    :param comments: comments dict
+    :type comments: dict
+    :param decoders: date/time decoder table from readxl_get_datetime_decoders
+    :type decoders: dict
+    :param sst_refs: see readxl_scrape, defaults to None
+    :type sst_refs: list, optional
+    :return: dict of cell data {address: {'v': cell_val, 'f': cell_formula, 's': '', 'c': cell_comment}}
+    :rtype: Dict[str, dict]
+    """
+
+    # {address: {'v': cell_val, 'f': cell_formula, 's': '', 'c': cell_comment}}
+    data = {}
+
+    for tag_cell in root.findall('./default:sheetData/default:row/default:c', ns):
+        cell_address = tag_cell.get('r')
+        # t="e" is for error cells "#N/A"
+        # t="s" is for common strings
+        # t="str" is for equation strings (ex: =A1 & "this")
+        # t="b" is for bool, bool is not logged as a commonString in xml, 0 == FALSE, 1 == TRUE
+        cell_type = tag_cell.get('t')
         cell_style = int(tag_cell.get('s')) if tag_cell.get('s') is not None else 0
         tag_val = tag_cell.find('./default:v', ns)
         cell_val = tag_val.text or '' if tag_val is not None else ''
@@ -516,13 +1288,20 @@ def readxl_scrape(fn, fn_ws, sharedString, styles, comments):
 
         if cell_type == 's':
             # commonString
-            cell_val = sharedString[int(cell_val)]
+            if sst_refs is None:
+                cell_val = sharedString[int(cell_val)]
+            else:
+                cell_val = int(cell_val)
+                sst_refs.append(cell_address)
         elif cell_type == 'b':
             # bool
             cell_val = True if cell_val == '1' else False
         elif cell_val == '' or cell_type == 'str' or cell_type == 'e':
             # cell is either empty, or is a str formula - leave cell_val as a string
             pass
+        elif cell_style in decoders:
+            # date/time styled number
+            cell_val = decoders[cell_style](cell_val)
         else:
             # int or float
             test_cell = cell_val if '-' not in cell_val else cell_val[1:]
@@ -530,26 +1309,447 @@ def readxl_scrape(fn, fn_ws, sharedString, styles, comments):
                 cell_val = int(cell_val)
             else:
                 cell_val = float(cell_val)
-            st = styles[cell_style]
-            if st in ['14', '15', '16', '17']:
-                dt = EXCEL_STARTDATE + timedelta(cell_val)
-                cell_val = dt.isoformat()[:10].replace('-', '/')
-            elif st in ['18', '19', '20', '21']:
-                partialday = cell_val % 1
-                dt = EXCEL_STARTDATE + timedelta(2, round(partialday * 86400))
-                cell_val = dt.strftime('%H:%M:%S')
-            elif st in ['22']:
-                partialday = cell_val % 1
-                dt = EXCEL_STARTDATE + timedelta(int(cell_val), round(partialday * 86400))
-                cell_val = dt.isoformat().replace('T', ' ').replace('-', '/')
 
         data.update({cell_address: {'v': cell_val, 'f': cell_formula, 's': '', 'c': comment}})
 
     return data
 
 
-def readcsv(fn, delimiter=',', ws='Sheet1'):
-    # type: (Union[str, pathlib.Path, io.StringIO], str, str) -> Database
+def readxl_rowindex(fn, ws, every=1000, path=None):
+    # type: (Union[str, pathlib.Path], str, int, str) -> dict
+    """Builds a row index of a worksheet that maps row numbers to byte offsets in the decompressed
+    sheet#.xml, one checkpoint every "every" rows. The index lets readxl_rows parse only a window of rows
+    of a large worksheet rather than the whole sheet. If a path is passed the index is persisted as json,
+    and an existing index file at path is reused as long as the worksheet did not change
+
+    :param fn: Excel file path, also supports Pathlib.Path object, as well as file-like object from with/open
+    :type fn: Union[str, pathlib.Path]
+    :param ws: sheetname to index
+    :type ws: str
+    :param every: number of rows between checkpoints, defaults to 1000
+    :type every: int, optional
+    :param path: json file path to persist the index to / load the index from, defaults to None
+    :type path: str, optional
+    :return: row index (json serializable dict)
+    :rtype: dict
+    """
+
+    if type(every) is not int or every < 1:
+        raise UserWarning('pylightxl - readxl_rowindex every ({}) must be an integer of 1 or more.'.format(every))
+
+    fn = readxl_check_excelfile(fn)
+
+    fn_ws = readxl_get_ws_fn(fn, ws)
+    if fn_ws.endswith('.bin'):
+        raise UserWarning('pylightxl - readxl_rowindex only supports xlsx/xlsm worksheets.')
+    crc = readxl_get_crcs(fn).get('xl/' + fn_ws)
+
+    rowindex = None
+    if path is not None and os.path.isfile(path):
+        with open(path, 'r') as f:
+            rowindex = json.load(f)
+        if rowindex.get('fn_ws') != fn_ws or rowindex.get('crc') != crc or rowindex.get('every') != every:
+            # worksheet changed since the index was persisted
+            rowindex = None
+
+    if rowindex is None:
+        # {'fn_ws': str, 'crc': int, 'every': int, 'header': int, 'end': int, 'close': str,
+        #  'checkpoints': [[row, offset], ...], 'maxrow': int}
+        rowindex = {'fn_ws': fn_ws, 'crc': crc, 'every': every, 'header': 0, 'end': 0, 'close': '',
+                    'checkpoints': [], 'maxrow': 0}
+        tag_sheetData = ''
+        i = 0
+        with zipfile.ZipFile(fn, 'r') as f_zip:
+
+            with readxl_open_part(f_zip, 'xl/' + fn_ws) as file:
+                for closing, qname, attrs, row, start, end in utility_xml_row_offsets(file):
+                    if qname.split(':')[-1] == 'sheetData':
+                        if closing or attrs.endswith('/'):
+                            # </sheetData> or an empty <sheetData/>
+                            rowindex['end'] = start
+                            break
+                        rowindex['header'] = end
+                        tag_sheetData = qname
+                    elif not closing:
+                        if i % every == 0:
+                            rowindex['checkpoints'].append([row, start])
+                        rowindex['maxrow'] = row
+                        i += 1
+
+            if rowindex['checkpoints']:
+                # root tag name to close the xml of a row window
+                with f_zip.open('xl/' + fn_ws, 'r') as file:
+                    header = file.read(rowindex['header'])
+                tag_root = re.search(b'<([A-Za-z_][\\w.:-]*)', header).group(1).decode('utf-8')
+                rowindex['close'] = '</{}></{}>'.format(tag_sheetData, tag_root)
+
+        if path is not None:
+            with open(path, 'w') as f:
+                json.dump(rowindex, f)
+
+    if type(fn) is str and 'pylightxlIOtemp_wb' in fn:
+        os.remove(fn)
+
+    return rowindex
+
+
+def readxl_rows(fn, ws, row_start, row_end, rowindex, datetimes='str'):
+    # type: (Union[str, pathlib.Path], str, int, int, dict, str) -> Worksheet
+    """Reads a window of rows (row_start to row_end inclusive) of a worksheet using its row index from
+    readxl_rowindex. Only the rows from the checkpoint before row_start up to row_end are parsed.
+    Note that a deflated zip part can not be seeked into, the sheet is still decompressed (not parsed) from its
+    start up to the checkpoint, so a window near the end of a large sheet still costs a pass over the
+    compressed bytes before it
+
+    :param fn: Excel file path, also supports Pathlib.Path object, as well as file-like object from with/open
+    :type fn: Union[str, pathlib.Path]
+    :param ws: sheetname to read
+    :type ws: str
+    :param row_start: first row to read (1-based)
+    :type row_start: int
+    :param row_end: last row to read (1-based, inclusive)
+    :type row_end: int
+    :param rowindex: row index of the worksheet from readxl_rowindex
+    :type rowindex: dict
+    :param datetimes: "str" or "native" date/time cell values, see readxl, defaults to 'str'
+    :type datetimes: str, optional
+    :return: worksheet that only contains the cells of the requested rows (cell addresses are unchanged)
+    :rtype: Worksheet
+    """
+
+    if datetimes not in ['str', 'native']:
+        raise UserWarning('pylightxl - incorrect readxl_rows(datetimes={}) argument. '
+                          'Valid options = "str", "native"'.format(datetimes))
+
+    fn = readxl_check_excelfile(fn)
+
+    fn_ws = readxl_get_ws_fn(fn, ws)
+    if rowindex['fn_ws'] != fn_ws or rowindex['crc'] != readxl_get_crcs(fn).get('xl/' + fn_ws):
+        raise UserWarning('pylightxl - row index does not match worksheet ({}), '
+                          'rebuild it with readxl_rowindex.'.format(ws))
+
+    data = {}
+    checkpoints = rowindex['checkpoints']
+    if checkpoints and row_start <= row_end and row_end >= checkpoints[0][0]:
+        # start at the last checkpoint at or before row_start
+        i = max(bisect.bisect_right([checkpoint[0] for checkpoint in checkpoints], row_start) - 1, 0)
+        checkpoint_row, checkpoint_offset = checkpoints[i]
+
+        with zipfile.ZipFile(fn, 'r') as f_zip:
+
+            with readxl_open_part(f_zip, 'xl/' + fn_ws) as file:
+                header = file.read(rowindex['header'])
+                # zip files can only be read forward, skip to the checkpoint
+                skip = checkpoint_offset - rowindex['header']
+                while skip > 0:
+                    skip -= len(file.read(min(skip, 1048576)))
+
+                chunks = []
+                stop = rowindex['end']
+                for closing, qname, attrs, row, start, end in utility_xml_row_offsets(file, checkpoint_offset,
+                                                                                      checkpoint_row - 1, chunks):
+                    if closing or row > row_end:
+                        stop = start
+                        break
+
+        root = ET.fromstring(header + b''.join(chunks)[:stop - checkpoint_offset] +
+                             rowindex['close'].encode('utf-8'))
+        ns = {'default': root.tag[1:].split('}')[0]}
+
+        styles = readxl_get_styles(fn)
+        decoders = readxl_get_datetime_decoders(styles, datetimes)
+        comments = readxl_get_ws_rels(fn, fn_ws)
+        sst_refs = []
+        data = readxl_scrape_cells(root, ns, None, comments, decoders, sst_refs)
+
+        # drop the rows between the checkpoint and row_start
+        for address in list(data.keys()):
+            if utility_address2index(address)[0] < row_start:
+                del data[address]
+        sst_refs = [address for address in sst_refs if address in data]
+
+        sharedString = readxl_get_sharedStrings(fn, set(data[address]['v'] for address in sst_refs))
+        for address in sst_refs:
+            data[address]['v'] = sharedString[data[address]['v']]
+
+    if type(fn) is str and 'pylightxlIOtemp_wb' in fn:
+        os.remove(fn)
+
+    return Worksheet(data)
+
+
+def readxl_get_ws_fn(fn, ws):
+    # type: (str, str) -> str
+    """Takes a sheetname and returns its worksheet file path
+
+    :param fn: Excel file name
+    :type fn: str
+    :param ws: sheetname
+    :type ws: str
+    :return: file path for worksheet (ex: worksheets/sheet1.xml)
+    :rtype: str
+    """
+
+    wb_rels = readxl_get_workbook(fn)
+
+    if ws not in wb_rels['ws'].keys():
+        raise UserWarning('pylightxl - Sheetname ({}) is not in the workbook.'.format(ws))
+
+    return wb_rels['ws'][ws]['fn_ws']
+
+
+def readxl_xlsb_get_workbook(fn):
+    # type: (str) -> Dict[str, dict]
+    """Takes a file-path for xl/workbook.bin (xlsb) and returns a list of sheetnames, see readxl_get_workbook
+
+    :param fn: Excel file path
+    :type fn: str
+    :return: {'ws': {ws1: {'ws': str, 'rId': str, 'order': str, 'fn_ws': str}}, ...
+                'nr': {nr1: {'nr': str, 'ws': str, 'address': str}}, ...}
+    :rtype: Dict[str, dict]
+    """
+
+    rv = {'ws': {}, 'nr': {}}
+
+    wbrels = readxl_get_workbookxmlrels(fn, 'xl/_rels/workbook.bin.rels')
+    # sheetnames in tab order
+    sheets = []
+    # sheet tab index of each extern sheet entry that named range formulas refer to
+    xti = []
+    # (name, parsed formula tokens)
+    names = []
+
+    with zipfile.ZipFile(fn, 'r') as f_zip:
+
+        with f_zip.open('xl/workbook.bin', 'r') as file:
+            for rec_id, rec in utility_biff12_records(file):
+                if rec_id == XLSB_BUNDLESH:
+                    # hsState (4), iTabID (4), strRelID, strName
+                    rId, i = utility_biff12_string(rec, 8)
+                    name, i = utility_biff12_string(rec, i)
+                    sheets.append(name)
+                    rv['ws'][name] = {'ws': name, 'rId': rId, 'order': len(sheets), 'fn_ws': wbrels[rId]}
+                elif rec_id == XLSB_EXTERNSHEET:
+                    # cXti (4), then iSupBook (4), itabFirst (4), itabLast (4) per entry
+                    for j in range(struct.unpack_from('<I', rec, 0)[0]):
+                        xti.append(struct.unpack_from('<i', rec, 8 + 12 * j)[0])
+                elif rec_id == XLSB_NAME:
+                    # flags (4), chKey (1), itab (4), name, cce (4), rgce
+                    name, i = utility_biff12_string(rec, 9)
+                    cce = struct.unpack_from('<I', rec, i)[0]
+                    names.append((name, rec[i + 4:i + 4 + cce]))
+
+    for name, rgce in names:
+        # only named ranges of a single cell (PtgRef3d) or range (PtgArea3d) are supported
+        ptg = rgce[0] if rgce else None
+        address = None
+        if ptg in [0x3A, 0x5A, 0x7A] and len(rgce) == 9:
+            ixti, row, col = struct.unpack_from('<HIH', rgce, 1)
+            address = utility_index2address(row + 1, (col & 0x3FFF) + 1)
+        elif ptg in [0x3B, 0x5B, 0x7B] and len(rgce) == 15:
+            ixti, row_first, row_last, col_first, col_last = struct.unpack_from('<HIIHH', rgce, 1)
+            address = utility_index2address(row_first + 1, (col_first & 0x3FFF) + 1) + ':' + \
+                      utility_index2address(row_last + 1, (col_last & 0x3FFF) + 1)
+        if address is None or ixti >= len(xti) or not 0 <= xti[ixti] < len(sheets):
+            msg = ('pylightxl - Ill formatted workbook.bin. '
+                   'Skipping NamedRange not containing sheet reference (ex: "Sheet1!A1"): {name}'.format(name=name))
+            warnings.warn(msg, UserWarning)
+            continue
+
+        rv['nr'][name] = {'nr': name, 'ws': sheets[xti[ixti]], 'address': address}
+
+    return rv
+
+
+def readxl_xlsb_get_styles(fn):
+    # type: (str) -> Dict[int, str]
+    """Takes a file-path for xl/styles.bin (xlsb) and returns a dictionary of cell formatting keys,
+    see readxl_get_styles
+
+    :param fn: Excel file name
+    :type fn: str
+    :return: dict of cell formatting keys
+    :rtype: Dict[int, str]
+    """
+
+    styles = {0: '0'}
+
+    custom_styles = {}
+    cellXfs = False
+    i = 0
+    with zipfile.ZipFile(fn, 'r') as f_zip:
+
+        with f_zip.open('xl/styles.bin', 'r') as file:
+            for rec_id, rec in utility_biff12_records(file):
+                if rec_id == XLSB_FMT:
+                    # ifmt (2), stFmtCode
+                    numFmtId = readxl_get_numFmt_datetime(utility_biff12_string(rec, 2)[0])
+                    if numFmtId is not None:
+                        custom_styles[str(struct.unpack_from('<H', rec, 0)[0])] = numFmtId
+                elif rec_id == XLSB_BEGINCELLXFS:
+                    cellXfs = True
+                elif rec_id == XLSB_ENDCELLXFS:
+                    cellXfs = False
+                elif rec_id == XLSB_XF and cellXfs:
+                    # ixfeParent (2), iFmt (2)
+                    numFmtId = str(struct.unpack_from('<H', rec, 2)[0])
+                    styles.update({i: custom_styles[numFmtId] if numFmtId in custom_styles else numFmtId})
+                    i += 1
+
+    return styles
+
+
+def readxl_xlsb_iter_sharedStrings(file, indices=None):
+    # type: (io.BufferedReader, set) -> Iterable[str]
+    """Takes an opened xl/sharedStrings.bin (xlsb) and yields its strings in order
+
+    :param file: xl/sharedStrings.bin file
+    :type file: io.BufferedReader
+    :param indices: only decode these sharedString indices, None is yielded for the others, defaults to None (all)
+    :type indices: set, optional
+    :return: yields each string
+    :rtype: Iterable[str]
+    """
+
+    i = 0
+    for rec_id, rec in utility_biff12_records(file):
+        if rec_id == XLSB_SSTITEM:
+            # flags (1), str
+            yield utility_biff12_string(rec, 1)[0] if indices is None or i in indices else None
+            i += 1
+
+
+def readxl_xlsb_get_comments(fn, comment_fn):
+    # type: (str, str) -> Dict[str, str]
+    """Takes a file-path for xl/comments#.bin (xlsb) and returns a dict of cell comments
+
+    :param fn: Excel file name
+    :type fn: str
+    :param comment_fn: comments file name (ex: comments1.bin)
+    :type comment_fn: str
+    :return: dict of cell data (comments)
+    :rtype: Dict[str, str]
+    """
+
+    rv = {}
+
+    celladdress = None
+    with zipfile.ZipFile(fn, 'r') as f_zip:
+
+        with f_zip.open('xl/' + comment_fn, 'r') as file:
+            for rec_id, rec in utility_biff12_records(file):
+                if rec_id == XLSB_BEGINCOMMENT:
+                    # iauthor (4), rwFirst (4), rwLast (4), colFirst (4), colLast (4)
+                    row, _, col = struct.unpack_from('<III', rec, 4)
+                    celladdress = utility_index2address(row + 1, col + 1)
+                elif rec_id == XLSB_COMMENTTEXT and celladdress is not None:
+                    # flags (1), str
+                    text = utility_biff12_string(rec, 1)[0]
+                    if '[Threaded comment]' in text:
+                        text = text.split('Comment:\n')[1]
+                    rv[celladdress] = text
+                    celladdress = None
+
+    return rv
+
+
+def readxl_xlsb_scrape(fn, fn_ws, sharedString, comments, decoders, sst_refs=None):
+    # type: (str, str, SharedStrings, dict, dict, list) -> Dict[str, dict]
+    """Takes a file-path for xl/worksheets/sheet#.bin (xlsb) and returns a dict of cell data,
+    see readxl_scrape. Formula cells only carry their last calculated value, the formula text itself is not decoded
+
+    :param fn: Excel file name
+    :type fn: str
+    :param fn_ws: file path for worksheet (ex: xl/worksheets/sheet1.bin)
+    :type fn_ws: str
+    :param sharedString: shared string lookup table from xl/sharedStrings.bin for string only cell values
+    :type sharedString: SharedStrings
+    :param comments: comments dict
+    :type comments: dict
+    :param decoders: date/time decoder table from readxl_get_datetime_decoders
+    :type decoders: dict
+    :param sst_refs: see readxl_scrape, defaults to None
+    :type sst_refs: list, optional
+    :return: dict of cell data {address: {'v': cell_val, 'f': cell_formula, 's': '', 'c': cell_comment}}
+    :rtype: Dict[str, dict]
+    """
+
+    # {address: {'v': cell_val, 'f': cell_formula, 's': '', 'c': cell_comment}}
+    data = {}
+
+    row = 0
+    col = 0
+    sheetData = False
+    with zipfile.ZipFile(fn, 'r') as f_zip:
+
+        with readxl_open_part(f_zip, 'xl/' + fn_ws) as file:
+            for rec_id, rec in utility_biff12_records(file):
+                if not sheetData:
+                    sheetData = rec_id == XLSB_BEGINSHEETDATA
+                    continue
+                if rec_id == XLSB_ROWHDR:
+                    # rw (4), 0-based
+                    row = struct.unpack_from('<I', rec, 0)[0] + 1
+                    col = 0
+                    continue
+                if rec_id == XLSB_ENDSHEETDATA:
+                    break
+                if rec_id not in XLSB_CELLS:
+                    continue
+
+                cell_type, short = XLSB_CELLS[rec_id]
+                if short:
+                    # short cell records leave out the column, they follow the previous cell of the row
+                    col += 1
+                    offset = 4
+                else:
+                    # column (4), 0-based
+                    col = struct.unpack_from('<I', rec, 0)[0] + 1
+                    offset = 8
+                # iStyleRef (3) + flags (1)
+                cell_style = struct.unpack_from('<I', rec, offset - 4)[0] & 0xFFFFFF
+                cell_address = utility_index2address(row, col)
+                comment = comments[cell_address] if cell_address in comments else ''
+
+                if cell_type == 'blank':
+                    if not comment:
+                        # this is a style only entry
+                        continue
+                    cell_val = ''
+                elif cell_type == 'isst':
+                    cell_val = struct.unpack_from('<I', rec, offset)[0]
+                    if sst_refs is None:
+                        cell_val = sharedString[cell_val]
+                    else:
+                        sst_refs.append(cell_address)
+                elif cell_type == 'str':
+                    cell_val = utility_biff12_string(rec, offset)[0]
+                elif cell_type == 'rstr':
+                    # flags (1), str
+                    cell_val = utility_biff12_string(rec, offset + 1)[0]
+                elif cell_type == 'bool':
+                    cell_val = rec[offset] != 0
+                elif cell_type == 'error':
+                    cell_val = XLSB_ERRORS.get(rec[offset], '#N/A')
+                else:
+                    if cell_type == 'rk':
+                        cell_val = utility_biff12_rk(struct.unpack_from('<i', rec, offset)[0])
+                    else:
+                        cell_val = struct.unpack_from('<d', rec, offset)[0]
+                    if cell_style in decoders:
+                        # date/time styled number
+                        cell_val = decoders[cell_style](cell_val)
+                    elif type(cell_val) is float and cell_val.is_integer():
+                        # xlsx files write whole numbers without decimals, return them as int the same way
+                        cell_val = int(cell_val)
+
+                data[cell_address] = {'v': cell_val, 'f': '', 's': '', 'c': comment}
+
+    return data
+
+
+def readcsv(fn, delimiter=',', ws='Sheet1', columnar=False):
+    # type: (Union[str, pathlib.Path, io.StringIO], str, str, bool) -> Database
     """Reads an xlsx or xlsm file and returns a pylightxl database
 
     :param fn: filename, pathlib, or stringIO object
@@ -558,6 +1758,8 @@ def readcsv(fn, delimiter=',', ws='Sheet1'):
     :type delimiter: str, optional
     :param ws: worksheet name that the csv data will be stored in, defaults to 'Sheet1'
     :type ws: str, optional
+    :param columnar: store the worksheet in typed columns (see ColumnarWorksheet), defaults to False
+    :type columnar: bool, optional
     :return: pylightxl database
     :rtype: Database
     """
@@ -569,8 +1771,9 @@ def readcsv(fn, delimiter=',', ws='Sheet1'):
     if 'pathlib' in str(type(fn)):
         fn = str(fn)
 
-    # data = {'A1': data1, 'A2': data2...}
-    data = {}
+    # cells are stored into the worksheet as they are read
+    db.add_ws(ws, {}, columnar=columnar)
+    worksheet = db.ws(ws)
 
     try:
         f = fn if 'readline' in dir(fn) else open(fn, 'r')
@@ -592,8 +1795,6 @@ def readcsv(fn, delimiter=',', ws='Sheet1'):
             items = line.split(delimiter)
 
             for i_col, item in enumerate(items, 1):
-                address = utility_num2columnletters(i_col) + str(i_row)
-
                 # data conditioning
                 try:
                     if '.' in item:
@@ -606,9 +1807,7 @@ def readcsv(fn, delimiter=',', ws='Sheet1'):
                     elif 'false' in item.strip().lower():
                         item = False
 
-                data[address] = {'v': item, 'f': None, 's': None}
-
-    db.add_ws(ws, data)
+                worksheet._store(i_row, i_col, item)
 
     return db
 
@@ -619,7 +1818,8 @@ def readcsv(fn, delimiter=',', ws='Sheet1'):
 
 def writexl(db, fn):
     # type: (Database, Union[str, pathlib.Path]) -> None
-    """Writes an excel file from pylightxl.Database
+    """Writes an excel file from pylightxl.Database. A .xlsb file path writes a binary workbook,
+    see writexl_xlsb_writer
 
     :param db: database contains sheetnames, and their data
     :type db: Database
@@ -632,7 +1832,10 @@ def writexl(db, fn):
         fn = str(fn)
 
 
-    if not os.path.isfile(fn):
+    if fn.split('.')[-1].lower() == 'xlsb':
+        # write to new binary excel
+        writexl_xlsb_writer(db, fn)
+    elif not os.path.isfile(fn):
         # write to new excel
         writexl_new_writer(db, fn)
     else:
@@ -692,6 +1895,11 @@ def writexl_alt_writer(db, path):
     with open(temp_folder + '/xl/workbook.xml', 'wb') as f:
         f.write(text.encode('utf-8'))
 
+    # the date/time cell styles are appended to the existing styles, the other styles are kept as they are
+    text, datetime_styles = writexl_alt_styles_text(db, temp_folder + '/xl/styles.xml')
+    with open(temp_folder + '/xl/styles.xml', 'wb') as f:
+        f.write(text.encode('utf-8'))
+
     for shID, sheet_name in enumerate(db.ws_names, 1):
         if sheet_name in existing_sheetnames:
             # get the original sheet
@@ -700,7 +1908,7 @@ def writexl_alt_writer(db, path):
                     fn = 'temp_' + subdict['filename']
 
             # rewrite the sheet as if it was new
-            text = writexl_new_worksheet_text(db, sheet_name)
+            text = writexl_new_worksheet_text(db, sheet_name, datetime_styles)
             # feed altered text to new sheet based on db indexing order
             with open(temp_folder + '/xl/worksheets/sheet{}.xml'.format(shID), 'wb') as f:
                 f.write(text.encode('utf-8'))
@@ -708,7 +1916,7 @@ def writexl_alt_writer(db, path):
             os.remove(temp_folder + '/xl/worksheets/{}'.format(fn))
         else:
             # this sheet is new, create a new sheet
-            text = writexl_new_worksheet_text(db, sheet_name)
+            text = writexl_new_worksheet_text(db, sheet_name, datetime_styles)
             with open(temp_folder + '/xl/worksheets/sheet{shID}.xml'.format(shID=shID), 'wb') as f:
                 f.write(text.encode('utf-8'))
 
@@ -898,6 +2106,59 @@ def writexl_alt_app_text(db, filepath):
     return text
 
 
+def writexl_alt_styles_text(db, filepath):
+    # type: (Database, str) -> tuple
+    """Takes a xl/styles.xml filepath and returns its text with the date/time cell styles appended to its
+    cellXfs, the existing styles are left untouched. A new xl/styles.xml text is returned if the file does not
+    exist or has no cellXfs
+
+    :param db: pylightxl database that contains data to update xml file
+    :type db: Database
+    :param filepath: file path for xl/styles.xml
+    :type filepath: str
+    :return: (xl/styles.xml text, cellXfs index of the date/time styles {'datetime': #, 'date': #, 'time': #})
+    :rtype: tuple
+    """
+
+    if not os.path.isfile(filepath):
+        return writexl_new_styles_text(db), WRITEXL_DATETIME_STYLES
+
+    with open(filepath, 'rb') as f:
+        text = f.read().decode('utf-8')
+
+    # cellXfs may carry a namespace prefix, the appended xf tags use the same prefix
+    tag_cellXfs = re.search(r'<((?:[A-Za-z_][\w.-]*:)?)cellXfs\b([^>]*)>(.*?)</\1cellXfs>', text, re.DOTALL)
+    if tag_cellXfs is None:
+        return writexl_new_styles_text(db), WRITEXL_DATETIME_STYLES
+    prefix, attrs, many_tag_xf = tag_cellXfs.groups()
+
+    # inserts: prefix, numFmtId (built-in formats: 14 date, 21 time, 22 datetime)
+    xml_tag_xf = '<{prefix}xf numFmtId="{numFmtId}" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+
+    numFmtIds = {'datetime': 22, 'date': 14, 'time': 21}
+
+    # date/time styles of an earlier write are reused so rewriting a file does not keep appending them
+    xf_starts = [m.start() for m in re.finditer(r'<' + re.escape(prefix) + r'xf\b', many_tag_xf)]
+    xf_count = len(xf_starts)
+    datetime_styles = {}
+    for kind in sorted(WRITEXL_DATETIME_STYLES, key=WRITEXL_DATETIME_STYLES.get):
+        tag_xf = xml_tag_xf.format(prefix=prefix, numFmtId=numFmtIds[kind])
+        for xfID, start in enumerate(xf_starts):
+            if many_tag_xf.startswith(tag_xf, start):
+                datetime_styles[kind] = xfID
+                break
+        else:
+            datetime_styles[kind] = xf_count
+            many_tag_xf += tag_xf
+            xf_count += 1
+
+    attrs = re.sub(r'\scount="\d*"', '', attrs)
+    tag = '<{prefix}cellXfs count="{xf_count}"{attrs}>{many_tag_xf}</{prefix}cellXfs>'.format(
+        prefix=prefix, xf_count=xf_count, attrs=attrs, many_tag_xf=many_tag_xf)
+    rv = text[:tag_cellXfs.start()] + tag + text[tag_cellXfs.end():]
+    return rv, datetime_styles
+
+
 def writexl_alt_getsheetref(path_wbrels, path_wb):
     # type: (str, str) -> Dict[int, dict]
     """Takes a file path for '/xl/_rels/workbook.xml.rels' and '/xl/workbook.xml' files
@@ -977,6 +2238,9 @@ def writexl_new_writer(db, path):
         text_workbook = writexl_new_workbook_text(db)
         zf.writestr('xl/workbook.xml', text_workbook)
 
+        text_styles = writexl_new_styles_text(db)
+        zf.writestr('xl/styles.xml', text_styles)
+
         for shID, sheet_name in enumerate(db.ws_names, 1):
             text_worksheet = writexl_new_worksheet_text(db, sheet_name)
             zf.writestr('xl/worksheets/sheet{shID}.xml'.format(shID=shID), text_worksheet)
@@ -1120,13 +2384,14 @@ def writexl_new_workbookrels_text(db):
     """
 
     # location: /xl/_rels/workbook.xml.rels
-    # inserts: many_tag_sheets, tag_sharedStrings, tag_calcChain
-    #   sheets first for rId# then theme > styles > sharedStrings
-    #   note that theme, style, calcChain is not part of the stack. These don't need to be part of the base xml
+    # inserts: many_tag_sheets, tag_sharedStrings, tag_styles
+    #   sheets first for rId# then sharedStrings > styles
+    #   note that theme, calcChain is not part of the stack. These don't need to be part of the base xml
     xml_base =  '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n' \
                 '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\r\n' \
                     '{many_tag_sheets}\r\n' \
                     '{tag_sharedStrings}\r\n' \
+                    '{tag_styles}\r\n' \
                 '</Relationships>'
 
     # location: single tag_sheet insert for xml_base
@@ -1138,6 +2403,10 @@ def writexl_new_workbookrels_text(db):
     # inserts: ID
     xml_tag_sharedStrings = '<Relationship Target="sharedStrings.xml" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Id="rId{ID}"/>\r\n'
 
+    # location: styles insert for xml_base
+    # inserts: ID
+    xml_tag_styles = '<Relationship Target="styles.xml" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Id="rId{ID}"/>\r\n'
+
     many_tag_sheets = ''
     for wsID, _ in enumerate(db.ws_names, 1):
         many_tag_sheets += xml_tag_sheet.format(sheet_num=wsID)
@@ -1146,9 +2415,11 @@ def writexl_new_workbookrels_text(db):
         tag_sharedStrings = xml_tag_sharedStrings.format(ID=len(db.ws_names)+1)
     else:
         tag_sharedStrings = ''
+    tag_styles = xml_tag_styles.format(ID=len(db.ws_names)+2)
 
     rv = xml_base.format(many_tag_sheets=many_tag_sheets,
-                         tag_sharedStrings=tag_sharedStrings)
+                         tag_sharedStrings=tag_sharedStrings,
+                         tag_styles=tag_styles)
     return rv
 
 
@@ -1199,14 +2470,16 @@ def writexl_new_workbook_text(db):
     return rv
 
 
-def writexl_new_worksheet_text(db, sheet_name):
-    # type: (Database, str) -> str
+def writexl_new_worksheet_text(db, sheet_name, datetime_styles=None):
+    # type: (Database, str, Dict[str, int]) -> str
     """Returns xl/worksheets/sheet#.xml text
 
     :param db: database contains sheetnames, and their data
     :type db: Database
     :param sheet_name: worksheet name
     :type sheet_name: str
+    :param datetime_styles: cellXfs index of the date/time styles, defaults to WRITEXL_DATETIME_STYLES
+    :type datetime_styles: Dict[str, int]
     :return: xl/worksheets/sheet#.xml text
     :rtype: str
     """
@@ -1233,9 +2506,12 @@ def writexl_new_worksheet_text(db, sheet_name):
     xml_tag_row = '<row r="{row_num}" x14ac:dyDescent="0.25" spans="1:{num_of_cr_tags}">{many_tag_cr}</row>\r\n'
 
     # location: c r tag for xml_tag_row
-    # inserts: address, str_option (t="s" for sharedStrings), val
+    # inserts: address, str_option (t="s" for sharedStrings, s="#" for date/time styles), val
     xml_tag_cr = '<c r="{address}" {str_option}><v>{val}</v></c>'
 
+    if datetime_styles is None:
+        datetime_styles = WRITEXL_DATETIME_STYLES
+
     ws_size = db.ws(sheet_name).size
     if ws_size == [0,0] or ws_size == [1,1]:
         sheet_size_address = 'A1'
@@ -1252,11 +2528,8 @@ def writexl_new_worksheet_text(db, sheet_name):
             str_option = ''
             cell_formula = ''
 
-            # empty cells are not stored in _data
-            try:
-                cell_formula = db.ws(sheet_name)._data[address]['f']
-            except KeyError:
-                pass
+            # only cells with a formula are stored in _formulas
+            cell_formula = db.ws(sheet_name)._formulas.get((rowID, colID), '')
 
             # cell contains a formula
             if cell_formula:
@@ -1283,6 +2556,14 @@ def writexl_new_worksheet_text(db, sheet_name):
                 num_of_cr_tags_counter += 1
                 many_tag_cr += xml_tag_cr.format(address=address, str_option=str_option, val=val)
 
+            # cell value is a date/time, written as its serial value with a date/time style
+            elif isinstance(val, (date, datetime_time)):
+                val, kind = utility_serial_encode(val)
+                str_option = 's="{}"'.format(datetime_styles[kind])
+                tag_cr = True
+                num_of_cr_tags_counter += 1
+                many_tag_cr += xml_tag_cr.format(address=address, str_option=str_option, val=repr(val))
+
             # cell does not contain a formula, it is numeric
             elif val != '':
                 # val is numeric
@@ -1301,6 +2582,44 @@ def writexl_new_worksheet_text(db, sheet_name):
     return rv
 
 
+def writexl_new_styles_text(db):
+    # type: (Database) -> str
+    """Returns xl/styles.xml text, the default cell style followed by the date/time cell styles of
+    WRITEXL_DATETIME_STYLES
+
+    :param db: database contains sheetnames, and their data
+    :type db: Database
+    :return: xl/styles.xml text
+    :rtype: str
+    """
+
+    # location: xl/styles.xml
+    # inserts: many_tag_xf
+    #   note fonts, fills, borders, cellStyleXfs and cellStyles are required for excel to open
+    xml_base =  '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n' \
+                '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">\r\n' \
+                    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/><family val="2"/></font></fonts>\r\n' \
+                    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>\r\n' \
+                    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>\r\n' \
+                    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>\r\n' \
+                    '<cellXfs count="{xf_count}">{many_tag_xf}</cellXfs>\r\n' \
+                    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>\r\n' \
+                '</styleSheet>'
+
+    # location: xf tag for cellXfs
+    # inserts: numFmtId (built-in formats: 14 date, 21 time, 22 datetime)
+    xml_tag_xf = '<xf numFmtId="{numFmtId}" fontId="0" fillId="0" borderId="0" xfId="0"{apply}/>'
+
+    numFmtIds = {'datetime': 22, 'date': 14, 'time': 21}
+
+    many_tag_xf = xml_tag_xf.format(numFmtId=0, apply='')
+    for kind in sorted(WRITEXL_DATETIME_STYLES, key=WRITEXL_DATETIME_STYLES.get):
+        many_tag_xf += xml_tag_xf.format(numFmtId=numFmtIds[kind], apply=' applyNumberFormat="1"')
+
+    rv = xml_base.format(xf_count=len(WRITEXL_DATETIME_STYLES) + 1, many_tag_xf=many_tag_xf)
+    return rv
+
+
 def writexl_new_sharedStrings_text(db):
     # type: (Database) -> str
     """Returns xl/sharedStrings.xml text
@@ -1355,6 +2674,7 @@ def writexl_new_content_types_text(db):
                     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\r\n' \
                     '<Default Extension="xml" ContentType="application/xml"/>\r\n' \
                     '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>\r\n' \
+                    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>\r\n' \
                     '{many_tag_sheets}\r\n' \
                     '{tag_sharedStrings}\r\n' \
                     '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>\r\n' \
@@ -1381,78 +2701,411 @@ def writexl_new_content_types_text(db):
     return rv
 
 
-def writecsv(db, fn, ws=(), delimiter=','):
-    # type: (Database, Union[str, pathlib.Path, io.StringIO], Union[str, tuple], str) -> None
-    """Writes a csv file from pylightxl database. For db that have more than one sheet, will write out,
-    multiple files with the sheetname tagged on the end (ex: "fn_sh2.csv")
+def writexl_xlsb_writer(db, path):
+    # type: (Database, str) -> None
+    """Writes to a new binary excel file (.xlsb). The same parts as writexl_new_writer are written, with BIFF12
+    records in place of the workbook, styles, worksheet and sharedStrings xml. An existing file at path is replaced.
+    Formulas are not supported, formula cells are written with their cell value
 
-    :param db: pylightxl Database
+    :param db: database contains sheetnames, and their data
     :type db: Database
-    :param fn: output file name (without extension; ie. no '.csv')
-    :type fn: Union[str, pathlib.Path, io.StringIO]
-    :param ws: sheetname(s) to read into the database, if not specified - all sheets are read, defaults to ()
-    :type ws: Union[str, tuple], optional
-    :param delimiter: csv delimiter, defaults to ','
-    :type delimiter: str, optional
+    :param path: file output path
+    :type path: str
     """
 
-    # test that file entered was a valid excel file
-    if 'pathlib' in str(type(fn)):
-        fn = str(fn)
+    # {text: sharedString index}
+    sharedStrings = {}
 
-    if ws == ():
-        # write all worksheets
-        worksheets = db.ws_names
-    else:
-        # write only specified worksheets
-        worksheets = (ws,) if type(ws) is str else ws
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        text_rels = writexl_new_rels_text(db).replace('xl/workbook.xml', 'xl/workbook.bin')
+        zf.writestr('_rels/.rels', text_rels)
 
-    for sheet in worksheets:
-            # StringIO will keep on appending each worksheet to the same StringIO
-            if '_io.StringIO' not in str(type(fn)):
-                new_fn = fn + '_' + sheet + '.csv'
+        text_app = writexl_new_app_text(db)
+        zf.writestr('docProps/app.xml', text_app)
 
-            try:
-                if '_io.StringIO' not in str(type(fn)):
-                    f = open(new_fn, 'w')
-                else:
-                    f = fn
-            except PermissionError:
-                # file is open, adjust name and print warning
-                print('pylightxl - Cannot write to existing file <{}> that is open in excel.'.format(new_fn))
-                print('     New temporary file was written to <{}>'.format('new_' + new_fn))
-                new_fn = 'new_' + new_fn
-                f = open(new_fn, 'w')
-            finally:
-                max_row, max_col = db.ws(sheet).size
-                for r in range(1, max_row + 1):
-                    row = []
-                    for c in range(1, max_col + 1):
-                        val = db.ws(sheet).index(r, c)
-                        row.append(str(val))
+        text_core = writexl_new_core_text(db)
+        zf.writestr('docProps/core.xml', text_core)
 
-                    if sys.version_info[0] < 3:
-                        text = unicode(delimiter.join(row)).replace('\n','')
-                        f.write(text)
-                        f.write(unicode('\n'))
-                    else:
-                        text = delimiter.join(row).replace('\n','')
-                        f.write(text)
-                        f.write('\n')
-                # dont close StringIO thats passed in by the user
-                if '_io.StringIO' not in str(type(fn)):
-                    f.close()
+        bin_workbook = writexl_xlsb_workbook_bin(db)
+        zf.writestr('xl/workbook.bin', bin_workbook)
 
+        bin_styles = writexl_xlsb_styles_bin(db)
+        zf.writestr('xl/styles.bin', bin_styles)
 
-########################################################################################################
-# SEC-05: DATABASE FUNCTIONS
-########################################################################################################
+        formulas = False
+        for shID, sheet_name in enumerate(db.ws_names, 1):
+            bin_worksheet, ws_formulas = writexl_xlsb_worksheet_bin(db, sheet_name, sharedStrings)
+            zf.writestr('xl/worksheets/sheet{shID}.bin'.format(shID=shID), bin_worksheet)
+            formulas = formulas or ws_formulas
 
+        if sharedStrings:
+            bin_sharedStrings = writexl_xlsb_sharedStrings_bin(sharedStrings)
+            zf.writestr('xl/sharedStrings.bin', bin_sharedStrings)
 
-class Database:
+        # this has to come after xlsb_worksheet_bin for sharedStrings to be populated
+        text_workbookrels = writexl_xlsb_workbookrels_text(db, sharedStrings)
+        zf.writestr('xl/_rels/workbook.bin.rels', text_workbookrels)
 
-    def __init__(self):
-        # keys are worksheet names, values are Workbook classes
+        text_content_types = writexl_xlsb_content_types_text(db, sharedStrings)
+        zf.writestr('[Content_Types].xml', text_content_types)
+
+    if formulas:
+        warnings.warn('pylightxl - writexl does not support formulas in .xlsb files, '
+                      'formula cells were written with their cell value.', UserWarning)
+
+
+def writexl_xlsb_workbookrels_text(db, sharedStrings):
+    # type: (Database, Dict[str, int]) -> str
+    """Returns /xl/_rels/workbook.bin.rels text
+
+    :param db: database contains sheetnames, and their data
+    :type db: Database
+    :param sharedStrings: sharedStrings table of the workbook {text: index}
+    :type sharedStrings: Dict[str, int]
+    :return: /xl/_rels/workbook.bin.rels text
+    :rtype: str
+    """
+
+    # location: /xl/_rels/workbook.bin.rels
+    # inserts: many_tag_sheets, tag_sharedStrings, tag_styles
+    xml_base =  '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n' \
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\r\n' \
+                    '{many_tag_sheets}\r\n' \
+                    '{tag_sharedStrings}\r\n' \
+                    '{tag_styles}\r\n' \
+                '</Relationships>'
+
+    xml_tag_sheet = '<Relationship Target="worksheets/sheet{sheet_num}.bin" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Id="rId{sheet_num}"/>\r\n'
+
+    xml_tag_sharedStrings = '<Relationship Target="sharedStrings.bin" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Id="rId{ID}"/>\r\n'
+
+    xml_tag_styles = '<Relationship Target="styles.bin" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Id="rId{ID}"/>\r\n'
+
+    many_tag_sheets = ''
+    for wsID, _ in enumerate(db.ws_names, 1):
+        many_tag_sheets += xml_tag_sheet.format(sheet_num=wsID)
+    if sharedStrings:
+        # +1 to increment +1 from the last sheet ID
+        tag_sharedStrings = xml_tag_sharedStrings.format(ID=len(db.ws_names)+1)
+    else:
+        tag_sharedStrings = ''
+    tag_styles = xml_tag_styles.format(ID=len(db.ws_names)+2)
+
+    rv = xml_base.format(many_tag_sheets=many_tag_sheets,
+                         tag_sharedStrings=tag_sharedStrings,
+                         tag_styles=tag_styles)
+    return rv
+
+
+def writexl_xlsb_content_types_text(db, sharedStrings):
+    # type: (Database, Dict[str, int]) -> str
+    """Returns [Content_Types].xml text of a binary workbook
+
+    :param db: database contains sheetnames, and their data
+    :type db: Database
+    :param sharedStrings: sharedStrings table of the workbook {text: index}
+    :type sharedStrings: Dict[str, int]
+    :return: [Content_Types].xml text
+    :rtype: str
+    """
+
+    # location: [Content_Types].xml
+    # inserts: many_tag_sheets, tag_sharedStrings
+    #  note the .bin default is the workbook content type
+    xml_base =  '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n' \
+                '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">\r\n' \
+                    '<Default Extension="bin" ContentType="application/vnd.ms-excel.sheet.binary.macroEnabled.main"/>\r\n' \
+                    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\r\n' \
+                    '<Default Extension="xml" ContentType="application/xml"/>\r\n' \
+                    '<Override PartName="/xl/styles.bin" ContentType="application/vnd.ms-excel.styles"/>\r\n' \
+                    '{many_tag_sheets}\r\n' \
+                    '{tag_sharedStrings}\r\n' \
+                    '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>\r\n' \
+                    '<Override PartName="/docProps/app.xml" ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>\r\n' \
+                '</Types>'
+
+    xml_tag_sheet = '<Override PartName="/xl/worksheets/sheet{sheet_id}.bin" ContentType="application/vnd.ms-excel.worksheet"/>\r\n'
+
+    xml_tag_sharedStrings = '<Override PartName="/xl/sharedStrings.bin" ContentType="application/vnd.ms-excel.sharedStrings"/>\r\n'
+
+    many_tag_sheets = ''
+    for sheet_id, _ in enumerate(db.ws_names, 1):
+        many_tag_sheets += xml_tag_sheet.format(sheet_id=sheet_id)
+
+    if sharedStrings:
+        tag_sharedStrings = xml_tag_sharedStrings
+    else:
+        tag_sharedStrings = ''
+
+    rv = xml_base.format(many_tag_sheets=many_tag_sheets,
+                         tag_sharedStrings=tag_sharedStrings)
+
+    return rv
+
+
+def writexl_xlsb_workbook_bin(db):
+    # type: (Database) -> bytes
+    """Returns xl/workbook.bin records (sheets and named ranges)
+
+    :param db: database contains sheetnames, and their data
+    :type db: Database
+    :return: xl/workbook.bin
+    :rtype: bytes
+    """
+
+    ws_names = db.ws_names
+
+    records = [utility_biff12_record(XLSB_BEGINBOOK),
+               # flags (4), dwThemeVersion (4), strName
+               utility_biff12_record(XLSB_WBPROP, struct.pack('<II', 0, 166925) + utility_biff12_pack_string('')),
+               utility_biff12_record(XLSB_BEGINBUNDLESHS)]
+
+    for shID, sheet_name in enumerate(ws_names, 1):
+        # hsState (4), iTabID (4), strRelID, strName
+        records.append(utility_biff12_record(XLSB_BUNDLESH, struct.pack('<II', 0, shID) +
+                                             utility_biff12_pack_string('rId{}'.format(shID)) +
+                                             utility_biff12_pack_string(sheet_name)))
+
+    records.append(utility_biff12_record(XLSB_ENDBUNDLESHS))
+
+    if db.nr_names:
+        # named range formulas refer to worksheets through the extern sheet table, one entry per worksheet
+        #   cXti (4), then iSupBook (4), itabFirst (4), itabLast (4) per entry
+        xti = struct.pack('<I', len(ws_names)) + b''.join([struct.pack('<Iii', 0, i, i) for i in range(len(ws_names))])
+        records += [utility_biff12_record(XLSB_BEGINEXTERNALS),
+                    utility_biff12_record(XLSB_SUPSELF),
+                    utility_biff12_record(XLSB_EXTERNSHEET, xti),
+                    utility_biff12_record(XLSB_ENDEXTERNALS)]
+
+        for name, full_address in db.nr_names.items():
+            ws, address = full_address.rsplit('!', 1)
+            ixti = ws_names.index(ws)
+            if ':' in address:
+                row_first, col_first = utility_address2index(address.split(':')[0])
+                row_last, col_last = utility_address2index(address.split(':')[1])
+                # PtgArea3d: ixti (2), rowFirst (4), rowLast (4), colFirst (2), colLast (2)
+                rgce = struct.pack('<BHIIHH', 0x3B, ixti, row_first - 1, row_last - 1, col_first - 1, col_last - 1)
+            else:
+                row, col = utility_address2index(address)
+                # PtgRef3d: ixti (2), row (4), col (2)
+                rgce = struct.pack('<BHIH', 0x3A, ixti, row - 1, col - 1)
+            # flags (4), chKey (1), itab (4), name, cce (4), rgce, cb (4), comment
+            records.append(utility_biff12_record(XLSB_NAME, struct.pack('<IBI', 0, 0, 0xFFFFFFFF) +
+                                                 utility_biff12_pack_string(name) +
+                                                 struct.pack('<I', len(rgce)) + rgce +
+                                                 struct.pack('<II', 0, 0xFFFFFFFF)))
+
+    records.append(utility_biff12_record(XLSB_ENDBOOK))
+
+    return b''.join(records)
+
+
+def writexl_xlsb_styles_bin(db):
+    # type: (Database) -> bytes
+    """Returns xl/styles.bin records, the default cell style followed by the date/time cell styles of
+    WRITEXL_DATETIME_STYLES, see writexl_new_styles_text
+
+    :param db: database contains sheetnames, and their data
+    :type db: Database
+    :return: xl/styles.bin
+    :rtype: bytes
+    """
+
+    # brtColor: xColorType theme (3) + fValidRGB, index, nTintAndShade (2), rgba
+    color = struct.pack('<BBhBBBB', 0x07, 1, 0, 0, 0, 0, 0xFF)
+    # dyHeight (2) 11pt, grbit (2), bls (2) normal weight, sss (2), uls (1), bFamily (1), bCharSet (1), unused (1),
+    #   brtColor, bFontScheme (1) minor, name
+    font = struct.pack('<HHHHBBBB', 220, 0, 400, 0, 0, 2, 0, 0) + color + struct.pack('<B', 2) + \
+        utility_biff12_pack_string('Calibri')
+    # fls (4), brtColorFore, brtColorBack, iGradientType (4), xnumDegree, xnumFillToLeft/Right/Top/Bottom (8 each),
+    #   cNumStop (4)
+    fills = [struct.pack('<I', fls) + color + color + struct.pack('<Iddddd', 0, 0, 0, 0, 0, 0) + struct.pack('<I', 0)
+             for fls in [0, 17]]
+    # flags (1), blxfTop/Bottom/Left/Right/Diag: dg (1), reserved (1), brtColor (8) of an automatic color
+    border = b'\x00' + b'\x00' * 50
+    # xf: ixfeParent (2), iFmt (2), iFont (2), iFill (2), ixBorder (2), trot (1), indent (1),
+    #   alignment/protection flags (2) bottom aligned and locked, xfGrbitAtr (2) fAtrNum when the format is set
+    xf_style = struct.pack('<HHHHHBBHH', 0xFFFF, 0, 0, 0, 0, 0, 0, 0x1010, 0)
+
+    numFmtIds = {'datetime': 22, 'date': 14, 'time': 21}
+    xfs = [struct.pack('<HHHHHBBHH', 0, 0, 0, 0, 0, 0, 0, 0x1010, 0)]
+    for kind in sorted(WRITEXL_DATETIME_STYLES, key=WRITEXL_DATETIME_STYLES.get):
+        xfs.append(struct.pack('<HHHHHBBHH', 0, numFmtIds[kind], 0, 0, 0, 0, 0, 0x1010, 1))
+
+    records = [utility_biff12_record(XLSB_BEGINSTYLESHEET),
+               utility_biff12_record(XLSB_BEGINFONTS, struct.pack('<I', 1)),
+               utility_biff12_record(XLSB_FONT, font),
+               utility_biff12_record(XLSB_ENDFONTS),
+               utility_biff12_record(XLSB_BEGINFILLS, struct.pack('<I', len(fills)))]
+    records += [utility_biff12_record(XLSB_FILL, fill) for fill in fills]
+    records += [utility_biff12_record(XLSB_ENDFILLS),
+                utility_biff12_record(XLSB_BEGINBORDERS, struct.pack('<I', 1)),
+                utility_biff12_record(XLSB_BORDER, border),
+                utility_biff12_record(XLSB_ENDBORDERS),
+                utility_biff12_record(XLSB_BEGINCELLSTYLEXFS, struct.pack('<I', 1)),
+                utility_biff12_record(XLSB_XF, xf_style),
+                utility_biff12_record(XLSB_ENDCELLSTYLEXFS),
+                utility_biff12_record(XLSB_BEGINCELLXFS, struct.pack('<I', len(xfs)))]
+    records += [utility_biff12_record(XLSB_XF, xf) for xf in xfs]
+    records += [utility_biff12_record(XLSB_ENDCELLXFS),
+                utility_biff12_record(XLSB_BEGINSTYLES, struct.pack('<I', 1)),
+                # ixf (4), grbitObj1 (2) fBuiltIn, iStyBuiltIn (1) Normal, iLevel (1), name
+                utility_biff12_record(XLSB_STYLE, struct.pack('<IHBB', 0, 1, 0, 0xFF) +
+                                      utility_biff12_pack_string('Normal')),
+                utility_biff12_record(XLSB_ENDSTYLES),
+                utility_biff12_record(XLSB_ENDSTYLESHEET)]
+
+    return b''.join(records)
+
+
+def writexl_xlsb_worksheet_bin(db, sheet_name, sharedStrings):
+    # type: (Database, str, Dict[str, int]) -> tuple
+    """Returns xl/worksheets/sheet#.bin records
+
+    :param db: database contains sheetnames, and their data
+    :type db: Database
+    :param sheet_name: worksheet name
+    :type sheet_name: str
+    :param sharedStrings: sharedStrings table of the workbook {text: index}, new strings are added to it
+    :type sharedStrings: Dict[str, int]
+    :return: (xl/worksheets/sheet#.bin, True if the worksheet contains formulas)
+    :rtype: tuple
+    """
+
+    ws = db.ws(sheet_name)
+    formulas = bool(ws._formulas)
+
+    # cells in row then column order
+    cells = ws._iter_cells()
+
+    maxrow, maxcol = ws.size
+    records = [utility_biff12_record(XLSB_BEGINSHEET),
+               # rwFirst (4), rwLast (4), colFirst (4), colLast (4)
+               utility_biff12_record(XLSB_WSDIM, struct.pack('<IIII', 0, max(maxrow - 1, 0), 0, max(maxcol - 1, 0))),
+               utility_biff12_record(XLSB_BEGINSHEETDATA)]
+
+    current_row = 0
+    for row, col, val in cells:
+        if val == '' or val is None:
+            continue
+
+        if row != current_row:
+            # rw (4), ixfe (4), miyRw (2), flags (3), ccolspan (4)
+            records.append(utility_biff12_record(XLSB_ROWHDR, struct.pack('<IIHBBBI', row - 1, 0, 300, 0, 0, 0, 0)))
+            current_row = row
+
+        # column (4), iStyleRef + flags (4), value
+        if type(val) is bool:
+            records.append(utility_biff12_record(XLSB_CELLBOOL, struct.pack('<IIB', col - 1, 0, val)))
+        elif isinstance(val, (int, long)) and -0x20000000 <= val < 0x20000000:
+            # 30 bit integers fit a RK number
+            records.append(utility_biff12_record(XLSB_CELLRK, struct.pack('<IIi', col - 1, 0, (val << 2) | 2)))
+        elif isinstance(val, (int, long, float)):
+            records.append(utility_biff12_record(XLSB_CELLREAL, struct.pack('<IId', col - 1, 0, val)))
+        elif isinstance(val, (date, datetime_time)):
+            # serial value with a date/time style, see writexl_xlsb_styles_bin
+            serial, kind = utility_serial_encode(val)
+            records.append(utility_biff12_record(XLSB_CELLREAL, struct.pack('<IId', col - 1,
+                                                                            WRITEXL_DATETIME_STYLES[kind], serial)))
+        else:
+            text = val if isinstance(val, (str, unicode)) else str(val)
+            if text not in sharedStrings:
+                sharedStrings[text] = len(sharedStrings)
+            records.append(utility_biff12_record(XLSB_CELLISST, struct.pack('<III', col - 1, 0, sharedStrings[text])))
+
+    records += [utility_biff12_record(XLSB_ENDSHEETDATA), utility_biff12_record(XLSB_ENDSHEET)]
+
+    return b''.join(records), formulas
+
+
+def writexl_xlsb_sharedStrings_bin(sharedStrings):
+    # type: (Dict[str, int]) -> bytes
+    """Returns xl/sharedStrings.bin records
+
+    :param sharedStrings: sharedStrings table of the workbook {text: index}
+    :type sharedStrings: Dict[str, int]
+    :return: xl/sharedStrings.bin
+    :rtype: bytes
+    """
+
+    # cstTotal (4), cstUnique (4)
+    records = [utility_biff12_record(XLSB_BEGINSST, struct.pack('<II', len(sharedStrings), len(sharedStrings)))]
+    for text, _ in sorted(sharedStrings.items(), key=lambda item: item[1]):
+        # flags (1), str
+        records.append(utility_biff12_record(XLSB_SSTITEM, b'\x00' + utility_biff12_pack_string(text)))
+    records.append(utility_biff12_record(XLSB_ENDSST))
+
+    return b''.join(records)
+
+
+def writecsv(db, fn, ws=(), delimiter=','):
+    # type: (Database, Union[str, pathlib.Path, io.StringIO], Union[str, tuple], str) -> None
+    """Writes a csv file from pylightxl database. For db that have more than one sheet, will write out,
+    multiple files with the sheetname tagged on the end (ex: "fn_sh2.csv")
+
+    :param db: pylightxl Database
+    :type db: Database
+    :param fn: output file name (without extension; ie. no '.csv')
+    :type fn: Union[str, pathlib.Path, io.StringIO]
+    :param ws: sheetname(s) to read into the database, if not specified - all sheets are read, defaults to ()
+    :type ws: Union[str, tuple], optional
+    :param delimiter: csv delimiter, defaults to ','
+    :type delimiter: str, optional
+    """
+
+    # test that file entered was a valid excel file
+    if 'pathlib' in str(type(fn)):
+        fn = str(fn)
+
+    if ws == ():
+        # write all worksheets
+        worksheets = db.ws_names
+    else:
+        # write only specified worksheets
+        worksheets = (ws,) if type(ws) is str else ws
+
+    for sheet in worksheets:
+            # StringIO will keep on appending each worksheet to the same StringIO
+            if '_io.StringIO' not in str(type(fn)):
+                new_fn = fn + '_' + sheet + '.csv'
+
+            try:
+                if '_io.StringIO' not in str(type(fn)):
+                    f = open(new_fn, 'w')
+                else:
+                    f = fn
+            except PermissionError:
+                # file is open, adjust name and print warning
+                print('pylightxl - Cannot write to existing file <{}> that is open in excel.'.format(new_fn))
+                print('     New temporary file was written to <{}>'.format('new_' + new_fn))
+                new_fn = 'new_' + new_fn
+                f = open(new_fn, 'w')
+            finally:
+                for row in db.ws(sheet).rows:
+                    row = [str(val) for val in row]
+
+                    if sys.version_info[0] < 3:
+                        text = unicode(delimiter.join(row)).replace('\n','')
+                        f.write(text)
+                        f.write(unicode('\n'))
+                    else:
+                        text = delimiter.join(row).replace('\n','')
+                        f.write(text)
+                        f.write('\n')
+                # dont close StringIO thats passed in by the user
+                if '_io.StringIO' not in str(type(fn)):
+                    f.close()
+
+
+########################################################################################################
+# SEC-05: DATABASE FUNCTIONS
+########################################################################################################
+
+
+class Database:
+
+    def __init__(self):
+        # keys are worksheet names, values are Workbook classes
         self._ws = {}
         self._sharedStrings = []
         # {order: ws}
@@ -1462,6 +3115,11 @@ class Database:
         # {unique_name: unique_address, ...}
         self._NamedRange = {}
 
+        # readxl file part fingerprints used by reloadxl to skip unchanged worksheets
+        # {'ws': tuple, 'datetimes': str, 'styles': crc, 'sharedStrings': crc, 'sst_crcs': array or dict,
+        #  'sheets': {ws: {'fingerprint': tuple, 'max_sst': int}}}
+        self._source = {}
+
     def __repr__(self):
         return 'pylightxl.Database'
 
@@ -1496,19 +3154,25 @@ class Database:
 
         return rv
 
-    def add_ws(self, ws, data=None):
-        # type: (str, dict) -> None
+    def add_ws(self, ws, data=None, columnar=False):
+        # type: (str, Union[dict, Worksheet], bool) -> None
         """Logs worksheet name and its data in the database
 
         :param ws: worksheet name
         :type ws: str
-        :param data: dictionary of worksheet cell values (ex: {'A1': {'v':10,'f':'','s':'', 'c': ''}, 'A2': {'v':20,'f':'','s':'', 'c': ''}}), defaults to None
-        :type data: dict, optional
+        :param data: dictionary of worksheet cell values (ex: {'A1': {'v':10,'f':'','s':'', 'c': ''}, 'A2': {'v':20,'f':'','s':'', 'c': ''}}),
+                     or a Worksheet that is added as is (ex: the result of Worksheet.groupby), defaults to None
+        :type data: Union[dict, Worksheet], optional
+        :param columnar: store the worksheet in typed columns, see ColumnarWorksheet, defaults to False
+        :type columnar: bool, optional
         """
 
-        if data is None:
-            data = {'A1': {'v': '', 'f': '', 's': '', 'c': ''}}
-        self._ws[ws] = Worksheet(data)
+        if isinstance(data, Worksheet):
+            self._ws[ws] = data
+        else:
+            if data is None:
+                data = {'A1': {'v': '', 'f': '', 's': '', 'c': ''}}
+            self._ws[ws] = ColumnarWorksheet(data) if columnar else Worksheet(data)
         if ws not in self._wsorder.values():
             self._wsorder[len(self._wsorder) + 1] = ws
 
@@ -1639,8 +3303,8 @@ class Database:
 
         return self._NamedRange
 
-    def nr(self, name, formula=False, output='v'):
-        # type: (str, bool, str) -> List[list]
+    def nr(self, name, formula=False, output='v', clip=False):
+        # type: (str, bool, str, bool) -> List[list]
         """Returns the contents of a name range in a nest list form [row][col]
 
         :param name: NamedRange name
@@ -1649,6 +3313,8 @@ class Database:
         :type formula: bool, optional
         :param output: output request "v" for value, "f" for formula, "c" for comment, defaults to 'v'
         :type output: str, optional
+        :param clip: clip entire row/col named ranges to the worksheet data, see Worksheet.range, defaults to False
+        :type clip: bool, optional
         :return: nest list form [row][col]
         :rtype: List[list]
         """
@@ -1670,7 +3336,7 @@ class Database:
             return [[]]
 
         ws, address = full_address.split('!')
-        return self.ws(ws).range(address, output=output)
+        return self.ws(ws).range(address, output=output, clip=clip)
 
     def nr_loc(self, name):
         # type: (str) -> List[str]
@@ -1712,12 +3378,31 @@ class Worksheet():
 
     def __init__(self, data=None):
         # type: (dict) -> None
-        """Takes a data dict of worksheet cell data (ex: {'A1': 1})
+        """Takes a data dict of worksheet cell data (ex: {'A1': {'v': 1, 'f': '', 's': '', 'c': ''}})
 
-        :param data: worksheet cell data (ex: {'A1': 1}), defaults to None
+        :param data: worksheet cell data (ex: {'A1': {'v': 1, 'f': '', 's': '', 'c': ''}}), defaults to None
         :type data: dict, optional
         """
-        self._data = data if data != None else {}
+
+        # cell values are stored per row by integer index, addresses are only converted at the api edge
+        # {row: {col: cell_val}}
+        self._data = {}
+        # column to rows index of the stored cells {col: array of rows}, rows are in insertion order
+        self._colrows = {}
+        # sparse side tables of the cells that have a formula/comment {(row, col): text}
+        self._formulas = {}
+        self._comments = {}
+        # key value hash indexes, see build_index {(axis, keyindexes): {key: row/col} or None when stale}
+        self._indexes = {}
+        # cached column statistics, see stats {col: {'count': ..., 'sum': ..., ...}}
+        self._stats = {}
+        if data:
+            for (row, col), cell in zip(utility_address2index_batch(data.keys()), data.values()):
+                self._store_value(row, col, cell['v'])
+                if cell.get('f'):
+                    self._formulas[(row, col)] = cell['f']
+                if cell.get('c'):
+                    self._comments[(row, col)] = cell['c']
         self.maxrow = 0
         self.maxcol = 0
         self._calc_size()
@@ -1733,24 +3418,175 @@ class Worksheet():
         :return: None (but this creates instance attributes maxrow/maxcol)
         """
 
-        if self._data != {}:
-            list_of_addresses = list(self._data.keys())
-
-            list_of_chars = []
-            list_of_nums = []
-            for address in list_of_addresses:
-                list_of_chars.append(''.join(filter(lambda x: x.isalpha(), address)))
-                list_of_nums.append(int(''.join(filter(lambda x: unicode(x).isnumeric(), address))))
-            self.maxrow = int(max(list_of_nums))
-            # if all chars are the same length
-            list_of_chars.sort(reverse=True)
-            # if chars are different length
-            list_of_chars.sort(key=len, reverse=True)
-            self.maxcol = utility_address2index(list_of_chars[0]+"1")[1]
+        rows = [row for row, cells in self._data.items() if cells]
+        if rows:
+            self.maxrow = max(rows)
+            self.maxcol = max([max(self._data[row]) for row in rows])
         else:
             self.maxrow = 0
             self.maxcol = 0
 
+    def _store(self, row, col, val, formula='', comment=''):
+        # type: (int, int, Union[int, float, str, bool], str, str) -> None
+        """Stores a cell at row/col (replacing its formula/comment) and grows the worksheet size"""
+
+        self._store_value(row, col, val)
+        if formula:
+            self._formulas[(row, col)] = formula
+        elif self._formulas:
+            self._formulas.pop((row, col), None)
+        if comment:
+            self._comments[(row, col)] = comment
+        elif self._comments:
+            self._comments.pop((row, col), None)
+        if self._stats:
+            self._stats.pop(col, None)
+        if self._indexes:
+            # mark indexes of the updated key col/row stale, as well as all indexes on a size change since
+            #  key lookups also match empty cells
+            grown = row > self.maxrow or col > self.maxcol
+            for axis, keys in self._indexes:
+                if grown or (col if axis == 'row' else row) in keys:
+                    self._indexes[(axis, keys)] = None
+        self.maxcol = col if col > self.maxcol else self.maxcol
+        self.maxrow = row if row > self.maxrow else self.maxrow
+
+    def _store_value(self, row, col, val):
+        # type: (int, int, Union[int, float, str, bool]) -> None
+        """Stores the value of a cell and indexes new cells by column, see _store"""
+
+        cells = self._data.get(row)
+        if cells is None:
+            self._data[row] = {col: val}
+        elif col in cells:
+            cells[col] = val
+            return
+        else:
+            cells[col] = val
+
+        try:
+            self._colrows[col].append(row)
+        except KeyError:
+            self._colrows[col] = array('i', [row])
+
+    def _store_row_values(self, row, col_start, values):
+        # type: (int, int, List[Union[int, float, str, bool]]) -> None
+        """Stores a list of values along row from col_start, see _store_rows"""
+
+        if row in self._data:
+            for col, val in enumerate(values, col_start):
+                self._store_value(row, col, val)
+            return
+
+        cols = range(col_start, col_start + len(values))
+        self._data[row] = dict(zip(cols, values))
+        colrows = self._colrows
+        for col in cols:
+            try:
+                colrows[col].append(row)
+            except KeyError:
+                colrows[col] = array('i', [row])
+
+    def _iter_cells(self):
+        # type: () -> Iterable[tuple]
+        """Yields (row, col, cell_val) of the stored cells in row then column order"""
+
+        for row in sorted(self._data):
+            cells = self._data[row]
+            for col in sorted(cells):
+                yield row, col, cells[col]
+
+    def _get(self, row, col, output):
+        # type: (int, int, str) -> Union[int, float, str, bool]
+        """Returns the requested output ("v", "f" or "c") of row/col, the empty cell value if nothing is stored.
+        A stored cell without a comment returns '' for "c"
+        """
+
+        cells = self._data.get(row)
+        if cells is None or col not in cells:
+            return self._emptycell
+        if output == 'v':
+            return cells[col]
+        elif output == 'f':
+            return '=' + self._formulas.get((row, col), '')
+        else:
+            return self._comments.get((row, col), '')
+
+    def _get_row(self, row, output, col_start, col_end):
+        # type: (int, str, int, int) -> List[Union[int, float, str, bool]]
+        """Returns the requested output of row from col_start to col_end (inclusive). Costs the number of
+        stored cells of the row (or of the span if it is narrower), empty cells are filled in as a block"""
+
+        cells = self._data.get(row)
+        if not cells:
+            return [self._emptycell] * (col_end - col_start + 1)
+        if output == 'v' and col_end - col_start < len(cells):
+            # span is narrower than the stored row, look up each cell directly
+            get = cells.get
+            empty = self._emptycell
+            return [get(c, empty) for c in range(col_start, col_end + 1)]
+
+        rv = [self._emptycell] * (col_end - col_start + 1)
+        if len(cells) > len(rv):
+            cols = [c for c in range(col_start, col_end + 1) if c in cells]
+        else:
+            cols = [c for c in cells if col_start <= c <= col_end]
+        for c in cols:
+            rv[c - col_start] = cells[c] if output == 'v' else self._get(row, c, output)
+
+        return rv
+
+    def _get_col(self, col, output, row_start, row_end):
+        # type: (int, str, int, int) -> List[Union[int, float, str, bool]]
+        """Returns the requested output of col from row_start to row_end (inclusive). Costs the number of
+        stored cells of the column (or of the span if it is narrower), empty cells are filled in as a block"""
+
+        rv = [self._emptycell] * (row_end - row_start + 1)
+        rows = self._colrows.get(col)
+        if not rows:
+            return rv
+
+        data = self._data
+        if len(rows) > len(rv):
+            if output == 'v':
+                # span is narrower than the stored column, look up each cell directly
+                get = data.get
+                empty = self._emptycell
+                no_cells = {}
+                return [get(r, no_cells).get(col, empty) for r in range(row_start, row_end + 1)]
+            rows = [r for r in range(row_start, row_end + 1) if r in data and col in data[r]]
+        for r in rows:
+            if row_start <= r <= row_end:
+                rv[r - row_start] = data[r][col] if output == 'v' else self._get(r, col, output)
+
+        return rv
+
+    def _col_cells(self, col, row_start, row_end):
+        # type: (int, int, int) -> Tuple[List[int], List[Union[int, float, str, bool]]]
+        """Returns (rows, values) of the stored cells of col from row_start to row_end (inclusive)"""
+
+        rows = self._colrows.get(col)
+        if not rows:
+            return [], []
+
+        data = self._data
+        if row_start <= 1 and row_end >= self.maxrow:
+            rows = rows.tolist()
+        elif len(rows) > row_end - row_start + 1:
+            rows = [r for r in range(row_start, row_end + 1) if r in data and col in data[r]]
+        else:
+            rows = [r for r in rows if row_start <= r <= row_end]
+
+        return rows, [data[r][col] for r in rows]
+
+    def _col_values(self, col, rows):
+        # type: (int, Iterable[int]) -> List[tuple]
+        """Returns (row, value) of the stored cells of col in rows"""
+
+        data = self._data
+        no_cells = {}
+        return [(r, data[r][col]) for r in rows if col in data.get(r, no_cells)]
+
     def set_emptycell(self, val):
         # type: (Union[int, float, str]) -> None
         """Custom definition for how pylightxl returns an empty cell
@@ -1760,6 +3596,8 @@ class Worksheet():
         """
 
         self._emptycell = val
+        # key lookups match empty cells by value
+        self._indexes = dict.fromkeys(self._indexes)
 
     @property
     def size(self):
@@ -1798,21 +3636,12 @@ class Worksheet():
                   'Please update code base to use "output" argument')
             output = 'f'
 
-        try:
-            if output == 'v':
-                rv = self._data[address]['v']
-            elif output == 'f':
-                rv = '=' + self._data[address]['f']
-            else:
-                rv = self._data[address]['c']
-        except KeyError:
-            # no data was parsed, return empty cell value
-            rv = self._emptycell
+        row, col = utility_address2index(address)
 
-        return rv
+        return self._get(row, col, output)
 
-    def range(self, address, formula=False, output='v'):
-        # type: (str, bool, str) -> List[List[Union[int, float, str, bool]]]
+    def range(self, address, formula=False, output='v', clip=False):
+        # type: (str, bool, str, bool) -> List[List[Union[int, float, str, bool]]]
         """Takes a range (ex: "A1:A2") and returns a nested list [row][col]
 
         :param address: cell range (ex: "A1:A2", or "A1")
@@ -1821,6 +3650,9 @@ class Worksheet():
         :type formula: bool, optional
         :param output: output request "v" for value, "f" for formula, "c" for comment, defaults to 'v'
         :type output: str, optional
+        :param clip: clip entire row/col ranges (ex: "A:C" or "1:3") to the size of the worksheet data instead of
+                     the full excel extent of 1048576 rows/16384 cols, defaults to False
+        :type clip: bool, optional
         :return: nested list [row][col] regardless if range is a single cell or a range
         :rtype: _type_
         """
@@ -1839,37 +3671,40 @@ class Worksheet():
             output = 'f'
 
         if ':' in address:
-            address_start, address_end = address.split(':')
-            # check for entire row/col address
-            if unicode(address_start).isnumeric() and unicode(address_end).isnumeric():
-                # 1:1 is row 1, 1:3 is rows 1-3
-                row_start, col_start = int(address_start), 1
-                row_end, col_end = int(address_end), MAX_XL_COLS
-            elif address_start.isalpha() and address_end.isalpha():
-                # A:A is col A, A:C is col A-C
-                row_start, col_start = 1, utility_columnletter2num(address_start)
-                row_end, col_end = MAX_XL_ROWS, utility_columnletter2num(address_end)
-            else:
-                row_start, col_start = utility_address2index(address_start)
-                row_end, col_end = utility_address2index(address_end)
+            row_start, col_start, row_end, col_end = self._range_bounds(address, clip)
 
             # +1 to include the end
             for n_row in range(row_start, row_end + 1):
-                # -1 to drop index count from excel (start start at 1 to python at 0)
-                # +1 to include the end
-                if col_end <= self.size[1]:
-                    row = self.row(n_row, output=output)[(col_start - 1):(col_end - 1 + 1)]
-                else:
-                    # add extra empty cells on since self.row will only return up to the size of ws data
-                    row = self.row(n_row, output=output)[col_start - 1:]
-                    while len(row) < col_end - (col_start - 1):
-                        row.append(self._emptycell)
-                rv.append(row)
+                rv.append(self._get_row(n_row, output, col_start, col_end))
         else:
             rv.append([self.address(address, output=output)])
 
         return rv
 
+    def _range_bounds(self, address, clip=False):
+        # type: (str, bool) -> Tuple[int, int, int, int]
+        """Returns (row_start, col_start, row_end, col_end) of a cell range (ex: "A1:B2", "A:B", "1:2" or "A1"),
+        see range for clip"""
+
+        address = address.replace('$', '')
+        if ':' not in address:
+            row, col = utility_address2index(address)
+            return row, col, row, col
+
+        address_start, address_end = address.split(':')
+        # check for entire row/col address
+        if unicode(address_start).isnumeric() and unicode(address_end).isnumeric():
+            # 1:1 is row 1, 1:3 is rows 1-3
+            return int(address_start), 1, int(address_end), self.maxcol if clip else MAX_XL_COLS
+        elif address_start.isalpha() and address_end.isalpha():
+            # A:A is col A, A:C is col A-C
+            return 1, utility_columnletter2num(address_start), self.maxrow if clip else MAX_XL_ROWS, \
+                utility_columnletter2num(address_end)
+        else:
+            row_start, col_start = utility_address2index(address_start)
+            row_end, col_end = utility_address2index(address_end)
+            return row_start, col_start, row_end, col_end
+
     def index(self, row, col, formula=False, output='v'):
         # type: (int, int, bool, str) -> Union[int, float, str, bool]
         """Takes an excel row and col starting at index 1 and returns the worksheet stored value
@@ -1886,7 +3721,7 @@ class Worksheet():
         :rtype: Union[int, float, str, bool]
         """
 
-        address = utility_index2address(row, col)
+        utility_check_index(row, col)
 
         output = output.lower()
         if output not in ['v', 'f', 'c']:
@@ -1898,7 +3733,7 @@ class Worksheet():
                   'Please update code base to use "output" argument')
             output = 'f'
 
-        return self.address(address, output=output)
+        return self._get(row, col, output)
 
     def update_index(self, row, col, val):
         # type: (int, int, Union[int, float, str, bool]) -> None
@@ -1912,15 +3747,13 @@ class Worksheet():
         :type val: Union[int, float, str, bool]
         """
 
-        address = utility_index2address(row, col)
-        self.maxcol = col if col > self.maxcol else self.maxcol
-        self.maxrow = row if row > self.maxrow else self.maxrow
+        utility_check_index(row, col)
         # log formulas under formulas and trim off the '='
         if type(val) is str and len(val) != 0 and val[0] == '=':
             # overwrite existing cell val to be empty (it will calc when excel is opened)
-            self._data.update({address: {'v': '', 'f': val[1:], 's': ''}})
+            self._store(row, col, '', val[1:])
         else:
-            self._data.update({address: {'v': val, 'f': '', 's': ''}})
+            self._store(row, col, val)
 
     def update_address(self, address, val):
         # type: (str, Union[int, float, str, bool]) -> None
@@ -1934,36 +3767,120 @@ class Worksheet():
 
         address = address.replace('$', '')
         row, col = utility_address2index(address)
-        self.maxcol = col if col > self.maxcol else self.maxcol
-        self.maxrow = row if row > self.maxrow else self.maxrow
-        # log formulas under formulas and trim off the '='
-        if type(val) is str and len(val) != 0 and val[0] == '=':
-            # overwrite existing cell val to be empty (it will calc when excel is opened)
-            self._data.update({address: {'v': '', 'f': val[1:], 's': ''}})
-        else:
-            self._data.update({address: {'v': val, 'f': '', 's': ''}})
+        self.update_index(row, col, val)
 
     def update_range(self, address, val):
-        # type: (str, Union[int, float, str, bool]) -> None
-        """Update worksheet data via address range with a single value
+        # type: (str, Union[int, float, str, bool, Iterable[Iterable[Union[int, float, str, bool]]]]) -> None
+        """Update worksheet data via address range with a single value, or with a nested list [row][col] of
+        values that is written starting at the top left cell of address
 
-        :param address: excel address (ex: "A1:B3")
+        :param address: excel address (ex: "A1:B3", or "A1" when writing a nested list of any size)
         :type address: str
-        :param val: cell value; equations are strings and must begin with "="
-        :type val: Union[int, float, str, bool]
+        :param val: cell value or nested list/iterable [row][col] of cell values; equations are strings and must
+                    begin with "="
+        :type val: Union[int, float, str, bool, Iterable[Iterable[Union[int, float, str, bool]]]]
         """
 
-        if ':' in address:
-            address_start, address_end = address.split(':')
-            row_start, col_start = utility_address2index(address_start)
-            row_end, col_end = utility_address2index(address_end)
-
-            # +1 to include the end
-            for n_row in range(row_start, row_end + 1):
-                for n_col in range(col_start, col_end + 1):
-                    self.update_index(n_row, n_col, val)
+        address = address.replace('$', '')
+        address_start, _, address_end = address.partition(':')
+        row_start, col_start = utility_address2index(address_start)
+        row_end, col_end = utility_address2index(address_end) if address_end else (None, None)
+
+        if type(val) is not str and type(val) is not unicode and hasattr(val, '__iter__'):
+            if row_end is not None:
+                val = list(val)
+            if type(val) is list:
+                # check the rows before writing any of them, other iterables are checked as they are written
+                for row, values in enumerate(val, row_start):
+                    utility_check_row(row, values)
+            if row_end is not None:
+                # a range bounds the values, check that they fit before writing any of them
+                val = [list(values) for values in val]
+                if len(val) > row_end - row_start + 1 or \
+                        max([len(values) for values in val] + [0]) > col_end - col_start + 1:
+                    raise UserWarning('pylightxl - update_range values do not fit in the range ({})'.format(address))
+            self._store_rows(row_start, col_start, val)
+        elif row_end is None:
+            self.update_index(row_start, col_start, val)
         else:
-            self.update_address(address, val)
+            width = col_end - col_start + 1
+            # +1 to include the end
+            self._store_rows(row_start, col_start, ([val] * width for _ in range(row_end - row_start + 1)))
+
+    def append_rows(self, rows):
+        # type: (Iterable[Iterable[Union[int, float, str, bool]]]) -> None
+        """Appends rows of values below the last row of the worksheet, starting in column "A"
+
+        :param rows: list/iterable of rows, each a list/iterable of cell values; equations are strings and must
+                     begin with "="
+        :type rows: Iterable[Iterable[Union[int, float, str, bool]]]
+        """
+
+        self._store_rows(self.maxrow + 1, 1, rows)
+
+    def write_column(self, col, values, row=1):
+        # type: (int, Iterable[Union[int, float, str, bool]], int) -> None
+        """Writes a list/iterable of values down a column
+
+        :param col: column index (start at 1 that corresponds to column "A")
+        :type col: int
+        :param values: list/iterable of cell values; equations are strings and must begin with "="
+        :type values: Iterable[Union[int, float, str, bool]]
+        :param row: row index of the first value, defaults to 1
+        :type row: int, optional
+        """
+
+        self._store_rows(row, col, ([val] for val in values))
+
+    def _store_rows(self, row_start, col_start, rows, raw=False):
+        # type: (int, int, Iterable[Iterable[Union[int, float, str, bool]]], bool) -> None
+        """Stores a nested iterable [row][col] of values from row_start/col_start (replacing formulas/comments
+        like update_index) with a single worksheet size and index update. raw values are stored as is, strings
+        that begin with "=" are not logged as formulas (ex: cell values copied from a worksheet)"""
+
+        utility_check_index(row_start, col_start)
+
+        formulas = self._formulas
+        comments = self._comments
+        row_end = 0
+        col_end = 0
+        for row, values in enumerate(rows, row_start):
+            if type(values) is not list:
+                utility_check_row(row, values)
+                values = list(values)
+            if not values:
+                continue
+            col = col_start + len(values) - 1
+            for table in [formulas, comments]:
+                if table:
+                    for n_col in range(col_start, col + 1):
+                        table.pop((row, n_col), None)
+            if not raw and str in set(map(type, values)):
+                # log formulas under formulas and trim off the '=', the cell val is overwritten to be empty
+                values = list(values)
+                for i, val in enumerate(values):
+                    if type(val) is str and val[:1] == '=':
+                        values[i] = ''
+                        if len(val) > 1:
+                            formulas[(row, col_start + i)] = val[1:]
+            self._store_row_values(row, col_start, values)
+            row_end = row
+            col_end = col if col > col_end else col_end
+        if not row_end:
+            return
+
+        if self._stats:
+            for col in range(col_start, col_end + 1):
+                self._stats.pop(col, None)
+        if self._indexes:
+            # see _store, indexes on a written key col/row are stale as well as all indexes on a size change
+            grown = row_end > self.maxrow or col_end > self.maxcol
+            for axis, keys in self._indexes:
+                start, end = (col_start, col_end) if axis == 'row' else (row_start, row_end)
+                if grown or [key for key in keys if start <= key <= end]:
+                    self._indexes[(axis, keys)] = None
+        self.maxcol = col_end if col_end > self.maxcol else self.maxcol
+        self.maxrow = row_end if row_end > self.maxrow else self.maxrow
 
     def row(self, row, formula=False, output='v'):
         # type: (int, bool, str) -> List[Union[int, float, str, bool]]
@@ -1979,8 +3896,6 @@ class Worksheet():
         :rtype: List[Union[int, float, str, bool]]
         """
 
-        rv = []
-
         output = output.lower()
         if output not in ['v', 'f', 'c']:
             raise UserWarning('pylightxl - incorrect row(output={output}) argument. '
@@ -1991,11 +3906,7 @@ class Worksheet():
                   'Please update code base to use "output" argument')
             output = 'f'
 
-        for c in range(1, self.maxcol + 1):
-            val = self.index(row, c, output=output)
-            rv.append(val)
-
-        return rv
+        return self._get_row(row, output, 1, self.maxcol)
 
     def col(self, col, formula=False, output='v'):
         # type: (int, bool, str) -> List[Union[int, float, str, bool]]
@@ -2011,8 +3922,6 @@ class Worksheet():
         :rtype: List[Union[int, float, str, bool]]
         """
 
-        rv = []
-
         output = output.lower()
         if output not in ['v', 'f', 'c']:
             raise UserWarning('pylightxl - incorrect col(output={output}) argument. '
@@ -2023,87 +3932,203 @@ class Worksheet():
                   'Please update code base to use "output" argument')
             output = 'f'
 
-        for r in range(1, self.maxrow + 1):
-            val = self.index(r, col, output=output)
-            rv.append(val)
-
-        return rv
+        return self._get_col(col, output, 1, self.maxrow)
 
     @property
     def rows(self):
         # type: () -> Iterable[List[Union[int, float, str, bool]]]
-        """Returns a list of rows that can be iterated through
+        """Returns a generator of rows that can be iterated through, see iter_rows
 
-        :return: list of rows-lists (ex: [[11,12,13],[21,22,23]] for 2 rows with 3 columns of data
+        :return: generator of rows-lists (ex: [[11,12,13],[21,22,23]] for 2 rows with 3 columns of data
         :rtype: Iterable[List[Union[int, float, str, bool]]]
         """
 
-        rv = []
-
-        for r in range(1, self.maxrow + 1):
-            rv.append(self.row(r))
-
-        return iter(rv)
+        return self.iter_rows()
 
     @property
     def cols(self):
         # type: () -> Iterable[List[Union[int, float, str, bool]]]
-        """Returns a list of cols that can be iterated through
+        """Returns a generator of cols that can be iterated through, see iter_cols
 
-        :return: list of cols-lists (ex: [[11,21],[12,22],[13,23]] for 2 rows with 3 columns of data
+        :return: generator of cols-lists (ex: [[11,21],[12,22],[13,23]] for 2 rows with 3 columns of data
         :rtype: Iterable[List[Union[int, float, str, bool]]]
         """
 
-        rv = []
+        return self.iter_cols()
+
+    def iter_rows(self, row_start=1, row_end=None, output='v'):
+        # type: (int, int, str) -> Iterable[List[Union[int, float, str, bool]]]
+        """Returns a generator that builds one row at a time (each row spans all columns of the worksheet)
 
-        for c in range(1, self.maxcol + 1):
-            rv.append(self.col(c))
+        :param row_start: first row (starting at 1), defaults to 1
+        :type row_start: int, optional
+        :param row_end: last row (inclusive), defaults to None for the last row of the worksheet
+        :type row_end: int, optional
+        :param output: output request "v" for value, "f" for formula, "c" for comment, defaults to 'v'
+        :type output: str, optional
+        :return: generator of rows-lists
+        :rtype: Iterable[List[Union[int, float, str, bool]]]
+        """
+
+        output = output.lower()
+        if output not in ['v', 'f', 'c']:
+            raise UserWarning('pylightxl - incorrect iter_rows(output={output}) argument. '
+                              'Valid options = "v", "f", "c"'.format(output=output))
+
+        row_end = self.maxrow if row_end is None else row_end
+        maxcol = self.maxcol
 
-        return iter(rv)
+        return (self._get_row(r, output, 1, maxcol) for r in range(row_start, row_end + 1))
+
+    def iter_cols(self, col_start=1, col_end=None, output='v'):
+        # type: (int, int, str) -> Iterable[List[Union[int, float, str, bool]]]
+        """Returns a generator that builds one column at a time (each column spans all rows of the worksheet)
+
+        :param col_start: first column (starting at 1), defaults to 1
+        :type col_start: int, optional
+        :param col_end: last column (inclusive), defaults to None for the last column of the worksheet
+        :type col_end: int, optional
+        :param output: output request "v" for value, "f" for formula, "c" for comment, defaults to 'v'
+        :type output: str, optional
+        :return: generator of cols-lists
+        :rtype: Iterable[List[Union[int, float, str, bool]]]
+        """
+
+        output = output.lower()
+        if output not in ['v', 'f', 'c']:
+            raise UserWarning('pylightxl - incorrect iter_cols(output={output}) argument. '
+                              'Valid options = "v", "f", "c"'.format(output=output))
+
+        col_end = self.maxcol if col_end is None else col_end
+        maxrow = self.maxrow
+
+        return (self._get_col(c, output, 1, maxrow) for c in range(col_start, col_end + 1))
 
     def keycol(self, key, keyindex=1):
-        # type: (Union[str,int,float,bool],int) -> List[Union[str,int,float,bool]]
+        # type: (Union[str,int,float,bool,tuple],Union[int,List[int]]) -> List[Union[str,int,float,bool]]
         """Takes a column key value (value of any cell within keyindex row) and returns the entire column,
-        no match returns an empty list
+        no match returns an empty list. Uses the hash index of keyindex if one was built, see build_index
 
-        :param key: any cell value within keyindex row (type sensitive)
-        :type key: Union[str,int,float,bool]
-        :param keyindex: option keyrow override. Must be >0 and smaller than worksheet size, defaults to 1
-        :type keyindex: int, optional
+        :param key: any cell value within keyindex row (type sensitive), a tuple of values for a composite keyindex
+        :type key: Union[str,int,float,bool,tuple]
+        :param keyindex: option keyrow override. Must be >0 and smaller than worksheet size,
+                         a list of rows for a composite key, defaults to 1
+        :type keyindex: Union[int,List[int]], optional
         :return: list of the entire matched key column data (only first match is returned)
         :rtype: List[Union[str,int,float,bool]]
         """
 
-        if not keyindex > 0 and not keyindex <= self.size[0]:
-            raise UserWarning('pylightxl - keyindex ({}) entered must be >0 and <= worksheet size ({}.'.format(keyindex,self.size))
+        keys = tuple(keyindex) if type(keyindex) in [list, tuple] else (keyindex,)
+        for keyindex in keys:
+            if not keyindex > 0 and not keyindex <= self.size[0]:
+                raise UserWarning('pylightxl - keyindex ({}) entered must be >0 and <= worksheet size ({}.'.format(keyindex,self.size))
 
         # find first key match, get its column index and return col list
-        for col_i in range(1, self.size[1] + 1):
-            if key == self.index(keyindex, col_i):
-                return self.col(col_i)
-        return []
+        col_i = self._find_key(key, keys, 'col')
+        return self.col(col_i) if col_i else []
 
     def keyrow(self, key, keyindex=1):
-        # type: (Union[str,int,float,bool],int) -> List[Union[str,int,float,bool]]
+        # type: (Union[str,int,float,bool,tuple],Union[int,List[int]]) -> List[Union[str,int,float,bool]]
         """Takes a row key value (value of any cell within keyindex col) and returns the entire row,
-        no match returns an empty list
+        no match returns an empty list. Uses the hash index of keyindex if one was built, see build_index
 
-        :param key: any cell value within keyindex col (type sensitive)
-        :type key: Union[str,int,float,bool]
-        :param keyindex: option keyrow override. Must be >0 and smaller than worksheet size, defaults to 1
-        :type keyindex: int, optional
+        :param key: any cell value within keyindex col (type sensitive), a tuple of values for a composite keyindex
+        :type key: Union[str,int,float,bool,tuple]
+        :param keyindex: option keyrow override. Must be >0 and smaller than worksheet size,
+                         a list of cols for a composite key, defaults to 1
+        :type keyindex: Union[int,List[int]], optional
         :return: list of the entire matched key row data (only first match is returned)
         :rtype: List[Union[str,int,float,bool]]
         """
 
-        if not keyindex > 0 and not keyindex <= self.size[1]:
-            raise UserWarning('pylightxl - keyindex ({}) entered must be >0 and <= worksheet size ({}.'.format(keyindex,self.size))
+        keys = tuple(keyindex) if type(keyindex) in [list, tuple] else (keyindex,)
+        for keyindex in keys:
+            if not keyindex > 0 and not keyindex <= self.size[1]:
+                raise UserWarning('pylightxl - keyindex ({}) entered must be >0 and <= worksheet size ({}.'.format(keyindex,self.size))
+
+        # find first key match, get its row index and return row list
+        row_i = self._find_key(key, keys, 'row')
+        return self.row(row_i) if row_i else []
+
+    def build_index(self, keyindex=1, axis='row'):
+        # type: (Union[int,List[int]], str) -> None
+        """Builds a hash index of key values to their rows (axis="row", key values of col(s) keyindex,
+        used by keyrow and Worksheet.where) or columns (axis="col", key values of row(s) keyindex, used by keycol).
+        Lookups then cost O(1) instead of a scan. Updates to the worksheet mark the index stale and it is rebuilt
+        on the next lookup
+
+        :param keyindex: key col (axis="row") or key row (axis="col"), a list of them builds a composite key
+                         that is looked up with a tuple of values, defaults to 1
+        :type keyindex: Union[int,List[int]], optional
+        :param axis: "row" to index rows for keyrow, "col" to index cols for keycol, defaults to 'row'
+        :type axis: str, optional
+        """
+
+        if axis not in ['row', 'col']:
+            raise UserWarning('pylightxl - incorrect build_index(axis={axis}) argument. '
+                              'Valid options = "row", "col"'.format(axis=axis))
+
+        keys = tuple(keyindex) if type(keyindex) in [list, tuple] else (keyindex,)
+        self._indexes[(axis, keys)] = self._key_index(keys, axis)
 
-        # find first key match, get its row index and return col list
-        for row_i in range(1, self.size[0] + 1):
-            if key == self.index(row_i, keyindex):
-                return self.row(row_i)
-        return []
+    def _key_index(self, keys, axis):
+        # type: (tuple, str) -> dict
+        """Returns {key value: row/col} of key col(s)/row(s), composite keys are tuples. Key values that repeat
+        map to a list of their rows/cols in ascending order"""
+
+        if axis == 'row':
+            lines = [self._get_col(k, 'v', 1, self.maxrow) for k in keys]
+        else:
+            lines = [self._get_row(k, 'v', 1, self.maxcol) for k in keys]
+        values = lines[0] if len(lines) == 1 else zip(*lines)
+
+        index = {}
+        for i, value in enumerate(values, 1):
+            pos = index.get(value)
+            if pos is None:
+                index[value] = i
+            elif type(pos) is list:
+                pos.append(i)
+            else:
+                index[value] = [pos, i]
+
+        return index
+
+    def _find_key(self, key, keys, axis):
+        # type: (Union[str,int,float,bool,tuple], tuple, str) -> int
+        """Returns the first row/col whose key col(s)/row(s) match key, 0 if there is no match"""
+
+        if len(keys) > 1:
+            key = tuple(key)
+
+        if (axis, keys) in self._indexes:
+            index = self._indexes[(axis, keys)]
+            if index is None:
+                # stale, rebuild
+                index = self._indexes[(axis, keys)] = self._key_index(keys, axis)
+            pos = index.get(key, 0)
+            return pos[0] if type(pos) is list else pos
+
+        # no index, scan up to the first match
+        if len(keys) == 1:
+            if axis == 'row':
+                for i in range(1, self.maxrow + 1):
+                    if key == self._get(i, keys[0], 'v'):
+                        return i
+            else:
+                for i in range(1, self.maxcol + 1):
+                    if key == self._get(keys[0], i, 'v'):
+                        return i
+            return 0
+
+        if axis == 'row':
+            lines = [self._get_col(k, 'v', 1, self.maxrow) for k in keys]
+        else:
+            lines = [self._get_row(k, 'v', 1, self.maxcol) for k in keys]
+        try:
+            return list(zip(*lines)).index(key) + 1
+        except ValueError:
+            return 0
 
     def ssd(self, keyrows='KEYROWS', keycols='KEYCOLS'):
         # type: (str, str) -> List[Dict[str,list]]
@@ -2121,30 +4146,30 @@ class Worksheet():
         :rtype: List[Dict[str,list]]
         """
 
-        # find the index of keyrow(s) and keycol(s) plural if there are multiple datasets - this is a fast loop downselect
-        kr_colIDs = [colID for colID, col in enumerate(self.cols, 1) if keyrows in col or keyrows + keycols in col or keycols + keyrows in col]
-        kc_rowIDs = [rowID for rowID, row in enumerate(self.rows, 1) if keycols in row or keyrows + keycols in row or keycols + keyrows in row]
-
-        # look for duplicate key flags within rows/cols - this is a slower loop
-        temp = []
-        for row_id in range(1, self.maxrow):
-            for col_id in kr_colIDs:
-                cell = self.index(row_id, col_id)
-                if cell != '' and type(cell) is str and keyrows in cell:
-                    temp.append([row_id, col_id])
-        kr_indexIDs = temp
-
-        # for col_id in kr_colIDs:
-        #     for row_id, cell in enumerate(self.col(col_id), 1):
-        #         if cell != '' and type(cell) is str and keyrows in cell:
-        #             temp.append([row_id, col_id])
-
-        temp = []
-        for row_id in kc_rowIDs:
-            for col_id, cell in enumerate(self.row(row_id), 1):
-                if cell != '' and type(cell) is str and keycols in cell:
-                    temp.append([row_id, col_id])
-        kc_indexIDs = temp
+        kr_flags = [keyrows, keyrows + keycols, keycols + keyrows]
+        kc_flags = [keycols, keyrows + keycols, keycols + keyrows]
+
+        # single pass over the stored cells (row then column order) to find the key flags
+        kr_colIDs = set()
+        kc_rowIDs = set()
+        kr_cells = []
+        kc_cells = []
+        for row_id, col_id, cell in self._iter_cells():
+            if type(cell) is not str or (keyrows not in cell and keycols not in cell):
+                continue
+            if cell in kr_flags:
+                kr_colIDs.add(col_id)
+            if cell in kc_flags:
+                kc_rowIDs.add(row_id)
+            if keyrows in cell:
+                kr_cells.append([row_id, col_id])
+            if keycols in cell:
+                kc_cells.append([row_id, col_id])
+
+        # a flag is only a table start if its col/row holds an exact flag (a keyrows flag on the last row has no data)
+        kr_indexIDs = [[row_id, col_id] for row_id, col_id in kr_cells
+                       if col_id in kr_colIDs and row_id < self.maxrow]
+        kc_indexIDs = [[row_id, col_id] for row_id, col_id in kc_cells if row_id in kc_rowIDs]
 
         if len(kr_indexIDs) != len(kc_indexIDs):
             raise UserWarning('pylightxl - keyrows != keycols most likely due to missing keyword '
@@ -2152,41 +4177,1010 @@ class Worksheet():
 
         # datas structure: [{'keycols': ..., 'keyrows': ..., 'data'},...]
         datas = []
-        dataset_i = 0
-        for kr_indexID, kc_indexID in zip(kr_indexIDs, kc_indexIDs):
+        for (kr_row, kr_col), (kc_row, kc_col) in zip(kr_indexIDs, kc_indexIDs):
 
-            r, c = 0, 1
-
-            datas.append({'keyrows': [], 'keycols': [], 'data': []})
-
-            # pull the column for keycol_ID
-            kr_header = self.col(kr_indexID[c])[kr_indexID[r]:]
-            # find the end for column header (by looking for empty cell)
+            # slice the header below the keyrows flag and right of the keycols flag up to the first empty cell
+            kr_header = self._get_col(kr_col, 'v', kr_row + 1, self.maxrow)
             try:
-                end_col_index = kr_header.index('')
+                kr_end = kr_header.index('')
             except ValueError:
-                end_col_index = self.maxrow - kr_indexID[r]
-            kr_end = end_col_index
+                kr_end = len(kr_header)
 
-            # pull the row for keyrow_ID
-            kc_header = self.row(kc_indexID[r])[kc_indexID[c]:]
-            # find the end for column header (by looking for empty cell)
+            kc_header = self._get_row(kc_row, 'v', kc_col + 1, self.maxcol)
             try:
-                end_row_index = kc_header.index('')
+                kc_end = kc_header.index('')
             except ValueError:
-                end_row_index = self.maxrow - kc_indexID[c]
-            kc_end = end_row_index
-
-            # truncate headers down
-            datas[dataset_i]['keyrows'] = kr_header[:kr_end]
-            datas[dataset_i]['keycols'] = kc_header[:kc_end]
+                # keycols without an empty cell end are bound by maxrow, kept as is for backwards compatibility
+                kc_end = self.maxrow - kc_col
 
-            for row_i in range(kr_indexID[r] + 1, kr_indexID[r] + kr_end + 1):
-                datas[dataset_i]['data'].append(self.row(row_i)[kc_indexID[c]:kc_indexID[c] + kc_end])
-            dataset_i += 1
+            datas.append({'keyrows': kr_header[:kr_end],
+                          'keycols': kc_header[:kc_end],
+                          'data': [self._get_row(row_i, 'v', kc_col + 1, min(kc_col + kc_end, self.maxcol))
+                                   for row_i in range(kr_row + 1, kr_row + kr_end + 1)]})
 
         return datas
 
+    def to_numpy(self, address=None, dtype=None, header=False, fill=None):
+        # type: (str, Any, bool, Any) -> Any
+        """Returns the cell values of a range as a 2-D numpy array, or as a numpy record array with one field per
+        column. The array is filled column by column from the stored cells only.
+        numpy is imported on demand, it is not a dependency of pylightxl
+
+        :param address: cell range (ex: "A1:C10" or "A:C"), defaults to None for the whole worksheet
+        :type address: str, optional
+        :param dtype: numpy dtype of the array, or a structured dtype with one field per column to return a record
+                      array, defaults to None that infers int64/float64 for numeric cells, bool or otherwise object
+        :type dtype: numpy.dtype, optional
+        :param header: the first row of the range holds the field names of a record array
+                       (field dtypes are inferred per column unless dtype is given), defaults to False
+        :type header: bool, optional
+        :param fill: value of empty cells, defaults to None that fills nan for float arrays, 0 for int/bool arrays
+                     and the worksheet empty cell value otherwise. Int/bool columns with empty cells are inferred
+                     as float/object when fill is None
+        :type fill: Any, optional
+        :return: numpy.ndarray [row][col] or numpy.recarray
+        :rtype: numpy.ndarray
+        """
+
+        np = utility_import_numpy()
+
+        if address is None:
+            row_start, col_start, row_end, col_end = 1, 1, self.maxrow, self.maxcol
+        else:
+            row_start, col_start, row_end, col_end = self._range_bounds(address, clip=True)
+
+        names = None
+        if header:
+            names = [str(name) if name != '' else 'f{}'.format(i)
+                     for i, name in enumerate(self._get_row(row_start, 'v', col_start, col_end))]
+            row_start += 1
+        nrows = max(row_end - row_start + 1, 0)
+
+        # single pass over the stored cells of each column: rows, values and the inferred kind of the column
+        columns = []
+        for col in range(col_start, col_end + 1):
+            rows, values = self._col_cells(col, row_start, row_end)
+            if '' in values:
+                # empty string values are empty cells
+                rows = [r for r, val in zip(rows, values) if val != '']
+                values = [val for val in values if val != '']
+            kind = utility_numpy_kind(set(map(type, values)), len(values) < nrows and fill is None)
+            # keep the column as compact arrays until the dtype of the result is known
+            rows = np.array(rows, dtype=np.intp) - row_start
+            if len(rows) == nrows and (rows[1:] > rows[:-1]).all():
+                # every row is stored in order
+                rows = slice(None)
+            columns.append((rows, np.array(values, dtype=kind or 'O'), kind))
+
+        if dtype is not None:
+            dtype = np.dtype(dtype)
+            if dtype.names is not None and len(dtype.names) != len(columns):
+                raise UserWarning('pylightxl - to_numpy structured dtype has {} fields for {} columns'
+                                  ''.format(len(dtype.names), len(columns)))
+        elif names is None:
+            dtype = np.dtype(utility_numpy_kind(set([kind for _, _, kind in columns if kind]), False) or 'f8')
+
+        if names is None and dtype.names is None:
+            rv = np.full((nrows, len(columns)), utility_numpy_fill(dtype, fill, self._emptycell), dtype=dtype)
+            for i, (rows, values, _) in enumerate(columns):
+                rv[rows, i] = values
+            return rv
+
+        if dtype is None or dtype.names is None:
+            fields = [np.dtype(dtype or kind or 'f8') for _, _, kind in columns]
+            dtype = np.dtype(list(zip(names, fields)))
+        rv = np.empty(nrows, dtype=dtype)
+        for name, (rows, values, _) in zip(dtype.names, columns):
+            rv[name] = utility_numpy_fill(dtype.fields[name][0], fill, self._emptycell)
+            rv[name][rows] = values
+
+        return rv.view(np.recarray)
+
+    def from_numpy(self, array, address='A1', header=True):
+        # type: (Any, str, bool) -> None
+        """Writes a numpy array into the worksheet starting at address, in a single bulk update (see update_range).
+        2-D arrays are written [row][col], 1-D arrays down a column and record arrays one field per column.
+        nan/NaT values are written as empty cells. numpy is imported on demand, it is not a dependency of pylightxl
+
+        :param array: numpy array (or anything numpy.asarray takes)
+        :type array: numpy.ndarray
+        :param address: excel address of the top left cell, defaults to 'A1'
+        :type address: str, optional
+        :param header: write the field names of a record array as a header row, defaults to True
+        :type header: bool, optional
+        """
+
+        np = utility_import_numpy()
+
+        array = np.asarray(array)
+        row, col = utility_address2index(address.replace('$', ''))
+        if array.dtype.names is not None:
+            if array.ndim != 1:
+                raise UserWarning('pylightxl - from_numpy record arrays must be 1-D, got {}-D'.format(array.ndim))
+            if header:
+                self._store_rows(row, col, [list(array.dtype.names)])
+                row += 1
+            self._store_rows(row, col, zip(*[utility_numpy_tolist(np, array[name]) for name in array.dtype.names]))
+        elif array.ndim == 1:
+            self._store_rows(row, col, ([val] for val in utility_numpy_tolist(np, array)))
+        elif array.ndim == 2:
+            self._store_rows(row, col, utility_numpy_tolist(np, array))
+        else:
+            raise UserWarning('pylightxl - from_numpy array must be 1-D or 2-D, got {}-D'.format(array.ndim))
+
+    def to_columns(self, header_row=1):
+        # type: (int) -> Dict[Union[int, float, str, bool], List[Union[int, float, str, bool]]]
+        """Returns a dict of header: column values below header_row, built from the stored cells of each column.
+        Columns with an empty header cell are skipped
+
+        :param header_row: row index of the header (starting at 1), defaults to 1
+        :type header_row: int, optional
+        :return: dict of {header: [values]}
+        :rtype: Dict[Union[int, float, str, bool], List[Union[int, float, str, bool]]]
+        """
+
+        cols, names = self._header(header_row)
+
+        return dict((name, self._get_col(col, 'v', header_row + 1, self.maxrow)) for col, name in zip(cols, names))
+
+    def iter_records(self, header_row=1, record='dict'):
+        # type: (int, str) -> Iterable[Union[dict, tuple]]
+        """Returns a generator of one record per row below header_row, either a dict of header: value or a
+        namedtuple (headers that are not valid field names are renamed to _0, _1... see collections.namedtuple,
+        under python 2 this includes non-ascii headers). Columns with an empty header cell are skipped
+
+        :param header_row: row index of the header (starting at 1), defaults to 1
+        :type header_row: int, optional
+        :param record: record type "dict" or "namedtuple", defaults to 'dict'
+        :type record: str, optional
+        :return: generator of records
+        :rtype: Iterable[Union[dict, tuple]]
+        """
+
+        record = record.lower()
+        if record not in ['dict', 'namedtuple']:
+            raise UserWarning('pylightxl - incorrect iter_records(record={record}) argument. '
+                              'Valid options = "dict", "namedtuple"'.format(record=record))
+
+        cols, names = self._header(header_row)
+        col_end = cols[-1] if cols else 0
+        rows = (self._get_row(r, 'v', 1, col_end) for r in range(header_row + 1, self.maxrow + 1))
+        if cols != list(range(1, col_end + 1)):
+            # pick the columns that have a header
+            rows = ([row[col - 1] for col in cols] for row in rows)
+
+        if record == 'namedtuple':
+            # python 2 field names must be ascii str, other unicode headers are renamed like invalid names
+            fields = [name.encode('ascii', 'replace') if PYVER == 2 and type(name) is unicode else str(name)
+                      for name in names]
+            make = collections.namedtuple('Record', fields, rename=True)._make
+            return (make(row) for row in rows)
+        return (dict(zip(names, row)) for row in rows)
+
+    def to_records(self, header_row=1, record='dict'):
+        # type: (int, str) -> List[Union[dict, tuple]]
+        """Returns a list of one record per row below header_row, see iter_records
+
+        :param header_row: row index of the header (starting at 1), defaults to 1
+        :type header_row: int, optional
+        :param record: record type "dict" or "namedtuple", defaults to 'dict'
+        :type record: str, optional
+        :return: list of records
+        :rtype: List[Union[dict, tuple]]
+        """
+
+        return list(self.iter_records(header_row, record))
+
+    def where(self, col, op, value):
+        # type: (Union[int, str], str, Any) -> Query
+        """Returns a query of the rows whose cell in col matches the condition, chain more conditions with
+        .where(...) and get the results with .rows() (row indexes), .select(cols) (projected rows) or .count().
+        Only stored cells are evaluated (empty cells never match), see Query
+
+        :param col: column index (starting at 1) or column letters (ex: "D")
+        :type col: Union[int, str]
+        :param op: comparison "==", "!=", ">", ">=", "<", "<=" or "in" (value is a collection of values)
+        :type op: str
+        :param value: value the cells are compared to
+        :type value: Any
+        :return: query
+        :rtype: Query
+        """
+
+        return Query(self).where(col, op, value)
+
+    def stats(self, col):
+        # type: (Union[int, str]) -> Dict[str, Union[int, float, None]]
+        """Returns the statistics of the numeric cells of a column (non-numeric cells are skipped):
+        {'count': ..., 'sum': ..., 'min': ..., 'max': ..., 'mean': ...}, min/max/mean are None without numeric
+        cells. Results are cached until the column is updated
+
+        :param col: column index (starting at 1) or column letters (ex: "D")
+        :type col: Union[int, str]
+        :return: dict of statistics
+        :rtype: Dict[str, Union[int, float, None]]
+        """
+
+        col = utility_col2num(col)
+        utility_check_index(1, col)
+
+        return dict(self._col_stats(col))
+
+    def agg(self, address, funcs=('sum', 'min', 'max', 'count', 'mean')):
+        # type: (str, Iterable[str]) -> Dict[str, Union[int, float, None]]
+        """Aggregates the numeric cells of a range (non-numeric cells are skipped). Columns that the range covers
+        entirely (ex: "A:C") use the cached column statistics, see stats
+
+        :param address: cell range (ex: "A1:C10", "A:C")
+        :type address: str
+        :param funcs: aggregates "sum", "min", "max", "count" and/or "mean",
+                      defaults to ('sum', 'min', 'max', 'count', 'mean')
+        :type funcs: Iterable[str], optional
+        :return: dict of {func: value}, min/max/mean are None without numeric cells
+        :rtype: Dict[str, Union[int, float, None]]
+        """
+
+        for func in funcs:
+            if func not in ['sum', 'min', 'max', 'count', 'mean']:
+                raise UserWarning('pylightxl - incorrect agg(funcs={func}) argument. '
+                                  'Valid options = "sum", "min", "max", "count", "mean"'.format(func=func))
+
+        row_start, col_start, row_end, col_end = self._range_bounds(address, clip=True)
+        parts = []
+        for col in range(col_start, col_end + 1):
+            if row_start <= 1 and row_end >= self.maxrow:
+                parts.append(self._col_stats(col))
+            else:
+                parts.append(utility_stats(self._col_cells(col, row_start, row_end)[1]))
+
+        count = sum([part['count'] for part in parts])
+        parts = [part for part in parts if part['count']]
+        total = sum([part['sum'] for part in parts])
+        rv = {'count': count, 'sum': total,
+              'min': min([part['min'] for part in parts]) if parts else None,
+              'max': max([part['max'] for part in parts]) if parts else None,
+              'mean': total / float(count) if count else None}
+
+        return dict((func, rv[func]) for func in funcs)
+
+    def groupby(self, keys, agg, header_row=1, output='dict'):
+        # type: (Union[int, str, List[Union[int, str]]], dict, int, str) -> Union[dict, Worksheet]
+        """Groups the rows below header_row by the values of key column(s) and aggregates columns per group, a
+        hash aggregation in one pass over the rows. Rows without any key cell are skipped. Aggregates are named
+        "<aggregate>(<header>)" (the column letters are used without a header)
+
+        :param keys: key column index or letters, a list of them for a composite key (ex: "A" or ["A", "C"])
+        :type keys: Union[int, str, List[Union[int, str]]]
+        :param agg: {column: aggregate or list of aggregates} where aggregates are "sum", "min", "max", "count" and
+                    "mean" of the numeric cells of each group (ex: {'E': 'sum', 'F': ['count', 'mean']})
+        :type agg: dict
+        :param header_row: row index of the header, 0 for no header, defaults to 1
+        :type header_row: int, optional
+        :param output: "dict" for {key: {name: value}} (composite keys are tuples) or "worksheet" for a new
+                       Worksheet with a header row and one row per group that can be added with Database.add_ws,
+                       defaults to 'dict'
+        :type output: str, optional
+        :return: aggregates per group, in the order the groups first appear
+        :rtype: Union[dict, Worksheet]
+        """
+
+        output = output.lower()
+        if output not in ['dict', 'worksheet']:
+            raise UserWarning('pylightxl - incorrect groupby(output={output}) argument. '
+                              'Valid options = "dict", "worksheet"'.format(output=output))
+
+        key_cols = utility_col2nums(keys)
+        specs = []
+        for col, funcs in agg.items():
+            funcs = [funcs] if type(funcs) is str else list(funcs)
+            for func in funcs:
+                if func not in ['sum', 'min', 'max', 'count', 'mean']:
+                    raise UserWarning('pylightxl - incorrect groupby(agg={func}) argument. '
+                                      'Valid options = "sum", "min", "max", "count", "mean"'.format(func=func))
+            specs.append((utility_col2num(col), funcs))
+        for col in key_cols + [col for col, _ in specs]:
+            utility_check_index(1, col)
+
+        row_start = header_row + 1
+        nrows = max(self.maxrow - header_row, 0)
+        key_lines = [self._get_col(col, 'v', row_start, self.maxrow) for col in key_cols]
+        agg_lines = [self._get_col(col, 'v', row_start, self.maxrow) for col, _ in specs]
+        if len(key_cols) == 1:
+            row_keys = key_lines[0]
+            no_key = self._emptycell
+        else:
+            row_keys = zip(*key_lines)
+            no_key = (self._emptycell,) * len(key_cols)
+
+        # single pass over the rows, each group keeps [count, sum, min, max] of the numeric cells per agg column
+        track_minmax = [bool(set(funcs) & set(['min', 'max'])) for _, funcs in specs]
+        groups = {}
+        order = []
+        for key, values in zip(row_keys, zip(*agg_lines) if agg_lines else [()] * nrows):
+            if key == no_key:
+                continue
+            states = groups.get(key)
+            if states is None:
+                states = groups[key] = [[0, 0, None, None] for _ in specs]
+                order.append(key)
+            for state, val, minmax in zip(states, values, track_minmax):
+                if type(val) is int or type(val) is float or type(val) is long:
+                    state[0] += 1
+                    state[1] += val
+                    if minmax:
+                        if state[2] is None or val < state[2]:
+                            state[2] = val
+                        if state[3] is None or val > state[3]:
+                            state[3] = val
+        # header names of the key/agg columns, their column letters without a header
+        headers = {}
+        for col in key_cols + [col for col, _ in specs]:
+            name = self._get(header_row, col, 'v') if header_row else ''
+            headers[col] = utility_num2columnletters(col) if name == '' or name == self._emptycell else name
+
+        names = ['{}({})'.format(func, headers[col]) for col, funcs in specs for func in funcs]
+        rv = []
+        for key in order:
+            values = []
+            for (col, funcs), (count, total, low, high) in zip(specs, groups[key]):
+                results = {'count': count, 'sum': total, 'min': low, 'max': high,
+                           'mean': total / float(count) if count else None}
+                values.extend([results[func] for func in funcs])
+            rv.append((key, values))
+
+        if output == 'dict':
+            return dict((key, dict(zip(names, values))) for key, values in rv)
+
+        ws = Worksheet()
+        # keys and headers are cell values, text that begins with "=" is not a formula
+        ws._store_rows(1, 1, [[headers[col] for col in key_cols] + names], raw=True)
+        ws._store_rows(2, 1, ((list(key) if len(key_cols) > 1 else [key]) +
+                              ['' if val is None else val for val in values] for key, values in rv), raw=True)
+        return ws
+
+    def vlookup(self, other, key, cols, other_key=None, dest=None, header_row=1):
+        # type: (Worksheet, Union[int, str, List[Union[int, str]]], Union[int, str, List[Union[int, str]]], Union[int, str, List[Union[int, str]]], Union[int, str], int) -> None
+        """Looks up each row of this worksheet in other by key and writes the cols of the first matching row of other
+        into this worksheet (like excel's vlookup), rows without a match are left empty. The key column of other is
+        hashed once (its hash index is reused if one was built, see build_index), then each row is probed
+
+        :param other: worksheet to look up, it can be from another database
+        :type other: Worksheet
+        :param key: key column index or letters of this worksheet, a list of them for a composite key
+        :type key: Union[int, str, List[Union[int, str]]]
+        :param cols: column index or letters of other to write, or a list of them (ex: ["B", "D"])
+        :type cols: Union[int, str, List[Union[int, str]]]
+        :param other_key: key column(s) of other, defaults to None for the same as key
+        :type other_key: Union[int, str, List[Union[int, str]]], optional
+        :param dest: first column to write the looked up values into, defaults to None for the column after the
+                     last column of the worksheet
+        :type dest: Union[int, str], optional
+        :param header_row: row index of the header of both worksheets (the headers of cols are written to it),
+                           0 for no header, defaults to 1
+        :type header_row: int, optional
+        """
+
+        keys = utility_col2nums(key)
+        other_keys = utility_col2nums(other_key) if other_key is not None else keys
+        cols = utility_col2nums(cols)
+        dest = self.maxcol + 1 if dest is None else utility_col2num(dest)
+        if len(keys) != len(other_keys):
+            raise UserWarning('pylightxl - vlookup key ({}) and other_key ({}) must have the same number of '
+                              'columns'.format(key, other_key))
+
+        table = other._lookup_table(other_keys, header_row)
+        if header_row:
+            self._store_rows(header_row, dest, [[other._get(header_row, col, 'v') for col in cols]], raw=True)
+
+        # probe the table with each row, matched rows are written in runs of consecutive rows
+        run_start = 0
+        run = []
+        for row, probe in zip(range(header_row + 1, self.maxrow + 1), self._key_values(keys, header_row)):
+            rows = table.get(probe) if probe is not None else None
+            if rows:
+                if not run:
+                    run_start = row
+                run.append([other._get(rows[0], col, 'v') for col in cols])
+            elif run:
+                self._store_rows(run_start, dest, run, raw=True)
+                run = []
+        if run:
+            self._store_rows(run_start, dest, run, raw=True)
+
+    def join(self, other, key, other_key=None, how='inner', header_row=1):
+        # type: (Worksheet, Union[int, str, List[Union[int, str]]], Union[int, str, List[Union[int, str]]], str, int) -> Worksheet
+        """Hash joins the rows of this worksheet (left) with the rows of other (right) on key columns and returns
+        a new worksheet with the left row followed by the right row (without its key columns) per match.
+        The key columns of the smaller worksheet are hashed (its hash index is reused if one was built, see
+        build_index) and the other worksheet is scanned once. Rows are in the order of the left worksheet
+
+        :param other: right worksheet, it can be from another database
+        :type other: Worksheet
+        :param key: key column index or letters of this worksheet, a list of them for a composite key
+        :type key: Union[int, str, List[Union[int, str]]]
+        :param other_key: key column(s) of other, defaults to None for the same as key
+        :type other_key: Union[int, str, List[Union[int, str]]], optional
+        :param how: "inner" for matched rows only, "left" to also keep the left rows without a match,
+                    defaults to 'inner'
+        :type how: str, optional
+        :param header_row: row index of the header of both worksheets (the joined header is written to row 1),
+                           0 for no header, defaults to 1
+        :type header_row: int, optional
+        :return: joined worksheet that can be added with Database.add_ws
+        :rtype: Worksheet
+        """
+
+        how = how.lower()
+        if how not in ['inner', 'left']:
+            raise UserWarning('pylightxl - incorrect join(how={how}) argument. '
+                              'Valid options = "inner", "left"'.format(how=how))
+        keys = utility_col2nums(key)
+        other_keys = utility_col2nums(other_key) if other_key is not None else keys
+        if len(keys) != len(other_keys):
+            raise UserWarning('pylightxl - join key ({}) and other_key ({}) must have the same number of '
+                              'columns'.format(key, other_key))
+
+        # hash the smaller worksheet and scan the other one, matches are (left row, right row)
+        left_rows = range(header_row + 1, self.maxrow + 1)
+        if other.maxrow <= self.maxrow:
+            table = other._lookup_table(other_keys, header_row)
+            pairs = []
+            for row, probe in zip(left_rows, self._key_values(keys, header_row)):
+                matches = table.get(probe) if probe is not None else None
+                if matches:
+                    pairs.extend([(row, match) for match in matches])
+                elif how == 'left':
+                    pairs.append((row, 0))
+        else:
+            table = self._lookup_table(keys, header_row)
+            pairs = []
+            for row, probe in zip(range(header_row + 1, other.maxrow + 1), other._key_values(other_keys, header_row)):
+                matches = table.get(probe) if probe is not None else None
+                if matches:
+                    pairs.extend([(match, row) for match in matches])
+            if how == 'left':
+                matched = set([row for row, _ in pairs])
+                pairs.extend([(row, 0) for row in left_rows if row not in matched])
+            # sort by left row, the right rows of a left row stay in order
+            pairs.sort(key=lambda pair: pair[0])
+
+        other_cols = [col for col in range(1, other.maxcol + 1) if col not in other_keys]
+        no_match = [''] * len(other_cols)
+        ws = Worksheet()
+        if header_row:
+            ws._store_rows(1, 1, [self._get_row(header_row, 'v', 1, self.maxcol) +
+                                  [other._get(header_row, col, 'v') for col in other_cols]], raw=True)
+        ws._store_rows(ws.maxrow + 1, 1, (self._get_row(row, 'v', 1, self.maxcol) +
+                                          ([other._get(match, col, 'v') for col in other_cols] if match else no_match)
+                                          for row, match in pairs), raw=True)
+
+        return ws
+
+    def _key_values(self, keys, header_row):
+        # type: (List[int], int) -> Iterable[Union[int, float, str, bool, tuple, None]]
+        """Returns the key values (tuples for composite keys) of the rows below header_row, None for rows
+        without any key cell"""
+
+        lines = [self._get_col(col, 'v', header_row + 1, self.maxrow) for col in keys]
+        if len(keys) == 1:
+            empty = self._emptycell
+            return [None if value == empty else value for value in lines[0]]
+
+        empty = (self._emptycell,) * len(keys)
+        return [None if value == empty else value for value in zip(*lines)]
+
+    def _lookup_table(self, keys, header_row):
+        # type: (List[int], int) -> dict
+        """Returns {key value: [rows]} of the rows below header_row, built from the hash index of the key
+        column(s) (rebuilt if stale, built ad hoc without one), see build_index"""
+
+        keys = tuple(keys)
+        index = self._indexes.get(('row', keys))
+        if index is None:
+            index = self._key_index(keys, 'row')
+            if ('row', keys) in self._indexes:
+                self._indexes[('row', keys)] = index
+        # rows without any key cell are not matched
+        no_key = self._emptycell if len(keys) == 1 else (self._emptycell,) * len(keys)
+
+        table = {}
+        for value, pos in index.items():
+            if value == no_key:
+                continue
+            rows = [row for row in (pos if type(pos) is list else [pos]) if row > header_row]
+            if rows:
+                table[value] = rows
+
+        return table
+
+    def _col_stats(self, col):
+        # type: (int) -> Dict[str, Union[int, float, None]]
+        """Returns the cached statistics of col, computed in one pass over its stored cells on a cache miss"""
+
+        try:
+            return self._stats[col]
+        except KeyError:
+            stats = self._stats[col] = utility_stats(self._col_cells(col, 1, self.maxrow)[1])
+            return stats
+
+    def _header(self, header_row):
+        # type: (int) -> Tuple[List[int], List[Union[int, float, str, bool]]]
+        """Returns (cols, names) of the header cells of header_row that are not empty, raises UserWarning on
+        duplicate headers"""
+
+        utility_check_index(header_row, 1)
+
+        cols = []
+        names = []
+        for col, name in enumerate(self._get_row(header_row, 'v', 1, self.maxcol), 1):
+            if name != '' and name != self._emptycell:
+                cols.append(col)
+                names.append(name)
+        if len(set(names)) != len(names):
+            raise UserWarning('pylightxl - header row ({}) has duplicate headers: {}'.format(header_row, names))
+
+        return cols, names
+
+
+class Query:
+
+    def __init__(self, ws, conditions=None):
+        # type: (Worksheet, list) -> None
+        """Chainable row filter of a worksheet, see Worksheet.where. Conditions are AND-ed and only stored cells
+        are evaluated (empty cells never match). The first condition scans the stored cells of its column, or takes
+        its candidate rows from a hash index on its column (see Worksheet.build_index), the following conditions only
+        look up the cells of the rows that still match
+
+        :param ws: worksheet to query
+        :type ws: Worksheet
+        :param conditions: list of (col, op, value), defaults to None
+        :type conditions: list, optional
+        """
+
+        self._ws = ws
+        self._conditions = conditions or []
+
+    def __repr__(self):
+        return 'pylightxl.Query'
+
+    def __iter__(self):
+        return iter(self.select())
+
+    def where(self, col, op, value):
+        # type: (Union[int, str], str, Any) -> Query
+        """Returns a new query with an added condition, see Worksheet.where
+
+        :param col: column index (starting at 1) or column letters (ex: "D")
+        :type col: Union[int, str]
+        :param op: comparison "==", "!=", ">", ">=", "<", "<=" or "in" (value is a collection of values)
+        :type op: str
+        :param value: value the cells are compared to
+        :type value: Any
+        :return: query
+        :rtype: Query
+        """
+
+        if op not in QUERY_OPS:
+            raise UserWarning('pylightxl - incorrect where(op={op}) argument. '
+                              'Valid options = {ops}'.format(op=op, ops=', '.join(sorted(QUERY_OPS))))
+        col = utility_col2num(col)
+        utility_check_index(1, col)
+        if op == 'in':
+            try:
+                value = frozenset(value)
+            except TypeError:
+                # unhashable values are compared one by one
+                value = list(value)
+
+        return Query(self._ws, self._conditions + [(col, op, value)])
+
+    def rows(self):
+        # type: () -> List[int]
+        """Returns the matched row indexes in ascending order
+
+        :return: list of row indexes
+        :rtype: List[int]
+        """
+
+        ws = self._ws
+        if not self._conditions:
+            return list(range(1, ws.maxrow + 1))
+
+        conditions = list(self._conditions)
+        # push an indexed equality condition first, it narrows the scan the most
+        for i, (col, op, value) in enumerate(conditions):
+            if op in ['==', 'in'] and ('row', (col,)) in ws._indexes:
+                conditions.insert(0, conditions.pop(i))
+                break
+
+        col, op, value = conditions[0]
+        index = self._row_index(col) if op == '==' or (op == 'in' and type(value) is frozenset) else None
+        if index is None:
+            cells = zip(*ws._col_cells(col, 1, ws.maxrow))
+        else:
+            # candidate rows from the index, the cells are still compared since index keys also cover empty cells
+            rows = []
+            for key in [value] if op == '==' else value:
+                pos = index.get(key)
+                if pos is not None:
+                    rows.extend(pos if type(pos) is list else [pos])
+            cells = ws._col_values(col, sorted(set(rows)))
+        rows = utility_query_filter(cells, op, value)
+        for col, op, value in conditions[1:]:
+            if not rows:
+                break
+            rows = utility_query_filter(ws._col_values(col, rows), op, value)
+
+        return sorted(rows)
+
+    def select(self, cols=None):
+        # type: (List[Union[int, str]]) -> List[List[Union[int, float, str, bool]]]
+        """Returns the matched rows, projected to cols
+
+        :param cols: list of column indexes (starting at 1) or column letters (ex: ["A", "D"]),
+                     defaults to None for entire rows
+        :type cols: List[Union[int, str]], optional
+        :return: nested list [row][col] of the matched rows
+        :rtype: List[List[Union[int, float, str, bool]]]
+        """
+
+        ws = self._ws
+        if cols is None:
+            return [ws._get_row(row, 'v', 1, ws.maxcol) for row in self.rows()]
+
+        cols = [utility_col2num(col) for col in cols]
+        return [[ws._get(row, col, 'v') for col in cols] for row in self.rows()]
+
+    def count(self):
+        # type: () -> int
+        """Returns the number of matched rows"""
+
+        return len(self.rows())
+
+    def _row_index(self, col):
+        # type: (int) -> Union[dict, None]
+        """Returns the hash index of col (rebuilt if stale), None if col has no index, see Worksheet.build_index"""
+
+        ws = self._ws
+        if ('row', (col,)) not in ws._indexes:
+            return None
+
+        index = ws._indexes[('row', (col,))]
+        if index is None:
+            # stale, rebuild
+            index = ws._indexes[('row', (col,))] = ws._key_index((col,), 'row')
+
+        return index
+
+
+class TypedColumn:
+
+    # a string column with at most this many values switches to a number kind when numbers arrive (header rows)
+    MAX_LABELS = 16
+
+    def __init__(self):
+        """Column of cell values held in a typed array: ints in array('q'), floats in array('d') and strings
+        dictionary-encoded as int codes into a table of unique strings. A validity bitmap marks the stored rows.
+        Cells that do not fit the column kind (a text header over numbers, bool, datetime) are kept in a side
+        table so the column stays typed, columns where those outnumber the typed values fall back to a list of
+        objects
+
+        Value kinds: None (no value stored yet), 'q' ints, 'd' floats (a second bitmap marks the ints held
+        in a float column so they are returned as int), 's' strings, 'o' objects
+        """
+
+        self.kind = None
+        self.values = array(ARRAY_INT)
+        # bit i is set when position i holds a value of the column kind
+        self.valid = bytearray()
+        # bit i is set when position i of a 'd' column was an int
+        self.ints = bytearray()
+        # 's' column unique value table and its reverse lookup
+        self.strings = []
+        self.codes = {}
+        # {position: value} of cells that do not fit the column kind, their valid bit is not set
+        self.others = {}
+        # number of valid positions
+        self.count = 0
+        self.length = 0
+
+    def __repr__(self):
+        return 'pylightxl.TypedColumn'
+
+    def __len__(self):
+        return self.length
+
+    def get(self, i):
+        # type: (int) -> tuple
+        """Returns (True, value) of position i, or (False, None) when nothing is stored
+
+        :param i: position (row - 1)
+        :type i: int
+        :return: (stored flag, value)
+        :rtype: tuple
+        """
+
+        if i >= self.length or not self.valid[i >> 3] & (1 << (i & 7)):
+            if self.others and i in self.others:
+                return True, self.others[i]
+            return False, None
+        kind = self.kind
+        if kind == 's':
+            return True, self.strings[self.values[i]]
+        if kind == 'd' and self.ints[i >> 3] & (1 << (i & 7)):
+            return True, int(self.values[i])
+        return True, self.values[i]
+
+    def set(self, i, val):
+        # type: (int, Union[int, float, str, bool]) -> None
+        """Stores val at position i. The column widens from ints to floats, any other value that does not fit
+        the column kind goes to the side table
+
+        :param i: position (row - 1)
+        :type i: int
+        :param val: cell value
+        :type val: Union[int, float, str, bool]
+        """
+
+        if i >= self.length:
+            self._grow(i + 1)
+
+        if self.kind == 'o':
+            if not self.valid[i >> 3] & (1 << (i & 7)):
+                self.valid[i >> 3] |= 1 << (i & 7)
+                self.count += 1
+            self.values[i] = val
+            return
+
+        val_type = type(val)
+        if (val_type is int or val_type is long) and -MAX_FLOAT_INT <= val <= MAX_FLOAT_INT:
+            # ints past the int array (32 bit 'l') are held in a float column that keeps them as int
+            kind = 'q' if -ARRAY_INT_MAX - 1 <= val <= ARRAY_INT_MAX else 'd'
+        elif val_type is float:
+            kind = 'd'
+        elif val_type is str or val_type is unicode:
+            kind = 's'
+        else:
+            kind = None
+
+        if kind is not None and kind != self.kind:
+            if self.kind is None or (self.kind == 'q' and kind == 'd'):
+                self._promote(kind)
+            elif self.kind == 's' and kind != 's' and self.count <= self.MAX_LABELS:
+                # the few strings stored so far are labels over a number column
+                self._promote(None)
+                self._promote(kind)
+
+        byte, bit = i >> 3, 1 << (i & 7)
+        stored = self.valid[byte] & bit
+        if kind is None or (kind != self.kind and not (kind == 'q' and self.kind == 'd')):
+            if stored:
+                self.valid[byte] &= ~bit & 0xFF
+                self.count -= 1
+            self.others[i] = val
+            if len(self.others) > self.MAX_LABELS and len(self.others) > self.count:
+                self._promote('o')
+            return
+
+        if self.others:
+            self.others.pop(i, None)
+        if not stored:
+            self.valid[byte] |= bit
+            self.count += 1
+        if self.kind == 's':
+            code = self.codes.get(val)
+            if code is None:
+                code = self.codes[val] = len(self.strings)
+                self.strings.append(val)
+            self.values[i] = code
+        elif self.kind == 'd':
+            if val_type is not float:
+                self.ints[byte] |= bit
+            else:
+                self.ints[byte] &= ~bit & 0xFF
+            self.values[i] = val
+        else:
+            self.values[i] = val
+
+    def _grow(self, length):
+        # type: (int) -> None
+        """Extends the column to length positions, new positions are not valid"""
+
+        fill = None if self.kind == 'o' else 0
+        self.values.extend([fill] * (length - self.length))
+        nbytes = (length + 7) >> 3
+        self.valid.extend(bytearray(nbytes - len(self.valid)))
+        if self.kind == 'd':
+            self.ints.extend(bytearray(nbytes - len(self.ints)))
+        self.length = length
+
+    def _promote(self, kind):
+        # type: (str) -> None
+        """Converts the stored values to kind. None moves the stored values to the side table and empties the
+        column, 'o' merges the side table into the list of objects"""
+
+        if kind is None:
+            for i in range(self.length):
+                if self.valid[i >> 3] & (1 << (i & 7)):
+                    self.others[i] = self.get(i)[1]
+            values = array(ARRAY_INT, [0] * self.length)
+            self.valid = bytearray(len(self.valid))
+            self.ints = bytearray()
+            self.strings = []
+            self.codes = {}
+            self.count = 0
+        elif kind == 'q':
+            values = array(ARRAY_INT, self.values)
+        elif kind == 'd':
+            # ints stored so far are marked so they keep their type
+            self.ints = bytearray(self.valid) if self.kind == 'q' else bytearray(len(self.valid))
+            values = array('d', self.values)
+        elif kind == 's':
+            values = array('i', self.values)
+        else:
+            values = [self.get(i)[1] for i in range(self.length)]
+            for i in self.others:
+                self.valid[i >> 3] |= 1 << (i & 7)
+            self.count += len(self.others)
+            self.others = {}
+            self.ints = bytearray()
+            self.strings = []
+            self.codes = {}
+        self.values = values
+        self.kind = kind
+
+
+class ColumnarWorksheet(Worksheet):
+
+    def __init__(self, data=None):
+        # type: (dict) -> None
+        """Worksheet with a columnar backing store for mostly numeric, rectangular data: each column is a
+        TypedColumn indexed by row, formulas and comments are kept in sparse side tables.
+        Supports the same api as Worksheet, see Database.add_ws(columnar=True)
+
+        :param data: worksheet cell data (ex: {'A1': {'v': 1, 'f': '', 's': '', 'c': ''}}), defaults to None
+        :type data: dict, optional
+        """
+
+        # {col: TypedColumn}
+        self._columns = {}
+        # sparse side tables of the cells that have a formula/comment {(row, col): text}
+        self._formulas = {}
+        self._comments = {}
+        # key value hash indexes, see Worksheet.build_index
+        self._indexes = {}
+        # cached column statistics, see Worksheet.stats
+        self._stats = {}
+        self.maxrow = 0
+        self.maxcol = 0
+        self._emptycell = ''
+        if data:
+            for (row, col), cell in zip(utility_address2index_batch(data.keys()), data.values()):
+                self._store(row, col, cell['v'], cell.get('f'), cell.get('c'))
+
+    def __repr__(self):
+        return 'pylightxl.Database.ColumnarWorksheet'
+
+    def _calc_size(self):
+        """
+        Calculates the size of the worksheet row/col
+
+        :return: None (but this creates instance attributes maxrow/maxcol)
+        """
+
+        self.maxrow = max([len(column) for column in self._columns.values()] + [0])
+        self.maxcol = max(list(self._columns.keys()) + [0])
+
+    def _store_value(self, row, col, val):
+        # type: (int, int, Union[int, float, str, bool]) -> None
+        """Stores the value of a cell in its column, see _store"""
+
+        column = self._columns.get(col)
+        if column is None:
+            column = self._columns[col] = TypedColumn()
+        column.set(row - 1, val)
+
+    def _store_row_values(self, row, col_start, values):
+        # type: (int, int, List[Union[int, float, str, bool]]) -> None
+        """Stores a list of values along row from col_start, see _store_rows"""
+
+        for col, val in enumerate(values, col_start):
+            self._store_value(row, col, val)
+
+    def _iter_cells(self):
+        # type: () -> Iterable[tuple]
+        """Yields (row, col, cell_val) of the stored cells in row then column order"""
+
+        columns = sorted(self._columns.items())
+        for row in range(1, self.maxrow + 1):
+            for col, column in columns:
+                stored, val = column.get(row - 1)
+                if stored:
+                    yield row, col, val
+
+    def _get(self, row, col, output):
+        # type: (int, int, str) -> Union[int, float, str, bool]
+        """Returns the requested output of row/col, the empty cell value if nothing is stored.
+        A stored cell without a comment returns '' for "c"
+        """
+
+        column = self._columns.get(col)
+        if column is None:
+            return self._emptycell
+        stored, val = column.get(row - 1)
+        if not stored:
+            return self._emptycell
+        if output == 'v':
+            return val
+        elif output == 'f':
+            return '=' + self._formulas.get((row, col), '')
+        else:
+            return self._comments.get((row, col), '')
+
+    def _get_row(self, row, output, col_start, col_end):
+        # type: (int, str, int, int) -> List[Union[int, float, str, bool]]
+        """Returns the requested output of row from col_start to col_end (inclusive), only the stored
+        columns are visited"""
+
+        rv = [self._emptycell] * (col_end - col_start + 1)
+        for c in self._columns:
+            if col_start <= c <= col_end:
+                rv[c - col_start] = self._get(row, c, output)
+
+        return rv
+
+    def _get_col(self, col, output, row_start, row_end):
+        # type: (int, str, int, int) -> List[Union[int, float, str, bool]]
+        """Returns the requested output of col from row_start to row_end (inclusive)"""
+
+        column = self._columns.get(col)
+        if column is None:
+            return [self._emptycell] * (row_end - row_start + 1)
+        if output != 'v':
+            return [self._get(r, col, output) for r in range(row_start, row_end + 1)]
+
+        empty = self._emptycell
+        rv = []
+        for i in range(row_start - 1, row_end):
+            stored, val = column.get(i)
+            rv.append(val if stored else empty)
+
+        return rv
+
+    def _col_cells(self, col, row_start, row_end):
+        # type: (int, int, int) -> Tuple[List[int], List[Union[int, float, str, bool]]]
+        """Returns (rows, values) of the stored cells of col from row_start to row_end (inclusive)"""
+
+        column = self._columns.get(col)
+        rows = []
+        values = []
+        if column is None:
+            return rows, values
+
+        for i in range(row_start - 1, min(row_end, len(column))):
+            stored, val = column.get(i)
+            if stored:
+                rows.append(i + 1)
+                values.append(val)
+
+        return rows, values
+
+    def _col_values(self, col, rows):
+        # type: (int, Iterable[int]) -> List[tuple]
+        """Returns (row, value) of the stored cells of col in rows"""
+
+        column = self._columns.get(col)
+        if column is None:
+            return []
+
+        rv = []
+        for r in rows:
+            stored, val = column.get(r - 1)
+            if stored:
+                rv.append((r, val))
+
+        return rv
+
 
 ########################################################################################################
 # SEC-06: UTILITY FUNCTIONS
@@ -2203,8 +5197,15 @@ def utility_address2index(address):
     :rtype: List[int]
     """
 
-    if type(address) is not str:
+    if type(address) is not str and type(address) is not unicode:
         raise UserWarning('pylightxl - Address ({}) must be a string.'.format(address))
+
+    # common addresses are parsed with a precompiled pattern and the column lookup table
+    match = XL_ADDRESS.match(address)
+    if match is not None:
+        colstr, row = match.groups()
+        return [int(row), XL_COLUMN_NUMBERS.get(colstr) or utility_columnletter2num(colstr)]
+
     if address == '':
         raise UserWarning('pylightxl - Address ({}) cannot be an empty str.'.format(address))
 
@@ -2232,6 +5233,30 @@ def utility_address2index(address):
     return [row, col]
 
 
+def utility_address2index_batch(addresses):
+    # type: (Iterable[str]) -> List[List[int]]
+    """Converts a list of excel addresses to row/col indexes, see utility_address2index
+
+    :param addresses: Excel addresses (ex: ["A1", "B2"])
+    :type addresses: Iterable[str]
+    :return: list of [row, col]
+    :rtype: List[List[int]]
+    """
+
+    rv = []
+    match = XL_ADDRESS.match
+    for address in addresses:
+        parsed = match(address) if type(address) is str or type(address) is unicode else None
+        if parsed is None:
+            # uncommon addresses and errors
+            rv.append(utility_address2index(address))
+        else:
+            colstr, row = parsed.groups()
+            rv.append([int(row), XL_COLUMN_NUMBERS.get(colstr) or utility_columnletter2num(colstr)])
+
+    return rv
+
+
 def utility_index2address(row, col):
     # type: (int, int) -> str
     """Converts index row/col to excel address
@@ -2244,6 +5269,69 @@ def utility_index2address(row, col):
     :rtype: str
     """
 
+    utility_check_index(row, col)
+
+    # values over 26 are outside the A-Z range, reduce them
+    colname = utility_num2columnletters(col)
+
+    return colname + str(row)
+
+
+def utility_index2address_batch(indexes):
+    # type: (Iterable[List[int]]) -> List[str]
+    """Converts a list of row/col indexes to excel addresses, see utility_index2address
+
+    :param indexes: list of [row, col] (ex: [[1, 1], [2, 2]])
+    :type indexes: Iterable[List[int]]
+    :return: list of excel addresses
+    :rtype: List[str]
+    """
+
+    rv = []
+    for row, col in indexes:
+        if type(row) is int and type(col) is int and row > 0 and 0 < col <= MAX_XL_COLS:
+            rv.append(XL_COLUMN_LETTERS[col] + str(row))
+        else:
+            # uncommon indexes and errors
+            rv.append(utility_index2address(row, col))
+
+    return rv
+
+
+def utility_range2addresses(address):
+    # type: (str) -> List[List[str]]
+    """Expands a range of cells to its excel addresses in a nested list [row][col]
+
+    :param address: cell range (ex: "A1:B2", or "A1")
+    :type address: str
+    :return: nested list [row][col] of excel addresses (ex: [['A1', 'B1'], ['A2', 'B2']])
+    :rtype: List[List[str]]
+    """
+
+    address = address.replace('$', '')
+    address_start, _, address_end = address.partition(':')
+    row_start, col_start = utility_address2index(address_start)
+    row_end, col_end = utility_address2index(address_end or address_start)
+    letters = [utility_num2columnletters(col) for col in range(col_start, col_end + 1)]
+
+    rv = []
+    for row in range(row_start, row_end + 1):
+        row = str(row)
+        rv.append([colname + row for colname in letters])
+
+    return rv
+
+
+def utility_check_index(row, col):
+    # type: (int, int) -> None
+    """Raises UserWarning if row/col is not a valid index
+
+    :param row: row index (starting at 1)
+    :type row: int
+    :param col: col index (start at 1 that corresponds to column "A")
+    :type col: int
+    """
+
     if type(row) is not int and type(row) is not float:
         raise UserWarning('pylightxl - Incorrect row ({}) entry. Row must either be a int or float'.format(row))
     if type(col) is not int and type(col) is not float:
@@ -2251,10 +5339,20 @@ def utility_index2address(row, col):
     if row <= 0 or col <= 0:
         raise UserWarning('pylightxl - Row ({}) and Col ({}) entry cannot be less than 1'.format(row, col))
 
-    # values over 26 are outside the A-Z range, reduce them
-    colname = utility_num2columnletters(col)
 
-    return colname + str(row)
+def utility_check_row(row, values):
+    # type: (int, Any) -> None
+    """Raises UserWarning if values is not a row of cell values (a list/iterable that is not a string)
+
+    :param row: row index (starting at 1)
+    :type row: int
+    :param values: row of cell values
+    :type values: Any
+    """
+
+    if type(values) is str or type(values) is unicode or not hasattr(values, '__iter__'):
+        raise UserWarning('pylightxl - Incorrect row ({}) entry ({!r}). Rows must be lists/iterables of cell '
+                          'values, a single row is written as [[val, ...]]'.format(row, values))
 
 
 def utility_columnletter2num(text):
@@ -2267,14 +5365,15 @@ def utility_columnletter2num(text):
     :rtype: int
     """
 
-    letter_pos = len(text) - 1
-    val = 0
     try:
-        val = (ord(text[0].upper())-64) * 26 ** letter_pos
-        next_val = utility_columnletter2num(text[1:])
-        val = val + next_val
-    except IndexError:
-        return val
+        return XL_COLUMN_NUMBERS[text]
+    except KeyError:
+        pass
+
+    val = 0
+    for letter in text.upper():
+        val = val * 26 + ord(letter) - 64
+
     return val
 
 
@@ -2288,20 +5387,76 @@ def utility_num2columnletters(num):
     :rtype: str
     """
 
-    def pre_num2alpha(num):
-        if num % 26 != 0:
-            num = [num // 26, num % 26]
-        else:
-            num = [(num - 1) // 26, 26]
+    if 0 < num <= MAX_XL_COLS:
+        return XL_COLUMN_LETTERS[int(num)]
+
+    letters = ''
+    num = int(num)
+    while num > 0:
+        num, remainder = divmod(num - 1, 26)
+        letters = chr(remainder + 65) + letters
+
+    return letters
+
+
+def utility_serial_decoder(kind, native=False):
+    # type: (str, bool) -> Callable
+    """Returns a decoder for excel serial date/time values. Decoded values are cached by their serial text
+    since date columns tend to repeat the same values
+
+    :param kind: "date", "time" or "datetime"
+    :type kind: str
+    :param native: returns datetime.date/time/datetime objects if true, otherwise strings
+                   (ex: "2021/04/10", "02:48:02", "2021/04/10 05:12:00"), defaults to False
+    :type native: bool, optional
+    :return: decoder function that takes a serial value text (ex: '44296.5') and returns the decoded value
+    :rtype: Callable
+    """
+
+    cache = {}
+
+    def decode(serial):
+        try:
+            return cache[serial]
+        except KeyError:
+            pass
 
-        if num[0] > 26:
-            num = pre_num2alpha(num[0]) + [num[1]]
+        val = float(serial)
+        if kind == 'date':
+            dt = EXCEL_STARTDATE + timedelta(val)
+            rv = dt.date() if native else dt.isoformat()[:10].replace('-', '/')
+        elif kind == 'time':
+            dt = EXCEL_STARTDATE + timedelta(2, round(val % 1 * 86400))
+            rv = dt.time() if native else dt.strftime('%H:%M:%S')
         else:
-            num = list(filter(lambda x: False if x == 0 else True, num))
+            dt = EXCEL_STARTDATE + timedelta(int(val), round(val % 1 * 86400))
+            rv = dt if native else dt.isoformat().replace('T', ' ').replace('-', '/')
+
+        # keep the cache bounded for columns of unique timestamps
+        if len(cache) >= 100000:
+            cache.clear()
+        cache[serial] = rv
+        return rv
+
+    return decode
+
+
+def utility_serial_encode(val):
+    # type: (Union[datetime, date, datetime_time]) -> tuple
+    """Returns the excel serial value of a datetime.datetime/date/time, the reverse of utility_serial_decoder
 
-        return num
+    :param val: date/time value, timezones are ignored
+    :type val: Union[datetime, date, datetime_time]
+    :return: (serial value, "datetime", "date" or "time")
+    :rtype: tuple
+    """
 
-    return "".join(list(map(lambda x: chr(x + 64), pre_num2alpha(num))))
+    if isinstance(val, datetime):
+        delta = val.replace(tzinfo=None) - EXCEL_STARTDATE
+        return delta.days + (delta.seconds + delta.microseconds / 1e6) / 86400, 'datetime'
+    if isinstance(val, date):
+        return (datetime(val.year, val.month, val.day) - EXCEL_STARTDATE).days, 'date'
+    return (val.hour * 3600 + val.minute * 60 + val.second + val.microsecond / 1e6) / 86400, 'time'
 
 
 def utility_xml_namespace(file):
@@ -2328,3 +5483,351 @@ def utility_xml_namespace(file):
     if 'default' not in ns.keys():
         ns['default'] = ns['x']
     return ns
+
+
+def utility_xml_row_offsets(file, offset=0, row=0, chunks=None):
+    # type: (io.BufferedReader, int, int, list) -> Iterable[tuple]
+    """Scans a worksheet xml byte stream for its <row>, <sheetData> and </sheetData> tags without parsing
+    the xml, and yields each tag as it is found
+
+    :param file: worksheet xml file opened in binary mode
+    :type file: io.BufferedReader
+    :param offset: byte offset the file is positioned at, defaults to 0
+    :type offset: int, optional
+    :param row: row number before the first row read, rows without an r attribute follow the previous row, defaults to 0
+    :type row: int, optional
+    :param chunks: if a list is passed, all bytes read from the file are appended to it, defaults to None
+    :type chunks: list, optional
+    :return: yields (closing, qname, attributes, row number, tag start offset, tag end offset)
+    :rtype: Iterable[tuple]
+    """
+
+    buffer = b''
+    pos = 0
+    while True:
+        chunk = file.read(65536)
+        if chunks is not None and chunk:
+            chunks.append(chunk)
+        # keep the unscanned tail of the previous chunk, it may hold the start of a tag
+        offset += pos
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+        match = XML_ROW_TAG.search(buffer)
+        while match is not None:
+            closing, qname, attrs = match.groups()
+            pos = match.end()
+            if qname.endswith(b'row'):
+                if closing:
+                    # </row>
+                    match = XML_ROW_TAG.search(buffer, pos)
+                    continue
+                tag_r = XML_ROW_R.search(attrs)
+                row = int(tag_r.group(1)) if tag_r is not None else row + 1
+            yield (closing == b'/', qname.decode('utf-8'), attrs.decode('utf-8').strip(), row,
+                   offset + match.start(), offset + match.end())
+            match = XML_ROW_TAG.search(buffer, pos)
+
+        if not chunk:
+            return
+        last = buffer.rfind(b'<', pos)
+        pos = last if last != -1 else len(buffer)
+
+
+def utility_biff12_records(file):
+    # type: (io.BufferedReader) -> Iterable[tuple]
+    """Takes an opened BIFF12 (xlsb) part and yields its records. Each record starts with its record type and
+    size, both stored as variable length integers (7 bits per byte, the high bit flags a following byte)
+
+    :param file: xlsb part file (ex: xl/worksheets/sheet1.bin)
+    :type file: io.BufferedReader
+    :return: yields (record type, record data)
+    :rtype: Iterable[tuple]
+    """
+
+    buffer = bytearray()
+    pos = 0
+    while True:
+        chunk = file.read(1048576)
+        # keep the unparsed tail of the previous chunk, it may hold the start of a record
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        end = len(buffer)
+
+        while pos < end:
+            i = pos
+            # record type: 1-2 bytes
+            rec_id = buffer[i] & 0x7F
+            if buffer[i] & 0x80:
+                i += 1
+                if i == end:
+                    break
+                rec_id |= (buffer[i] & 0x7F) << 7
+            i += 1
+            # record size: 1-4 bytes
+            size = 0
+            for shift in (0, 7, 14, 21):
+                if i == end:
+                    size = None
+                    break
+                size |= (buffer[i] & 0x7F) << shift
+                i += 1
+                if not buffer[i - 1] & 0x80:
+                    break
+            if size is None or i + size > end:
+                break
+            yield rec_id, buffer[i:i + size]
+            pos = i + size
+
+        if not chunk:
+            return
+
+
+def utility_biff12_record(rec_id, data=b''):
+    # type: (int, bytes) -> bytes
+    """Takes a BIFF12 (xlsb) record type and its data and returns the record, see utility_biff12_records
+
+    :param rec_id: record type
+    :type rec_id: int
+    :param data: record data, defaults to b''
+    :type data: bytes, optional
+    :return: record
+    :rtype: bytes
+    """
+
+    header = bytearray()
+    # record type: 1-2 bytes
+    if rec_id > 0x7F:
+        header.append((rec_id & 0x7F) | 0x80)
+        header.append(rec_id >> 7)
+    else:
+        header.append(rec_id)
+    # record size: 1-4 bytes
+    size = len(data)
+    while size > 0x7F:
+        header.append((size & 0x7F) | 0x80)
+        size >>= 7
+    header.append(size)
+
+    return bytes(header) + data
+
+
+def utility_biff12_pack_string(text):
+    # type: (str) -> bytes
+    """Takes a string and returns it as a BIFF12 wide string, see utility_biff12_string
+
+    :param text: string
+    :type text: str
+    :return: 4 byte character count followed by utf-16 characters
+    :rtype: bytes
+    """
+
+    data = text.encode('utf-16-le')
+    return struct.pack('<I', len(data) // 2) + data
+
+
+def utility_biff12_string(rec, offset):
+    # type: (bytearray, int) -> tuple
+    """Takes a BIFF12 record and returns the wide string stored at offset (4 byte character count followed by
+    utf-16 characters)
+
+    :param rec: record data
+    :type rec: bytearray
+    :param offset: byte offset of the string in the record
+    :type offset: int
+    :return: (string, byte offset after the string)
+    :rtype: tuple
+    """
+
+    count = struct.unpack_from('<I', rec, offset)[0]
+    if count == 0xFFFFFFFF:
+        # null string
+        return '', offset + 4
+    end = offset + 4 + 2 * count
+    return rec[offset + 4:end].decode('utf-16-le'), end
+
+
+def utility_biff12_rk(rk):
+    # type: (int) -> Union[int, float]
+    """Takes a BIFF12 RK number and returns its value. RK numbers are either 30 bit integers or the upper 30 bits of a
+    double, optionally scaled by 1/100
+
+    :param rk: RK number as a signed 32 bit int
+    :type rk: int
+    :return: number
+    :rtype: Union[int, float]
+    """
+
+    if rk & 0x02:
+        val = rk >> 2
+    else:
+        val = struct.unpack('<d', struct.pack('<II', 0, rk & 0xFFFFFFFC))[0]
+    if rk & 0x01:
+        val = val / 100.0
+
+    return val
+
+
+def utility_import_numpy():
+    # type: () -> Any
+    """Imports numpy on demand, numpy is an optional dependency of the numpy bridge (see Worksheet.to_numpy)
+
+    :return: numpy module
+    :rtype: module
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        raise UserWarning('pylightxl - numpy is required for this feature, it is an optional dependency '
+                          '(pip install numpy)')
+
+    return numpy
+
+
+def utility_numpy_kind(types, empty):
+    # type: (set, bool) -> Union[str, None]
+    """Returns the numpy dtype kind that holds cell values of types: 'i8' for ints, 'f8' for numbers, '?' for
+    bools and 'O' otherwise. Kinds that can not hold an empty cell without a fill value are widened
+
+    :param types: set of the cell value types (or of numpy kinds to combine)
+    :type types: set
+    :param empty: True when there are empty cells without a fill value
+    :type empty: bool
+    :return: numpy dtype kind, None for no types
+    :rtype: Union[str, None]
+    """
+
+    if not types:
+        return None
+    if types <= set([int, long, 'i8']):
+        kind = 'i8'
+    elif types <= set([int, long, float, 'i8', 'f8']):
+        kind = 'f8'
+    elif types <= set([bool, '?']):
+        kind = '?'
+    else:
+        kind = 'O'
+    if empty and kind == 'i8':
+        return 'f8'
+    if empty and kind == '?':
+        return 'O'
+
+    return kind
+
+
+def utility_numpy_fill(dtype, fill, emptycell):
+    # type: (Any, Any, Any) -> Any
+    """Returns the value of empty cells in an array of dtype, see Worksheet.to_numpy"""
+
+    if fill is not None:
+        return fill
+    if dtype.kind in 'fc':
+        return float('nan')
+    if dtype.kind in 'iub':
+        return 0
+
+    return emptycell
+
+
+def utility_numpy_tolist(np, array):
+    # type: (Any, Any) -> list
+    """Converts a numpy array to (nested) lists of python values, nan/NaT values are converted to empty cells"""
+
+    if array.dtype.kind in 'fcmM':
+        empty = np.isnat(array) if array.dtype.kind in 'mM' else np.isnan(array)
+        if empty.any():
+            array = array.astype(object)
+            array[empty] = ''
+
+    return array.tolist()
+
+
+def utility_query_filter(cells, op, value):
+    # type: (Iterable[tuple], str, Any) -> List[int]
+    """Returns the rows of (row, cell value) pairs whose value matches the condition, see Query.
+    Values that can not be compared do not match, ordering comparisons only match numbers to numbers and
+    strings to strings (python 2 would otherwise order any str above any int)
+
+    :param cells: (row, cell value) pairs
+    :type cells: Iterable[tuple]
+    :param op: comparison, see QUERY_OPS
+    :type op: str
+    :param value: value the cells are compared to
+    :type value: Any
+    :return: list of rows
+    :rtype: List[int]
+    """
+
+    compare = QUERY_OPS[op]
+    cells = list(cells)
+    if op in ['>', '>=', '<', '<=']:
+        # bool is not ordered with numbers
+        for types in [(int, long, float), (str, unicode)]:
+            if type(value) in types:
+                cells = [(row, val) for row, val in cells if type(val) in types]
+                break
+    try:
+        return [row for row, val in cells if compare(val, value)]
+    except TypeError:
+        rows = []
+        for row, val in cells:
+            try:
+                if compare(val, value):
+                    rows.append(row)
+            except TypeError:
+                pass
+        return rows
+
+
+def utility_col2num(col):
+    # type: (Union[int, str]) -> int
+    """Takes a column index or excel column letters and returns the column index
+
+    :param col: column index (starting at 1) or column letters (ex: "D")
+    :type col: Union[int, str]
+    :return: column index
+    :rtype: int
+    """
+
+    if type(col) is str or type(col) is unicode:
+        return utility_columnletter2num(col.upper())
+
+    return col
+
+
+def utility_col2nums(cols):
+    # type: (Union[int, str, List[Union[int, str]]]) -> List[int]
+    """Takes a column index/letters or a list of them and returns a list of column indexes, see utility_col2num
+
+    :param cols: column index (starting at 1) or column letters (ex: "D"), or a list of them
+    :type cols: Union[int, str, List[Union[int, str]]]
+    :return: list of column indexes
+    :rtype: List[int]
+    """
+
+    cols = [utility_col2num(col) for col in (cols if type(cols) in [list, tuple] else [cols])]
+    for col in cols:
+        utility_check_index(1, col)
+
+    return cols
+
+
+def utility_stats(values):
+    # type: (Iterable[Union[int, float, str, bool]]) -> Dict[str, Union[int, float, None]]
+    """Returns the statistics of the numeric values (ints/floats, bools are skipped) of a list of cell values
+
+    :param values: cell values
+    :type values: Iterable[Union[int, float, str, bool]]
+    :return: dict of {'count': ..., 'sum': ..., 'min': ..., 'max': ..., 'mean': ...}, min/max/mean are None
+             without numeric values
+    :rtype: Dict[str, Union[int, float, None]]
+    """
+
+    numbers = [val for val in values if type(val) is int or type(val) is float or type(val) is long]
+    if not numbers:
+        return {'count': 0, 'sum': 0, 'min': None, 'max': None, 'mean': None}
+
+    total = sum(numbers)
+    return {'count': len(numbers), 'sum': total, 'min': min(numbers), 'max': max(numbers),
+            'mean': total / float(len(numbers))}
@@ -1,6 +1,7 @@
 # standard lib imports
 from unittest import TestCase
-import os, sys
+import os, sys, io, warnings
+from datetime import date, time, datetime
 
 # 3rd party lib support
 
@@ -23,6 +24,26 @@ if 'test' in os.listdir('.'):
 DB = xl.readxl('./testbook.xlsx')
 
 
+class TempFileTestCase(TestCase):
+    # base of tests that write workbooks, temporary files are removed once the test finished (passed or not)
+
+    def temp_file(self, file_path='temporary_test_file.xlsx'):
+        if file_path in os.listdir('.'):
+            os.remove(file_path)
+        self.addCleanup(lambda: os.path.isfile(file_path) and os.remove(file_path))
+        return file_path
+
+    def write_temp(self, sheets, file_path='temporary_test_file.xlsx'):
+        # writes a new workbook of [(sheet name, nested list [row][col] of values), ...] and returns its database
+        self.temp_file(file_path)
+        db = xl.Database()
+        for ws, rows in sheets:
+            db.add_ws(ws, {})
+            db.ws(ws).update_range('A1', rows)
+        xl.writexl(db, file_path)
+        return db
+
+
 class TestReadxl_BadInput(TestCase):
 
     def test_bad_fn_type(self):
@@ -39,7 +60,7 @@ class TestReadxl_BadInput(TestCase):
         with self.assertRaises(UserWarning) as e:
             _ = xl.readxl('test_read.py')
             self.assertEqual('pylightxl - Incorrect Excel file extension ({}). '
-                             'File extension supported: .xlsx .xlsm'.format('py'), e)
+                             'File extension supported: .xlsx .xlsm .xlsb'.format('py'), e)
 
     def test_bad_readxl_sheetnames(self):
         with self.assertRaises(UserWarning) as e:
@@ -50,7 +71,13 @@ class TestReadxl_BadInput(TestCase):
         with self.assertRaises(UserWarning) as e:
             _ = xl.readxl(fn='./input.csv')
             self.assertRaises('pylightxl - Incorrect Excel file extension ({}). '
-                              'File extension supported: .xlsx .xlsm'.format('csv'), e)
+                              'File extension supported: .xlsx .xlsm .xlsb'.format('csv'), e)
+
+    def test_bad_readxl_datetimes(self):
+        with self.assertRaises(UserWarning) as e:
+            _ = xl.readxl(fn='./testbook.xlsx', datetimes='bad')
+            self.assertEqual('pylightxl - incorrect readxl(datetimes=bad) argument. '
+                             'Valid options = "str", "native"', e)
 
     def test_bad_readxl_workbook_format(self):
         msg = ('pylightxl - Ill formatted workbook.xml. '
@@ -211,6 +238,16 @@ class TestIntegration(TestCase):
                           '2021/04/10', '2021/04/10', '02:48:02', '2021/04/10 05:12:00'], DB.ws('types').keycol(11))
         self.assertEqual([11, 12.1, -1], DB.ws('types').keyrow(11))
 
+    def test_ws_types_native_datetimes(self):
+        db = xl.readxl('testbook.xlsx', ws='types', datetimes='native')
+        self.assertEqual(date(2021, 4, 10), db.ws('types').index(8, 1))
+        self.assertEqual(date(2021, 4, 10), db.ws('types').index(9, 1))
+        self.assertEqual(time(2, 48, 2), db.ws('types').index(10, 1))
+        self.assertEqual(datetime(2021, 4, 10, 5, 12), db.ws('types').index(11, 1))
+        # non-date cells are unaffected
+        self.assertEqual(11, db.ws('types').index(1, 1))
+        self.assertEqual(12.1, db.ws('types').index(1, 2))
+
     def test_ws_scatter(self):
         self.assertEqual('', DB.ws('scatter').index(1, 1))
         self.assertEqual(22, DB.ws('scatter').index(2, 2))
@@ -291,6 +328,423 @@ class TestIntegration(TestCase):
             DB = xl.readxl(f)
         
 
+class TestSharedStrings(TempFileTestCase):
+
+    def test_sharedstrings_table(self):
+        table = xl.SharedStrings()
+        self.assertEqual(0, len(table))
+        texts = ['text{}'.format(i) for i in range(2 * xl.SharedStrings.SEGMENT + 5)] + ['', ' space ']
+        for text in texts:
+            table.append(text)
+        self.assertEqual(len(texts), len(table))
+        self.assertEqual('text0', table[0])
+        self.assertEqual(texts[xl.SharedStrings.SEGMENT - 1], table[xl.SharedStrings.SEGMENT - 1])
+        self.assertEqual(texts[xl.SharedStrings.SEGMENT], table[xl.SharedStrings.SEGMENT])
+        self.assertEqual('', table[len(texts) - 2])
+        self.assertEqual(' space ', table[len(texts) - 1])
+        self.assertEqual(texts, list(table))
+        with self.assertRaises(IndexError):
+            _ = table[len(texts)]
+
+    def test_readxl_sharedstrings(self):
+        file_path = 'temporary_test_file.xlsx'
+        self.write_temp([('sh1', [['one', 'one'], [' two ']])], file_path)
+
+        table = xl.readxl_get_sharedStrings(file_path)
+        self.assertEqual(['one', ' two '], list(table))
+        self.assertEqual(['one', 'one'], xl.readxl(file_path).ws('sh1').row(1))
+
+    def test_readxl_sharedstrings_selected(self):
+        file_path = 'temporary_test_file.xlsx'
+        self.write_temp([('big', [['big{}'.format(row)] for row in range(1, 101)]),
+                         ('small', [['big50'], ['small']])], file_path)
+
+        self.assertEqual({49: 'big50', 100: 'small'}, xl.readxl_get_sharedStrings(file_path, indices=[49, 100]))
+        self.assertEqual({}, xl.readxl_get_sharedStrings(file_path, indices=[]))
+
+        db = xl.readxl(file_path, ws='small')
+        self.assertEqual(['small'], db.ws_names)
+        self.assertEqual(['big50', 'small'], db.ws('small').col(1))
+
+
+class TestReloadxl(TempFileTestCase):
+
+    def write_sheets(self, file_path, sheets):
+        # one worksheet per (name, A1 value), B1 is the same on all of them
+        self.write_temp([(ws, [[val, 1]]) for ws, val in sheets], file_path)
+
+    def test_reloadxl(self):
+        file_path = 'temporary_test_file.xlsx'
+        self.write_sheets(file_path, [('sh1', 'one'), ('sh2', 'two'), ('sh3', 'three')])
+        db = xl.readxl(file_path)
+
+        # nothing changed, all worksheets are reused
+        db_reload = xl.reloadxl(file_path, db)
+        self.assertEqual(['sh1', 'sh2', 'sh3'], db_reload.ws_names)
+        self.assertTrue(all(db_reload.ws(ws) is db.ws(ws) for ws in db.ws_names))
+
+        # sh3 changed, its new sharedString is appended - sh1/sh2 are reused
+        self.write_sheets(file_path, [('sh1', 'one'), ('sh2', 'two'), ('sh3', 'four')])
+        db_reload2 = xl.reloadxl(file_path, db_reload)
+        self.assertTrue(db_reload2.ws('sh1') is db.ws('sh1'))
+        self.assertTrue(db_reload2.ws('sh2') is db.ws('sh2'))
+        self.assertFalse(db_reload2.ws('sh3') is db.ws('sh3'))
+        self.assertEqual('four', db_reload2.ws('sh3').address('A1'))
+
+        # sh2 changed, the sharedString index used by sh3 changed meaning but sh3's xml did not
+        self.write_sheets(file_path, [('sh1', 'one'), ('sh2', 'five'), ('sh3', 'four')])
+        db_reload3 = xl.reloadxl(file_path, db_reload2)
+        self.assertTrue(db_reload3.ws('sh1') is db.ws('sh1'))
+        self.assertEqual('five', db_reload3.ws('sh2').address('A1'))
+        self.assertEqual('four', db_reload3.ws('sh3').address('A1'))
+
+    def test_reloadxl_selected(self):
+        file_path = 'temporary_test_file.xlsx'
+        self.write_sheets(file_path, [('sh1', 'one'), ('sh2', 'two')])
+        db = xl.readxl(file_path, ws='sh2')
+
+        self.write_sheets(file_path, [('sh1', 'three'), ('sh2', 'two')])
+        db_reload = xl.reloadxl(file_path, db)
+        self.assertEqual(['sh2'], db_reload.ws_names)
+        self.assertEqual('two', db_reload.ws('sh2').address('A1'))
+
+    def test_reloadxl_selected_sharedstrings(self):
+        # the selected worksheet referenced no sharedStrings, then the sharedStrings changed
+        file_path = 'temporary_test_file.xlsx'
+        self.write_temp([('nums', [[1, 2]]), ('strs', [['one']])], file_path)
+        db = xl.readxl(file_path, ws=('nums',))
+        self.write_temp([('nums', [[1, 2]]), ('strs', [['two']])], file_path)
+        db_reload = xl.reloadxl(file_path, db)
+        self.assertTrue(db_reload.ws('nums') is db.ws('nums'))
+
+        # selected worksheets with strings, sh1 is reused and only the compared strings are decoded
+        self.write_sheets(file_path, [('sh1', 'one'), ('sh2', 'two'), ('sh3', 'three')])
+        db = xl.readxl(file_path, ws=('sh1', 'sh3'))
+        self.write_sheets(file_path, [('sh1', 'one'), ('sh2', 'two'), ('sh3', 'four')])
+        db_reload = xl.reloadxl(file_path, db)
+        self.assertEqual(['sh1', 'sh3'], db_reload.ws_names)
+        self.assertTrue(db_reload.ws('sh1') is db.ws('sh1'))
+        self.assertEqual('four', db_reload.ws('sh3').address('A1'))
+        self.assertEqual([0, 2], sorted(db_reload._source['sst_crcs']))
+
+    def test_reloadxl_baddb(self):
+        with self.assertRaises(UserWarning) as e:
+            xl.reloadxl('openpyxl.xlsx', xl.Database())
+            self.assertEqual('pylightxl - reloadxl requires a database that was read in by readxl.', e)
+
+
+class TestRowIndex(TempFileTestCase):
+
+    def test_rowindex(self):
+        file_path = 'temporary_test_file.xlsx'
+        index_path = self.temp_file('temporary_test_file.json')
+        db = self.write_temp([('sh1', [[row, 'r{}'.format(row)] for row in range(1, 101)])], file_path)
+
+        rowindex = xl.readxl_rowindex(file_path, 'sh1', every=10, path=index_path)
+        self.assertEqual(100, rowindex['maxrow'])
+        self.assertEqual([1, 11, 21, 31, 41, 51, 61, 71, 81, 91], [row for row, _ in rowindex['checkpoints']])
+        self.assertTrue(index_path in os.listdir('.'))
+        self.assertEqual(rowindex, xl.readxl_rowindex(file_path, 'sh1', every=10, path=index_path))
+
+        ws = xl.readxl_rows(file_path, 'sh1', 25, 31, rowindex)
+        self.assertEqual([25, 'r25'], ws.row(25))
+        self.assertEqual([31, 'r31'], ws.row(31))
+        self.assertEqual(['', ''], ws.row(24))
+        self.assertEqual(['', ''], ws.row(32))
+        self.assertEqual(14, sum([len(cells) for cells in ws._data.values()]))
+
+        ws = xl.readxl_rows(file_path, 'sh1', 95, 200, rowindex)
+        self.assertEqual([100, 'r100'], ws.row(100))
+        self.assertEqual(12, sum([len(cells) for cells in ws._data.values()]))
+        self.assertEqual({}, xl.readxl_rows(file_path, 'sh1', 101, 200, rowindex)._data)
+
+        # the persisted index is rebuilt once the worksheet changed
+        db.ws('sh1').update_index(101, 1, 101)
+        xl.writexl(db, file_path)
+        with self.assertRaises(UserWarning) as e:
+            xl.readxl_rows(file_path, 'sh1', 1, 1, rowindex)
+            self.assertEqual('pylightxl - row index does not match worksheet (sh1), '
+                             'rebuild it with readxl_rowindex.', e)
+        rowindex = xl.readxl_rowindex(file_path, 'sh1', every=10, path=index_path)
+        self.assertEqual(101, rowindex['maxrow'])
+        self.assertEqual([101], xl.readxl_rows(file_path, 'sh1', 101, 101, rowindex).row(101))
+
+    def test_rowindex_openpyxl(self):
+        db = xl.readxl('openpyxl.xlsx', ws='Sheet')
+        rowindex = xl.readxl_rowindex('openpyxl.xlsx', 'Sheet', every=2)
+        self.assertEqual(db.ws('Sheet')._data, xl.readxl_rows('openpyxl.xlsx', 'Sheet', 1, 1000, rowindex)._data)
+
+
+class TestXlsb(TestCase):
+
+    def test_xlsb_ws_names(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            db = xl.readxl('testbook.xlsb')
+        self.assertEqual(['Sheet1', 'Sheet 2'], db.ws_names)
+
+    def test_xlsb_values(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            db = xl.readxl('testbook.xlsb')
+        ws = db.ws('Sheet1')
+        # rk, rk/100, real, whole real, short real
+        self.assertEqual([11, 12.34, 1.5, 30, -2.25], ws.row(1)[:5])
+        self.assertEqual(int, type(ws.address('D1')))
+        # sharedString, short sharedString, inline string, rich string
+        self.assertEqual(['one', u'\u00fc unicode', 'inline', 'rich'], ws.row(2)[:4])
+        # bool, short bool, error, formula error
+        self.assertEqual([True, False, '#N/A', '#DIV/0!'], ws.row(3)[:4])
+        # formula cached values, style only blank cell, blank cell with comment
+        self.assertEqual([3, 'fx', True, '', ''], ws.row(4)[:5])
+        self.assertEqual('blank note', ws.address('E4', output='c'))
+        self.assertEqual(['2021/04/10', '12:00:00', '2021/04/10 06:00:00', 3.5], ws.row(6)[:4])
+        self.assertEqual(-5, ws.address('H10'))
+        self.assertEqual('comment cell', ws.address('I10'))
+        self.assertEqual('note on I10', ws.address('I10', output='c'))
+        self.assertEqual([10, 9], ws.size)
+        self.assertEqual([['two', 'three'], [1, 2]], list(db.ws('Sheet 2').rows))
+
+    def test_xlsb_native_datetimes(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            db = xl.readxl('testbook.xlsb', datetimes='native')
+        self.assertEqual([date(2021, 4, 10), time(12, 0, 0), datetime(2021, 4, 10, 6, 0, 0)],
+                         db.ws('Sheet1').row(6)[:3])
+
+    def test_xlsb_nr(self):
+        # python 2 does not repeat a warning already shown by an earlier test
+        getattr(xl, '__warningregistry__', {}).clear()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            db = xl.readxl('testbook.xlsb')
+        self.assertEqual({'single': 'Sheet1!B2', 'area': 'Sheet 2!A1:B2'}, db.nr_names)
+        self.assertEqual([['two', 'three'], [1, 2]], db.nr('area'))
+        self.assertTrue(any('NamedRange' in str(warning.message) for warning in w))
+
+    def test_xlsb_selected_ws(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            db = xl.readxl('testbook.xlsb', ws='Sheet 2')
+        self.assertEqual(['Sheet 2'], db.ws_names)
+        self.assertEqual([['two', 'three'], [1, 2]], list(db.ws('Sheet 2').rows))
+
+
+class CountingByteSource(xl.FileByteSource):
+
+    def __init__(self, fn):
+        xl.FileByteSource.__init__(self, fn)
+        self.bytes_read = 0
+
+    def read_at(self, offset, length):
+        data = xl.FileByteSource.read_at(self, offset, length)
+        self.bytes_read += len(data)
+        return data
+
+
+class TestByteSource(TempFileTestCase):
+
+    def test_bytesourcefile(self):
+        file_path = self.temp_file('temporary_test_file.bin')
+        with open(file_path, 'wb') as f:
+            f.write(bytes(bytearray(range(256))) * 10)
+        source = CountingByteSource(file_path)
+        f = xl.ByteSourceFile(source, block_size=100, cache_blocks=2)
+        self.assertEqual(bytes(bytearray(range(0, 10))), f.read(10))
+        self.assertEqual(10, f.tell())
+        f.seek(250)
+        self.assertEqual(bytes(bytearray([250, 251, 252, 253, 254, 255, 0, 1])), f.read(8))
+        # only blocks 0 and 2 were fetched
+        self.assertEqual(200, source.bytes_read)
+        f.seek(-4, 2)
+        self.assertEqual(bytes(bytearray([252, 253, 254, 255])), f.read())
+        self.assertEqual(b'', f.read(5))
+        f.seek(2, 0)
+        f.seek(3, 1)
+        self.assertEqual(bytes(bytearray([5])), f.read(1))
+
+    def test_bytesource_notimplemented(self):
+        with self.assertRaises(NotImplementedError):
+            xl.readxl(xl.ByteSource())
+
+    def test_readxl_bytesource(self):
+        file_path = 'temporary_test_file.xlsx'
+        self.write_temp([('small', [['text']]),
+                         ('big', [[row * 1.5, 'r{}'.format(row)] for row in range(1, 5001)])], file_path)
+
+        source = CountingByteSource(file_path)
+        db_read = xl.readxl(source, ws='small')
+        self.assertEqual('text', db_read.ws('small').address('A1'))
+        # the big worksheet part is never fetched
+        self.assertTrue(source.bytes_read < os.path.getsize(file_path) / 2)
+
+        db_read = xl.readxl(CountingByteSource(file_path))
+        self.assertEqual(xl.readxl(file_path).ws('big')._data, db_read.ws('big')._data)
+
+
+class TestPipelinedReader(TempFileTestCase):
+
+    def test_pipelinedreader(self):
+        data = bytes(bytearray(range(256))) * 100
+        f = xl.PipelinedReader(io.BytesIO(data), chunk_size=1000, max_chunks=2)
+        self.assertEqual(data[:10], f.read(10))
+        self.assertEqual(data[10:2500], f.read(2490))
+        self.assertEqual(data[2500:], f.read())
+        self.assertEqual(b'', f.read(5))
+        f.close()
+
+        # closing before the part is consumed stops the background thread
+        with xl.PipelinedReader(io.BytesIO(data), chunk_size=10, max_chunks=1) as f:
+            self.assertEqual(data[:5], f.read(5))
+
+    def test_pipelinedreader_error(self):
+        class BadFile(io.BytesIO):
+            def read(self, n=-1):
+                raise ValueError('bad part')
+        with xl.PipelinedReader(BadFile()) as f:
+            with self.assertRaises(ValueError):
+                f.read()
+
+    def test_readxl_pipelined(self):
+        file_path = 'temporary_test_file.xlsx'
+        self.write_temp([('Sheet1', [[row, 'r{}'.format(row)] for row in range(1, 2001)])], file_path)
+
+        expected = xl.readxl(file_path).ws('Sheet1')._data
+        pipeline_min_size = xl.PIPELINE_MIN_SIZE
+        xl.PIPELINE_MIN_SIZE = 0
+        try:
+            db_read = xl.readxl(file_path)
+            rowindex = xl.readxl_rowindex(file_path, 'Sheet1', every=100)
+            ws = xl.readxl_rows(file_path, 'Sheet1', 1500, 1501, rowindex)
+        finally:
+            xl.PIPELINE_MIN_SIZE = pipeline_min_size
+        self.assertEqual(expected, db_read.ws('Sheet1')._data)
+        self.assertEqual([1500, 'r1500'], ws.row(1500))
+
+
+class TestColumnarWorksheet(TempFileTestCase):
+
+    def test_typedcolumn(self):
+        column = xl.TypedColumn()
+        self.assertEqual((False, None), column.get(0))
+        column.set(2, 10)
+        self.assertEqual('q', column.kind)
+        self.assertEqual((True, 10), column.get(2))
+        self.assertEqual((False, None), column.get(1))
+        # ints keep their type once the column holds floats
+        column.set(0, 1.5)
+        self.assertEqual('d', column.kind)
+        self.assertEqual([(True, 1.5), (False, None), (True, 10)], [column.get(i) for i in range(3)])
+        self.assertTrue(type(column.get(2)[1]) is int)
+        column.set(2, 2.0)
+        self.assertTrue(type(column.get(2)[1]) is float)
+        # values that do not fit the kind go to the side table
+        column.set(5, 'text')
+        self.assertEqual('d', column.kind)
+        self.assertEqual({5: 'text'}, column.others)
+        self.assertEqual([(True, 1.5), (False, None), (True, 2.0), (True, 'text')],
+                         [column.get(i) for i in [0, 1, 2, 5]])
+        column.set(5, 3)
+        self.assertEqual({}, column.others)
+        self.assertEqual((True, 3), column.get(5))
+
+        column = xl.TypedColumn()
+        for i, text in enumerate(['a', 'b', 'a', 'a']):
+            column.set(i, text)
+        self.assertEqual('s', column.kind)
+        self.assertEqual(['a', 'b'], column.strings)
+        self.assertEqual([0, 1, 0, 0], list(column.values))
+        self.assertEqual(['a', 'b', 'a', 'a'], [column.get(i)[1] for i in range(4)])
+
+        column = xl.TypedColumn()
+        column.set(0, True)
+        self.assertEqual(None, column.kind)
+        self.assertTrue(column.get(0)[1] is True)
+        # a column of mostly other types falls back to objects once
+        for i in range(1, 40):
+            column.set(i, i % 2 == 0)
+        self.assertEqual('o', column.kind)
+        column.set(40, 'text')
+        column.set(41, 1.5)
+        self.assertEqual('o', column.kind)
+        self.assertEqual([True, False, True, 'text', 1.5], [column.get(i)[1] for i in [0, 1, 2, 40, 41]])
+
+    def test_typedcolumn_int_range(self):
+        # ints past a 32 bit int array (python 2 on windows) widen the column to floats and stay int
+        array_int_max = xl.ARRAY_INT_MAX
+        xl.ARRAY_INT_MAX = 2 ** 31 - 1
+        try:
+            column = xl.TypedColumn()
+            column.set(0, 5)
+            self.assertEqual('q', column.kind)
+            column.set(1, 2 ** 40)
+            self.assertEqual('d', column.kind)
+            column.set(2, 2 ** 60)
+        finally:
+            xl.ARRAY_INT_MAX = array_int_max
+        self.assertEqual([5, 2 ** 40, 2 ** 60], [column.get(i)[1] for i in range(3)])
+        self.assertEqual([int, int, int], [type(column.get(i)[1]) for i in range(3)])
+        self.assertEqual({2: 2 ** 60}, column.others)
+
+    def test_typedcolumn_header(self):
+        # a text header over numbers keeps the column typed
+        column = xl.TypedColumn()
+        column.set(0, 'amount')
+        column.set(1, 'units')
+        for i in range(2, 5002):
+            column.set(i, i)
+        self.assertEqual('q', column.kind)
+        self.assertEqual({0: 'amount', 1: 'units'}, column.others)
+        column.set(5002, 0.5)
+        self.assertEqual('d', column.kind)
+        self.assertEqual(['amount', 'units', 2, 5001, 0.5], [column.get(i)[1] for i in [0, 1, 2, 5001, 5002]])
+        self.assertTrue(type(column.get(5001)[1]) is int)
+
+    def test_columnar_ws(self):
+        data = {'A1': {'v': 11, 'f': '', 's': '', 'c': ''}, 'B1': {'v': 'x', 'f': '', 's': '', 'c': 'note'},
+                'A3': {'v': 31.5, 'f': 'A1+1', 's': '', 'c': ''}, 'C2': {'v': True, 'f': '', 's': '', 'c': ''}}
+        db = xl.Database()
+        db.add_ws('rows', data)
+        db.add_ws('cols', data, columnar=True)
+        ws_rows, ws_cols = db.ws('rows'), db.ws('cols')
+        self.assertEqual('pylightxl.Database.ColumnarWorksheet', str(ws_cols))
+        self.assertEqual(ws_rows.size, ws_cols.size)
+        self.assertEqual(list(ws_rows.rows), list(ws_cols.rows))
+        self.assertEqual(list(ws_rows.cols), list(ws_cols.cols))
+        self.assertEqual(ws_rows.range('A1:D4'), ws_cols.range('A1:D4'))
+        self.assertEqual(ws_rows.range('A1:C3', output='f'), ws_cols.range('A1:C3', output='f'))
+        self.assertEqual('note', ws_cols.address('B1', output='c'))
+        self.assertEqual([31.5, '', ''], ws_cols.keyrow(31.5))
+
+        ws_cols.update_address('B4', '=A1')
+        ws_cols.update_index(1, 1, 'text')
+        self.assertEqual([4, 3], ws_cols.size)
+        self.assertEqual('=A1', ws_cols.address('B4', output='f'))
+        self.assertEqual(['text', '', 31.5, ''], ws_cols.col(1))
+        self.assertEqual([(1, 1, 'text'), (1, 2, 'x'), (2, 3, True), (3, 1, 31.5), (4, 2, '')],
+                         list(ws_cols._iter_cells()))
+
+    def test_columnar_readxl(self):
+        file_path = 'temporary_test_file.xlsx'
+        self.write_temp([('Sheet1', [[row, row / 4.0, 'r{}'.format(row % 3)] for row in range(1, 101)] +
+                                    [['=SUM(A1:A100)']])], file_path)
+
+        db_rows = xl.readxl(file_path)
+        db_cols = xl.readxl(file_path, columnar=True)
+        self.assertTrue(isinstance(db_cols.ws('Sheet1'), xl.ColumnarWorksheet))
+        self.assertEqual(list(db_rows.ws('Sheet1').rows), list(db_cols.ws('Sheet1').rows))
+        self.assertEqual('=SUM(A1:A100)', db_cols.ws('Sheet1').index(101, 1, output='f'))
+        self.assertTrue(isinstance(xl.reloadxl(file_path, db_cols).ws('Sheet1'), xl.ColumnarWorksheet))
+
+        # columnar worksheets write out the same
+        xl.writexl(db_cols, file_path)
+        self.assertEqual(list(db_rows.ws('Sheet1').rows), list(xl.readxl(file_path).ws('Sheet1').rows))
+
+        db = xl.readcsv(io.StringIO(u'1,2.5,a\n3,4,b\n'), columnar=True)
+        self.assertTrue(isinstance(db.ws('Sheet1'), xl.ColumnarWorksheet))
+        self.assertEqual([[1, 2.5, 'a'], [3, 4, 'b']], list(db.ws('Sheet1').rows))
+
+
 class TestDatabase(TestCase):
     db = xl.Database()
 
@@ -382,6 +836,8 @@ class TestDatabase(TestCase):
 
         self.assertEqual([[11]], db.nr(name='table1'))
         self.assertEqual([[11, 12, ''], ['', '', 23]], db.nr(name='table2'))
+        db.add_nr(name='table3', ws='sh1', address='A:B')
+        self.assertEqual([[11, 12], ['', '']], db.nr(name='table3', clip=True))
 
         db.ws('sh1').update_address('A1', '=11')
         db.ws('sh1').update_address('B1', '=12')
@@ -504,6 +960,11 @@ class TestWorksheet(TestCase):
 
         self.assertEqual([[11, 12] + ['']*(xl.MAX_XL_COLS - 2)], db.ws('sh1').range('1:1'))
         self.assertEqual([[11]] + [['']]*(xl.MAX_XL_ROWS - 1), db.ws('sh1').range('A:A'))
+        # entire row/col ranges clipped to the worksheet data
+        self.assertEqual([[11, 12, '']], db.ws('sh1').range('1:1', clip=True))
+        self.assertEqual([[11, 12, ''], ['', '', 23]], db.ws('sh1').range('1:2', clip=True))
+        self.assertEqual([[12, ''], ['', 23]], db.ws('sh1').range('B:C', clip=True))
+        self.assertEqual([[''], ['']], db.ws('sh1').range('$E:$E', clip=True))
 
         db.ws('sh1').update_address('A1', '=11')
         db.ws('sh1').update_address('B1', '=12')
@@ -662,6 +1123,17 @@ class TestConversion(TestCase):
 
         self.assertEqual([1048576, 16384], xl.utility_address2index('XFD1048576'))
 
+    def test_address_batch(self):
+        self.assertEqual([[1, 1], [2, 28], [1048576, 16384], [3, 1]],
+                         xl.utility_address2index_batch(['A1', 'AB2', 'XFD1048576', 'a3']))
+        self.assertEqual(['A1', 'AB2', 'XFD1048576'], xl.utility_index2address_batch([[1, 1], [2, 28], [1048576, 16384]]))
+        self.assertEqual([['B2', 'C2'], ['B3', 'C3']], xl.utility_range2addresses('$B$2:C3'))
+        self.assertEqual([['AA1']], xl.utility_range2addresses('AA1'))
+        with self.assertRaises(UserWarning):
+            xl.utility_address2index_batch(['A1', '1A'])
+        with self.assertRaises(UserWarning):
+            xl.utility_index2address_batch([[1, 1], [0, 1]])
+
     def test_index2address_baddata(self):
         with self.assertRaises(UserWarning) as e:
             xl.utility_index2address(row='', col=1)
@@ -715,3 +1187,22 @@ class TestConversion(TestCase):
         self.assertEqual('PZD', xl.utility_num2columnletters(11496))
         self.assertEqual('QGK', xl.utility_num2columnletters(11685))
         self.assertEqual('XFD', xl.utility_num2columnletters(16384))
+        self.assertEqual('XFE', xl.utility_num2columnletters(16385))
+
+    def test_serial_decoder(self):
+        self.assertEqual('2021/04/10', xl.utility_serial_decoder('date')('44296'))
+        self.assertEqual('02:48:02', xl.utility_serial_decoder('time')('0.1166898148148148'))
+        self.assertEqual('2021/04/10 05:12:00', xl.utility_serial_decoder('datetime')('44296.21666666667'))
+
+        self.assertEqual(date(2021, 4, 10), xl.utility_serial_decoder('date', native=True)('44296'))
+        self.assertEqual(time(2, 48, 2), xl.utility_serial_decoder('time', native=True)('0.1166898148148148'))
+        self.assertEqual(datetime(2021, 4, 10, 5, 12),
+                         xl.utility_serial_decoder('datetime', native=True)('44296.21666666667'))
+
+    def test_datetime_decoders(self):
+        styles = {0: '0', 1: '14', 2: '22', 3: '14', 4: '164'}
+        decoders = xl.readxl_get_datetime_decoders(styles, datetimes='native')
+        self.assertEqual([1, 2, 3], sorted(decoders.keys()))
+        # styles with the same date format share a decoder
+        self.assertTrue(decoders[1] is decoders[3])
+        self.assertEqual(date(2021, 4, 10), decoders[1]('44296'))
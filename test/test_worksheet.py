@@ -0,0 +1,420 @@
+# standard lib imports
+from unittest import TestCase, skipIf
+import os, sys, inspect
+
+# 3rd party lib support
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if sys.version_info[0] != 3:
+    ModuleNotFoundError = ImportError
+
+# local lib imports
+try:
+    from pylightxl import pylightxl as xl
+except ModuleNotFoundError:
+    sys.path.append('..')
+    from pylightxl import pylightxl as xl
+
+if 'test' in os.listdir('.'):
+    # running from top level
+    os.chdir('./test')
+
+
+class TestWorksheetAPI(TestCase):
+    # in-memory worksheet api: bulk writes, indexes, queries, aggregation, joins and records
+
+    def test_ws_data(self):
+        ws = xl.Worksheet({'A1': {'v': 11, 'f': '', 's': '', 'c': ''}, 'AB3': {'v': 'x', 'f': 'A1', 's': '', 'c': 'note'}})
+        # cell values are stored per row by integer index, formulas and comments in side tables
+        self.assertEqual({1: {1: 11}, 3: {28: 'x'}}, ws._data)
+        self.assertEqual({(3, 28): 'A1'}, ws._formulas)
+        self.assertEqual({(3, 28): 'note'}, ws._comments)
+        self.assertEqual([3, 28], ws.size)
+        self.assertEqual('x', ws.index(3, 28))
+        self.assertEqual('=A1', ws.address('AB3', output='f'))
+        self.assertEqual('note', ws.index(3, 28, output='c'))
+        self.assertEqual([(1, 1, 11), (3, 28, 'x')], list(ws._iter_cells()))
+        with self.assertRaises(UserWarning):
+            ws.index(0, 1)
+
+    def test_ws_comment_output(self):
+        # a stored cell without a comment returns '', a cell that is not stored returns the empty cell value
+        for ws in [xl.Worksheet(), xl.ColumnarWorksheet()]:
+            ws.update_address('A1', 1)
+            ws.set_emptycell(None)
+            self.assertEqual('', ws.address('A1', output='c'))
+            self.assertEqual(None, ws.address('B1', output='c'))
+            self.assertEqual([''], ws.row(1, output='c'))
+
+    def test_ws_sparse_rowcol(self):
+        ws = xl.Worksheet({'B2': {'v': 22, 'f': '', 's': '', 'c': ''}})
+        ws.update_index(5, 2, 52)
+        ws.update_index(2, 2, 'new')
+        ws.update_address('E1', '=B2')
+        # column to rows index of the stored cells
+        self.assertEqual([2, 5], list(ws._colrows[2]))
+        self.assertEqual([1], list(ws._colrows[5]))
+        self.assertEqual(['', 'new', '', '', 52], ws.col(2))
+        self.assertEqual(['', '=', '', '', '='], ws.col(2, output='f'))
+        self.assertEqual(['', '', '', '', '=B2'], ws.row(1, output='f'))
+        self.assertEqual(['', '', '', '', ''], ws.row(3))
+        ws.set_emptycell(0)
+        self.assertEqual([0, 52, 0, 0, 0], ws.row(5))
+        self.assertEqual([['new', 0], [0, 0]], ws.range('B2:C3'))
+
+    def test_ws_iter_rows_cols(self):
+        ws = xl.Worksheet()
+        ws.update_address('A1', 11)
+        ws.update_address('A2', 21)
+        ws.update_address('B1', '=A1')
+        ws.update_address('B3', 32)
+        rows = ws.rows
+        self.assertTrue(inspect.isgenerator(rows))
+        self.assertEqual([11, ''], next(rows))
+        self.assertEqual([[21, ''], ['', 32]], list(rows))
+        self.assertEqual([[21, ''], ['', 32]], list(ws.iter_rows(2)))
+        self.assertEqual([[21, '']], list(ws.iter_rows(2, 2)))
+        self.assertEqual([['=', '=A1']], list(ws.iter_rows(row_end=1, output='f')))
+        self.assertEqual([['', '', 32]], list(ws.iter_cols(col_start=2)))
+        self.assertEqual([[11, 21, '']], list(ws.iter_cols(col_end=1)))
+        with self.assertRaises(UserWarning):
+            ws.iter_cols(output='x')
+
+    def test_ws_build_index(self):
+        ws = xl.Worksheet()
+        for row, (name, kind, val) in enumerate([('a', 'x', 1), ('b', 'x', 2), ('a', 'y', 3), ('a', 'x', 4)], 1):
+            ws.update_index(row, 1, name)
+            ws.update_index(row, 2, kind)
+            ws.update_index(row, 3, val)
+
+        ws.build_index(keyindex=1)
+        ws.build_index(keyindex=[1, 2])
+        ws.build_index(keyindex=1, axis='col')
+        self.assertEqual({'a': [1, 3, 4], 'b': 2}, ws._indexes[('row', (1,))])
+        self.assertEqual(['b', 'x', 2], ws.keyrow('b'))
+        self.assertEqual(['a', 'y', 3], ws.keyrow(('a', 'y'), keyindex=[1, 2]))
+        self.assertEqual([], ws.keyrow(('b', 'y'), keyindex=[1, 2]))
+        self.assertEqual(['x', 'x', 'y', 'x'], ws.keycol('x', keyindex=1))
+        # composite keys also work without an index
+        self.assertEqual(['a', 'y', 3], ws.keyrow(['a', 3], keyindex=[1, 3]))
+
+        # updates to key cells mark the index stale, it is rebuilt on the next lookup
+        ws.update_index(2, 1, 'c')
+        self.assertEqual(None, ws._indexes[('row', (1,))])
+        self.assertEqual(['c', 'x', 2], ws.keyrow('c'))
+        self.assertEqual([], ws.keyrow('b'))
+        self.assertEqual({'a': [1, 3, 4], 'c': 2}, ws._indexes[('row', (1,))])
+        ws.update_index(1, 3, 10)
+        self.assertEqual({'a': [1, 3, 4], 'c': 2}, ws._indexes[('row', (1,))])
+        # empty key cells of new rows are matched as well
+        ws.update_index(5, 3, 5)
+        self.assertEqual(['', '', 5], ws.keyrow(''))
+        ws.set_emptycell(0)
+        self.assertEqual([0, 0, 5], ws.keyrow(0))
+
+        with self.assertRaises(UserWarning):
+            ws.build_index(axis='table')
+
+    def test_ws_ssd(self):
+        ws = xl.Worksheet()
+        # table wider than it is tall, keycols run to the last column
+        ws.update_index(1, 2, 'KEYCOLS')
+        ws.update_index(2, 1, 'KEYROWS')
+        for col, header in enumerate(['c1', 'c2', 'c3', 'c4'], 3):
+            ws.update_index(1, col, header)
+            ws.update_index(2, col, col)
+        ws.update_index(3, 1, 'r1')
+        ws.update_index(3, 4, 42)
+        # second table flagged with a single cell
+        ws.update_index(5, 2, 'KEYROWSKEYCOLS')
+        ws.update_index(5, 3, 'h1')
+        ws.update_index(6, 2, 'k1')
+        ws.update_index(6, 3, 'v1')
+
+        tables = ws.ssd()
+        self.assertEqual(2, len(tables))
+        self.assertEqual(['r1'], tables[0]['keyrows'])
+        self.assertEqual(['c1', 'c2', 'c3', 'c4'], tables[0]['keycols'])
+        self.assertEqual([['', 42, '', '']], tables[0]['data'])
+        self.assertEqual({'keyrows': ['k1'], 'keycols': ['h1'], 'data': [['v1']]}, tables[1])
+
+        ws.update_index(8, 8, 'KEYROWS')
+        ws.update_index(9, 8, 'k2')
+        with self.assertRaises(UserWarning):
+            ws.ssd()
+
+        # keycols without an empty cell end are bound by maxrow - keycols column, as they always were
+        ws = xl.Worksheet()
+        ws.update_range('A1', [['KEYROWSKEYCOLS', 'h1', 'h2', 'h3', 'h4'], ['r1', 1, 2, 3, 4]])
+        self.assertEqual([{'keyrows': ['r1'], 'keycols': ['h1'], 'data': [[1]]}], ws.ssd())
+
+    def test_ws_bulk_write(self):
+        for ws in [xl.Worksheet(), xl.ColumnarWorksheet()]:
+            ws.update_index(2, 2, 'old')
+            ws.update_index(3, 3, '=A1')
+            ws.update_range('B2', [[1, 2.5, '=A1+1'], (val for val in ['a', '', True])])
+            self.assertEqual([3, 4], ws.size)
+            self.assertEqual([[1, 2.5, ''], ['a', '', True]], ws.range('B2:D3'))
+            self.assertEqual('=A1+1', ws.index(2, 4, output='f'))
+            self.assertEqual('=', ws.index(3, 3, output='f'))
+
+            ws.update_range('A1:B2', [[10, 20], [30]])
+            self.assertEqual([[10, 20], [30, 1]], ws.range('A1:B2'))
+            with self.assertRaises(UserWarning):
+                ws.update_range('A1:B2', [[1, 2, 3]])
+            with self.assertRaises(UserWarning):
+                ws.update_range('A1:B2', [[1], [2], [3]])
+            ws.update_range('A5:B6', 0)
+            self.assertEqual([[0, 0], [0, 0]], ws.range('A5:B6'))
+            # rows must be lists/iterables of values, nothing is written otherwise
+            for rows in [['ab', 'cd'], [1, 2], [[1, 2], 3]]:
+                with self.assertRaises(UserWarning):
+                    ws.update_range('A1', rows)
+            with self.assertRaises(UserWarning):
+                ws.update_range('A1:B2', ['ab', 'cd'])
+            with self.assertRaises(UserWarning):
+                ws.append_rows(iter([1, 2]))
+            self.assertEqual([[10, 20], [30, 1]], ws.range('A1:B2'))
+
+            ws.append_rows([['x', 'y'], [], iter(['z'])])
+            self.assertEqual(['x', 'y', '', ''], ws.row(7))
+            self.assertEqual(['z', '', '', ''], ws.row(9))
+            self.assertEqual([9, 4], ws.size)
+
+            ws.write_column(6, range(3), row=2)
+            self.assertEqual(['', 0, 1, 2, '', '', '', '', ''], ws.col(6))
+            self.assertEqual([9, 6], ws.size)
+
+        ws = xl.Worksheet()
+        ws.update_range('A1', [['a', 1], ['b', 2]])
+        ws.build_index(keyindex=1)
+        ws.write_column(1, ['c'], row=2)
+        self.assertEqual(['c', 2], ws.keyrow('c'))
+        self.assertEqual([], ws.keyrow('b'))
+
+    def test_ws_records(self):
+        ws = xl.Worksheet()
+        ws.update_range('A1', [['name', '', 'qty', 'the price'], ['a', 'x', 1, 2.5], [], ['b', '', 2]])
+        self.assertEqual({'name': ['a', '', 'b'], 'qty': [1, '', 2], 'the price': [2.5, '', '']}, ws.to_columns())
+        self.assertEqual({'a': ['', 'b'], 'x': ['', ''], 1: ['', 2], 2.5: ['', '']}, ws.to_columns(header_row=2))
+
+        records = ws.to_records()
+        self.assertEqual(3, len(records))
+        self.assertEqual({'name': 'a', 'qty': 1, 'the price': 2.5}, records[0])
+        self.assertEqual({'name': '', 'qty': '', 'the price': ''}, records[1])
+        records = ws.iter_records(record='namedtuple')
+        self.assertFalse(isinstance(records, list))
+        record = next(records)
+        self.assertEqual(('name', 'qty', '_2'), record._fields)
+        self.assertEqual(('a', 1, 2.5), (record.name, record.qty, record._2))
+        self.assertEqual([], xl.Worksheet().to_records())
+
+        # non-ascii headers are valid field names in python 3, python 2 renames them
+        ws_unicode = xl.Worksheet()
+        ws_unicode.update_range('A1', [[u'\u00fc', 'qty'], [1, 2]])
+        record = next(ws_unicode.iter_records(record='namedtuple'))
+        self.assertEqual((u'\u00fc' if sys.version_info[0] >= 3 else '_0', 'qty'), record._fields)
+        self.assertEqual((1, 2), tuple(record))
+
+        with self.assertRaises(UserWarning):
+            ws.to_records(record='list')
+        ws.update_index(1, 5, 'qty')
+        with self.assertRaises(UserWarning):
+            ws.to_columns()
+
+    def test_ws_where(self):
+        for ws in [xl.Worksheet(), xl.ColumnarWorksheet()]:
+            ws.update_range('A1', [['id', 'status', 'amount'],
+                                   [1, 'OPEN', 500],
+                                   [2, 'OPEN', 1500],
+                                   [3, 'CLOSED', 2500],
+                                   [4, 'OPEN'],
+                                   [5, 'OPEN', 'n/a'],
+                                   [6, 'HOLD', 3000]])
+            query = ws.where('B', '==', 'OPEN')
+            self.assertEqual([2, 3, 5, 6], query.rows())
+            self.assertEqual([3], query.where('C', '>', 1000).rows())
+            self.assertEqual([2, 3, 5, 6], query.rows())
+            self.assertEqual([[2, 1500]], query.where(3, '>', 1000).select(['A', 3]))
+            self.assertEqual([[3, 'CLOSED', 2500], [6, 'HOLD', 3000]], list(ws.where('C', '>=', 2000)))
+            self.assertEqual([4, 7], ws.where('B', 'in', ['CLOSED', 'HOLD']).rows())
+            self.assertEqual(3, ws.where('B', '!=', 'OPEN').count())
+            self.assertEqual([], ws.where('D', '==', '').rows())
+            self.assertEqual([], ws.where('A', '<', 0).rows())
+            # ordering only compares numbers to numbers and strings to strings
+            self.assertEqual([1, 6], ws.where('C', '<', 'z').rows())
+            self.assertEqual([1, 2, 3, 5, 6, 7], ws.where('B', '>', 'CLOSED').rows())
+
+            # an index on the key column gives the candidate rows
+            ws.build_index(keyindex=2)
+            self.assertEqual([2, 3, 5, 6], query.rows())
+            self.assertEqual([3], ws.where('C', '>', 1000).where('B', '==', 'OPEN').rows())
+            self.assertEqual([4, 7], ws.where('B', 'in', ['CLOSED', 'HOLD']).rows())
+            ws.update_index(8, 2, 'OPEN')
+            self.assertEqual([2, 3, 5, 6, 8], query.rows())
+
+            with self.assertRaises(UserWarning):
+                ws.where('B', '~', 'OPEN')
+
+    def test_ws_stats(self):
+        for ws in [xl.Worksheet(), xl.ColumnarWorksheet()]:
+            ws.update_range('A1', [['amount', 'qty'], [10, 1], ['n/a', 2.5], [True, ''], [30, 4]])
+            self.assertEqual({'count': 2, 'sum': 40, 'min': 10, 'max': 30, 'mean': 20.0}, ws.stats('A'))
+            self.assertEqual({'count': 0, 'sum': 0, 'min': None, 'max': None, 'mean': None}, ws.stats(3))
+            self.assertTrue(1 in ws._stats)
+
+            # updates drop the cached column statistics
+            ws.update_index(6, 1, -5)
+            self.assertFalse(1 in ws._stats)
+            self.assertEqual(-5, ws.stats(1)['min'])
+            ws.append_rows([[100]])
+            self.assertEqual(135, ws.stats('A')['sum'])
+            self.assertEqual(7.5, ws.stats('B')['sum'])
+
+            self.assertEqual({'sum': 142.5, 'count': 7}, ws.agg('A:B', ['sum', 'count']))
+            self.assertEqual({'min': 1, 'max': 30, 'mean': 9.5}, ws.agg('A2:B5', ['min', 'max', 'mean']))
+            self.assertEqual({'sum': 0, 'mean': None}, ws.agg('C1:D9', ['sum', 'mean']))
+            with self.assertRaises(UserWarning):
+                ws.agg('A:A', ['median'])
+
+    def test_ws_groupby(self):
+        ws = xl.Worksheet()
+        ws.update_range('A1', [['region', 'type', 'amount', ''],
+                               ['N', 'a', 10, 1],
+                               ['S', 'a', 5, 2],
+                               ['N', 'b', 'n/a', 3],
+                               [],
+                               ['N', 'a', 2.5, 4]])
+        self.assertEqual({'N': {'sum(amount)': 12.5, 'count(amount)': 2, 'max(D)': 4},
+                          'S': {'sum(amount)': 5, 'count(amount)': 1, 'max(D)': 2}},
+                         ws.groupby('A', {'C': ['sum', 'count'], 4: 'max'}))
+        self.assertEqual({('N', 'a'): {'mean(amount)': 6.25}, ('S', 'a'): {'mean(amount)': 5.0},
+                          ('N', 'b'): {'mean(amount)': None}},
+                         ws.groupby(['A', 'B'], {'C': 'mean'}))
+        self.assertEqual({'region': {'min(C)': None}, 'N': {'min(C)': 2.5},
+                          'S': {'min(C)': 5}}, ws.groupby(1, {3: 'min'}, header_row=0))
+        self.assertEqual({'N': {}, 'S': {}}, ws.groupby('A', {}))
+
+        out = ws.groupby(['A', 'B'], {'C': ['sum', 'mean']}, output='worksheet')
+        self.assertEqual([['region', 'type', 'sum(amount)', 'mean(amount)'],
+                          ['N', 'a', 12.5, 6.25],
+                          ['S', 'a', 5, 5.0],
+                          ['N', 'b', 0, '']], list(out.rows))
+        db = xl.Database()
+        db.add_ws('totals', out)
+        self.assertTrue(db.ws('totals') is out)
+        self.assertEqual(['totals'], db.ws_names)
+        # keys that begin with "=" are values, not formulas
+        raw = xl.Worksheet()
+        raw._store_rows(1, 1, [['=key', 'amount'], ['=a', 1], ['=a', 2]], raw=True)
+        out = raw.groupby('A', {'B': 'sum'}, output='worksheet')
+        self.assertEqual([['=key', 'sum(amount)'], ['=a', 3]], list(out.rows))
+        self.assertEqual({}, out._formulas)
+
+        with self.assertRaises(UserWarning):
+            ws.groupby('A', {'C': 'median'})
+        with self.assertRaises(UserWarning):
+            ws.groupby('A', {'C': 'sum'}, output='list')
+
+    def test_ws_join(self):
+        ledger = xl.Worksheet()
+        ledger.update_range('A1', [['txn', 'acct', 'amount'],
+                                   [1, 'X1', 10],
+                                   [2, 'X2', 20],
+                                   [3, 'X9', 30],
+                                   [4, 'X1', 40],
+                                   [5, '', 50]])
+        db = xl.Database()
+        db.add_ws('master')
+        master = db.ws('master')
+        master.update_range('A1', [['acct', 'name'], ['X1', 'one'], ['X2', 'two'], ['X1', 'uno'], ['', 'none']])
+
+        ledger.vlookup(master, 'B', 'B', other_key='A')
+        self.assertEqual(['name', 'one', 'two', '', 'one', ''], ledger.col(4))
+        self.assertEqual([6, 4], ledger.size)
+        ledger.vlookup(master, 2, ['B', 'A'], other_key=1, dest='F', header_row=0)
+        # without a header row the header cells are keys as well
+        self.assertEqual([['name', 'acct'], ['one', 'X1'], ['two', 'X2'], ['', ''], ['one', 'X1'], ['', '']],
+                         ledger.range('F1:G6'))
+
+        joined = ledger.join(master, 'B', other_key='A')
+        self.assertEqual(['txn', 'acct', 'amount', 'name', '', 'name'], joined.row(1)[:6])
+        self.assertEqual([1, 1, 2, 4, 4], joined.col(1)[1:])
+        self.assertEqual(['one', 'uno', 'two', 'one', 'uno'], joined.col(joined.maxcol)[1:])
+        left = ledger.join(master, 'B', other_key='A', how='left')
+        self.assertEqual([1, 1, 2, 3, 4, 4, 5], left.col(1)[1:])
+        self.assertEqual('', left.index(5, left.maxcol))
+
+        # the smaller worksheet is hashed, results stay in the order of the left worksheet
+        master.build_index(keyindex=1)
+        small = master.join(ledger, 'A', other_key='B', how='left')
+        self.assertEqual(['X1', 'X1', 'X2', 'X1', 'X1', ''], small.col(1)[1:])
+        self.assertEqual([1, 4, 2, 1, 4, ''], small.col(3)[1:])
+        self.assertEqual(['name', 'txn'], small.row(1)[1:3])
+        db.add_ws('joined', small)
+        self.assertTrue(db.ws('joined') is small)
+
+        with self.assertRaises(UserWarning):
+            ledger.join(master, 'B', how='outer')
+        with self.assertRaises(UserWarning):
+            ledger.join(master, ['A', 'B'], other_key='A')
+
+
+@skipIf(numpy is None, 'numpy is not installed')
+class TestNumpy(TestCase):
+
+    def setUp(self):
+        self.ws = xl.Worksheet()
+        self.ws.update_range('A1', [['a', 'b', 'c'], [1, 2.5, 'x'], [3, '', True], [4, 5, False]])
+
+    def test_to_numpy(self):
+        ws = self.ws
+        arr = ws.to_numpy('A2:A4')
+        self.assertEqual(numpy.int64, arr.dtype)
+        self.assertEqual([[1], [3], [4]], arr.tolist())
+        arr = ws.to_numpy('A2:B4')
+        self.assertEqual(numpy.float64, arr.dtype)
+        self.assertEqual([1, 2.5], arr[0].tolist())
+        self.assertTrue(numpy.isnan(arr[1, 1]))
+        self.assertEqual([[1, 2.5], [3, 0], [4, 5]], ws.to_numpy('A2:B4', fill=0).tolist())
+        self.assertEqual([[2], [0], [5]], ws.to_numpy('B2:B4', dtype=int).tolist())
+        arr = ws.to_numpy()
+        self.assertEqual(object, arr.dtype)
+        self.assertEqual([3, '', True], arr[2].tolist())
+        self.assertTrue(numpy.isnan(ws.to_numpy('A5:C5')).all())
+
+        rec = ws.to_numpy('A:C', header=True)
+        self.assertEqual(('a', 'b', 'c'), rec.dtype.names)
+        self.assertEqual([1, 3, 4], rec.a.tolist())
+        self.assertEqual(numpy.int64, rec.a.dtype)
+        self.assertEqual(numpy.float64, rec.b.dtype)
+        self.assertEqual(['x', True, False], rec.c.tolist())
+        rec = ws.to_numpy('A2:B4', dtype=[('x', 'i8'), ('y', 'f8')])
+        self.assertEqual([1, 3, 4], rec.x.tolist())
+        with self.assertRaises(UserWarning):
+            ws.to_numpy('A2:B4', dtype=[('x', 'i8')])
+
+        ws_cols = xl.ColumnarWorksheet()
+        ws_cols.update_range('A1', [[1, 2.5], [3, 4]])
+        self.assertEqual([[1, 2.5], [3, 4]], ws_cols.to_numpy().tolist())
+
+    def test_from_numpy(self):
+        ws = xl.Worksheet()
+        ws.from_numpy(numpy.array([[1, numpy.nan], [3, 4]]))
+        self.assertEqual([[1, ''], [3, 4]], ws.range('A1:B2'))
+        self.assertEqual(float, type(ws.index(1, 1)))
+        ws.from_numpy(numpy.arange(3), address='C2')
+        self.assertEqual(['', 0, 1, 2], ws.col(3))
+        self.assertEqual(int, type(ws.index(2, 3)))
+
+        rec = self.ws.to_numpy(header=True)
+        ws.from_numpy(rec, address='E1')
+        self.assertEqual(self.ws.range('A1:C4'), ws.range('E1:G4'))
+        ws.from_numpy(rec, address='E6', header=False)
+        self.assertEqual([1, 2.5, 'x'], ws.row(6)[4:])
+
+        with self.assertRaises(UserWarning):
+            ws.from_numpy(numpy.zeros((2, 2, 2)))
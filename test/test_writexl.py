@@ -127,9 +127,11 @@ class TestWritexlNew(TestCase):
                    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\r\n' \
                    '{many_tag_sheets}\r\n' \
                    '{tag_sharedStrings}\r\n' \
+                   '{tag_styles}\r\n' \
                    '</Relationships>'
         xml_tag_sheet = '<Relationship Target="worksheets/sheet{sheet_num}.xml" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Id="rId{sheet_num}"/>\r\n'
         tag_sharedStrings = '<Relationship Target="sharedStrings.xml" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Id="rId11"/>\r\n'
+        tag_styles = '<Relationship Target="styles.xml" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Id="rId12"/>\r\n'
 
         many_tag_sheets = xml_tag_sheet.format(sheet_num=1) + \
                           xml_tag_sheet.format(sheet_num=2) + \
@@ -154,10 +156,10 @@ class TestWritexlNew(TestCase):
         db.add_ws('Sheet9',{})
         db.add_ws('Sheet10',{})
         # test without sharedStrings
-        self.assertEqual(xl.writexl_new_workbookrels_text(db), xml_base.format(many_tag_sheets=many_tag_sheets, tag_sharedStrings=''))
+        self.assertEqual(xl.writexl_new_workbookrels_text(db), xml_base.format(many_tag_sheets=many_tag_sheets, tag_sharedStrings='', tag_styles=tag_styles))
         # test with sharedStrings in db
         db._sharedStrings = ['text']
-        self.assertEqual(xl.writexl_new_workbookrels_text(db), xml_base.format(many_tag_sheets=many_tag_sheets, tag_sharedStrings=tag_sharedStrings))
+        self.assertEqual(xl.writexl_new_workbookrels_text(db), xml_base.format(many_tag_sheets=many_tag_sheets, tag_sharedStrings=tag_sharedStrings, tag_styles=tag_styles))
 
     def test_workbook_text(self):
         xml_base = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n' \
@@ -296,6 +298,7 @@ class TestWritexlNew(TestCase):
                    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\r\n' \
                    '<Default Extension="xml" ContentType="application/xml"/>\r\n' \
                    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>\r\n' \
+                   '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>\r\n' \
                    '{many_tag_sheets}\r\n' \
                    '{tag_sharedStrings}\r\n' \
                    '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>\r\n' \
@@ -336,6 +339,34 @@ class TestWritexlNew(TestCase):
         db._sharedStrings = ['text']
         self.assertEqual(xl.writexl_new_content_types_text(db), xml_base.format(many_tag_sheets=many_tag_sheets, tag_sharedStrings=xml_tag_sharedStrings))
 
+    def test_datetime_roundtrip(self):
+        # date/time cells are written as serial values with a date/time style
+        from datetime import datetime, date, time
+        db = xl.Database()
+        db.add_ws('Sheet1')
+        db.ws('Sheet1').update_range('A1', [[datetime(2021, 4, 10, 5, 12, 30), date(2021, 4, 10), time(2, 48, 2), 1.5]])
+        text = xl.writexl_new_worksheet_text(db, 'Sheet1')
+        self.assertIn('<c r="A1" s="1"><v>44296.21701388889</v></c>', text)
+        self.assertIn('<c r="B1" s="2"><v>44296</v></c>', text)
+        self.assertIn('<c r="C1" s="3"><v>', text)
+
+        if 'temporary_datetimes.xlsx' in os.listdir('.'):
+            os.remove('temporary_datetimes.xlsx')
+        self.addCleanup(os.remove, 'temporary_datetimes.xlsx')
+        xl.writexl(db, 'temporary_datetimes.xlsx')
+        db = xl.readxl('temporary_datetimes.xlsx', datetimes='native')
+        self.assertEqual([[datetime(2021, 4, 10, 5, 12, 30), date(2021, 4, 10), time(2, 48, 2), 1.5]],
+                         list(db.ws('Sheet1').rows))
+        db = xl.readxl('temporary_datetimes.xlsx')
+        self.assertEqual([['2021/04/10 05:12:30', '2021/04/10', '02:48:02', 1.5]], list(db.ws('Sheet1').rows))
+
+        # rewriting an existing file keeps the date/time styles
+        xl.writexl(db, 'temporary_datetimes.xlsx')
+        db.ws('Sheet1').update_address('D1', date(2000, 1, 1))
+        xl.writexl(db, 'temporary_datetimes.xlsx')
+        db = xl.readxl('temporary_datetimes.xlsx', datetimes='native')
+        self.assertEqual(date(2000, 1, 1), db.ws('Sheet1').address('D1'))
+
     def test_openpyxl(self):
         # test that pylightxl is able to write to a openpyxl output excel file (docProps/app.xml) is different than expected
         db = xl.readxl('openpyxl.xlsx')
@@ -407,6 +438,36 @@ class TestWritexlExisting(TestCase):
 
         self.assertEqual(correct_sheetref, sheetref)
 
+    def test_writexl_alt_styles(self):
+        # rewriting a styled workbook appends the date/time styles and keeps the existing styles
+        import zipfile
+        from datetime import date
+        file_path = 'temporary_styles.xlsx'
+        shutil.copy('merged_cells.xlsx', file_path)
+        self.addCleanup(os.remove, file_path)
+        with zipfile.ZipFile(file_path) as f:
+            old_styles = f.read('xl/styles.xml').decode('utf-8')
+
+        db = xl.readxl(file_path)
+        db.ws(db.ws_names[0]).update_address('A1', date(2021, 4, 10))
+        xl.writexl(db, file_path)
+        with zipfile.ZipFile(file_path) as f:
+            styles = f.read('xl/styles.xml').decode('utf-8')
+
+        self.assertIn('<alignment horizontal="center"/></xf>', styles)
+        self.assertIn('<fonts count="1" x14ac:knownFonts="1">', styles)
+        self.assertEqual(old_styles.split('</cellXfs>')[1], styles.split('</cellXfs>')[1])
+        self.assertIn('<cellXfs count="5">', styles)
+        self.assertEqual({0: '0', 1: '0', 2: '22', 3: '14', 4: '21'}, xl.readxl_get_styles(file_path))
+        db = xl.readxl(file_path, datetimes='native')
+        self.assertEqual(date(2021, 4, 10), db.ws(db.ws_names[0]).address('A1'))
+
+        # a second rewrite reuses the date/time styles
+        xl.writexl(db, file_path)
+        self.assertEqual({0: '0', 1: '0', 2: '22', 3: '14', 4: '21'}, xl.readxl_get_styles(file_path))
+        text, datetime_styles = xl.writexl_alt_styles_text(db, 'nonexistent_styles.xml')
+        self.assertEqual(xl.WRITEXL_DATETIME_STYLES, datetime_styles)
+
     def test_integration_alt_writer(self):
         db = xl.Database()
 
@@ -453,16 +514,16 @@ class TestWritexlExisting(TestCase):
         self.assertEqual(1, db_alt.ws('sh1').address('A2'))
         self.assertEqual(1.0, db_alt.ws('sh1').address('A3'))
         self.assertEqual('', db_alt.ws('sh1').address('A4'))
-        self.assertEqual('A1', db_alt.ws('sh1')._data['A4']['f'])
+        self.assertEqual('A1', db_alt.ws('sh1')._formulas[(4, 1)])
         self.assertEqual('', db_alt.ws('sh1').address('A5'))
-        self.assertEqual('A2+5', db_alt.ws('sh1')._data['A5']['f'])
+        self.assertEqual('A2+5', db_alt.ws('sh1')._formulas[(5, 1)])
         self.assertEqual('two', db_alt.ws('sh1').address('B1'))
         self.assertEqual(2, db_alt.ws('sh1').address('B2'))
         self.assertEqual(2.0, db_alt.ws('sh1').address('B3'))
         self.assertEqual('A1&amp;"_"&amp;"two"', db_alt.ws('sh1').address('B4'))
-        self.assertEqual('', db_alt.ws('sh1')._data['B4']['f'])
+        self.assertEqual('', db_alt.ws('sh1')._formulas.get((4, 2), ''))
         self.assertEqual('', db_alt.ws('sh1').address('B5'))
-        self.assertEqual('A2+10', db_alt.ws('sh1')._data['B5']['f'])
+        self.assertEqual('A2+10', db_alt.ws('sh1')._formulas[(5, 2)])
         self.assertEqual('new', db_alt.ws('sh1').address('C6'))
 
         self.assertEqual([0, 0], db_alt.ws('sh2').size)
@@ -476,6 +537,90 @@ class TestWritexlExisting(TestCase):
             os.remove('temp_wb.xlsx')
 
 
+class TestWritexlXlsb(TestCase):
+
+    def test_biff12_record(self):
+        self.assertEqual(b'\x00\x00', xl.utility_biff12_record(0))
+        self.assertEqual(b'\x91\x01\x00', xl.utility_biff12_record(145))
+        self.assertEqual(b'\x13\x80\x01' + b'\x00' * 128, xl.utility_biff12_record(19, b'\x00' * 128))
+        self.assertEqual(b'\x02\x00\x00\x00a\x00b\x00', xl.utility_biff12_pack_string('ab'))
+
+    def test_sharedStrings_bin(self):
+        rv = xl.writexl_xlsb_sharedStrings_bin({'text2': 1, 'text1': 0})
+        records = list(xl.utility_biff12_records(io.BytesIO(rv)))
+        self.assertEqual([159, 19, 19, 160], [rec_id for rec_id, _ in records])
+        self.assertEqual(['text1', 'text2'], [xl.utility_biff12_string(rec, 1)[0] for _, rec in records[1:3]])
+
+    def test_worksheet_bin(self):
+        db = xl.Database()
+        db.add_ws('Sheet1', {'A1': {'v': 'text1', 'f': '', 's': ''},
+                             'B1': {'v': 1, 'f': '', 's': ''},
+                             'A3': {'v': 1.5, 'f': '', 's': ''},
+                             'B3': {'v': True, 'f': '', 's': ''},
+                             'C3': {'v': 2 ** 40, 'f': '', 's': ''},
+                             'D3': {'v': '', 'f': 'A1', 's': ''},
+                             })
+        sharedStrings = {}
+        rv, formulas = xl.writexl_xlsb_worksheet_bin(db, 'Sheet1', sharedStrings)
+        self.assertEqual({'text1': 0}, sharedStrings)
+        self.assertTrue(formulas)
+        # sheet, dimension, sheetData, row 1, isst, rk, row 3, real, bool, real, /sheetData, /sheet
+        self.assertEqual([129, 148, 145, 0, 7, 2, 0, 5, 4, 5, 146, 130],
+                         [rec_id for rec_id, _ in xl.utility_biff12_records(io.BytesIO(rv))])
+
+    def test_writexl_xlsb(self):
+        file_path = 'temporary_test_file.xlsb'
+        if file_path in os.listdir('.'):
+            os.remove(file_path)
+
+        db = xl.Database()
+        db.add_ws('Sheet1', {})
+        db.add_ws('Sheet 2', {})
+        db.ws('Sheet1').update_address('A1', 'text')
+        db.ws('Sheet1').update_address('B1', 11)
+        db.ws('Sheet1').update_address('A2', -2.5)
+        db.ws('Sheet1').update_address('B2', False)
+        db.ws('Sheet1').update_address('C10', 2 ** 40)
+        db.ws('Sheet 2').update_address('B2', 'text')
+        db.add_nr('range', 'Sheet1', 'A1:B2')
+        db.add_nr('cell', 'Sheet 2', 'B2')
+        xl.writexl(db, file_path)
+
+        db_read = xl.readxl(file_path)
+        self.assertEqual(['Sheet1', 'Sheet 2'], db_read.ws_names)
+        self.assertEqual({'range': 'Sheet1!A1:B2', 'cell': 'Sheet 2!B2'}, db_read.nr_names)
+        self.assertEqual([['text', 11], [-2.5, False]], db_read.nr('range'))
+        self.assertEqual(2 ** 40, db_read.ws('Sheet1').address('C10'))
+        self.assertEqual([10, 3], db_read.ws('Sheet1').size)
+        self.assertEqual([['text']], db_read.nr('cell'))
+
+        # existing xlsb files are replaced
+        db.ws('Sheet1').update_address('A1', 'new text')
+        xl.writexl(db, file_path)
+        self.assertEqual('new text', xl.readxl(file_path).ws('Sheet1').address('A1'))
+
+        os.remove(file_path)
+
+    def test_writexl_xlsb_datetimes(self):
+        # date/time cells are written as serial values with a date/time style of xl/styles.bin
+        from datetime import datetime, date, time
+        file_path = 'temporary_datetimes.xlsb'
+        if file_path in os.listdir('.'):
+            os.remove(file_path)
+        self.addCleanup(os.remove, file_path)
+        db = xl.Database()
+        db.add_ws('Sheet1')
+        values = [datetime(2021, 4, 10, 5, 12, 30), date(2020, 1, 2), time(2, 48, 2), 1.5, 2 ** 40]
+        db.ws('Sheet1').update_range('A1', [values])
+        xl.writexl(db, file_path)
+
+        self.assertEqual({0: '0', 1: '22', 2: '14', 3: '21'}, xl.readxl_get_styles(file_path))
+        db_read = xl.readxl(file_path, datetimes='native')
+        self.assertEqual([values], list(db_read.ws('Sheet1').rows))
+        db_read = xl.readxl(file_path)
+        self.assertEqual(['2021/04/10 05:12:30', '2020/01/02', '02:48:02'], db_read.ws('Sheet1').row(1)[:3])
+
+
 class TestWriteCSV(TestCase):
 
     def test_writecsv(self):